@@ -0,0 +1,4 @@
+"""Benchmarks of the HardPy storage hot paths.
+
+Every module is run as a script, i.e. `python -m benchmarks.key_path`.
+"""
@@ -0,0 +1,94 @@
+"""Micro-benchmark of the JSON codecs on a runstore-like document.
+
+Reports the encoding, compact encoding and decoding time of every
+installed codec and the encoded document size.
+
+Usage:
+    python -m benchmarks.json_codec
+"""
+
+import argparse
+import logging
+import timeit
+
+from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.json_codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibCodec,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_doc() -> dict:
+    """Create the document with measurements and charts.
+
+    Returns:
+        dict: runstore-like document
+    """
+    chart = {
+        "type": "line",
+        "x_data": [i * 0.001 for i in range(10_000)],
+        "y_data": [float(i % 100) for i in range(10_000)],
+    }
+    cases = {
+        f"test_{i}": {
+            DF.STATUS: "passed",
+            DF.ATTEMPT: 1,
+            DF.MEASUREMENTS: [
+                {"name": f"voltage_{j}", "value": j * 0.5, "unit": "V"}
+                for j in range(50)
+            ],
+            DF.CHART: chart if i % 10 == 0 else None,
+        }
+        for i in range(200)
+    }
+    return {DF.STATUS: "passed", DF.MODULES: {"test_module": {DF.CASES: cases}}}
+
+
+def report(name: str, codec: JsonCodec, doc: dict, number: int) -> None:
+    """Log the encoding and decoding time of the codec.
+
+    Args:
+        name (str): codec name
+        codec (JsonCodec): codec
+        doc (dict): document to encode
+        number (int): number of runs
+    """
+    data = codec.dumps(doc)
+    dumps = timeit.timeit(lambda: codec.dumps(doc), number=number) / number
+    compact = (
+        timeit.timeit(lambda: codec.dumps(doc, compact=True), number=number) / number
+    )
+    loads = timeit.timeit(lambda: codec.loads(data), number=number) / number
+    logger.info(
+        f"{name:<10} dumps {dumps * 1e3:8.2f} ms"
+        f"  compact {compact * 1e3:8.2f} ms"
+        f"  loads {loads * 1e3:8.2f} ms"
+        f"  size {len(data) / 1e6:6.2f} MB",
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    doc = create_doc()
+    report("stdlib", StdlibCodec(), doc, args.number)
+    report("compact", StdlibCodec(indent=None), doc, args.number)
+    for name, codec_class in (("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)):
+        try:
+            codec = codec_class()
+        except ImportError:
+            logger.info(f"{name:<10} is not installed")
+            continue
+        report(name, codec, doc, args.number)
+
+
+if __name__ == "__main__":
+    main()
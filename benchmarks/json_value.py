@@ -0,0 +1,84 @@
+"""Micro-benchmark of the value conversion on the store document update.
+
+Compares the type-directed conversion with the json.dumps probing.
+
+Usage:
+    python -m benchmarks.json_value
+"""
+
+import argparse
+import json
+import logging
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from hardpy.pytest_hardpy.db.json_value import to_json_value
+
+logger = logging.getLogger(__name__)
+
+
+def probe(value: object) -> object:
+    """Convert the value by probing it with json.dumps.
+
+    Args:
+        value (object): value to convert
+
+    Returns:
+        object: JSON-serializable value
+    """
+    try:
+        json.dumps(value)
+    except Exception:  # noqa: BLE001
+        return json.dumps(value, default=str)
+    return value
+
+
+def report(
+    name: str,
+    func: Callable[[object], object],
+    value: object,
+    number: int,
+) -> None:
+    """Log the time of one conversion.
+
+    Args:
+        name (str): benchmark name
+        func (Callable[[object], object]): conversion function
+        value (object): value to convert
+        number (int): number of runs
+    """
+    seconds = timeit.timeit(lambda: func(value), number=number)
+    logger.info(f"{name:<32} {seconds / number * 1e3:8.3f} ms/op")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    number = args.number
+    chart = {
+        "type": "line",
+        "x_data": [i * 0.001 for i in range(args.points)],
+        "y_data": [float(i % 100) for i in range(args.points)],
+    }
+    samples = {f"sample_{i}": {"name": "voltage", "value": i} for i in range(10_000)}
+    artifact = {
+        f"sample_{i}": {"time": datetime.now(tz=timezone.utc), "value": i}
+        for i in range(10_000)
+    }
+
+    report("dumps probe, chart", probe, chart, number)
+    report("to_json_value, chart", to_json_value, chart, number)
+    report("dumps probe, samples", probe, samples, number)
+    report("to_json_value, samples", to_json_value, samples, number)
+    report("dumps probe, artifact", probe, artifact, number)
+    report("to_json_value, artifact", to_json_value, artifact, number)
+
+
+if __name__ == "__main__":
+    main()
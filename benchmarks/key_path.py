@@ -0,0 +1,91 @@
+"""Micro-benchmark of the store document key path access.
+
+Compares the cached key path accessors with glom, if glom is installed.
+
+Usage:
+    python -m benchmarks.key_path
+"""
+
+import argparse
+import logging
+import timeit
+
+from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.key_path import get_value, set_value
+
+logger = logging.getLogger(__name__)
+
+
+def create_doc() -> dict:
+    """Create the document with the test cases of one module.
+
+    Returns:
+        dict: runstore-like document
+    """
+    cases = {
+        f"test_{i}": {DF.STATUS: "ready", DF.MEASUREMENTS: [], DF.ATTEMPT: 0}
+        for i in range(20)
+    }
+    return {DF.STATUS: "ready", DF.MODULES: {"test_module": {DF.CASES: cases}}}
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    """Log the time of one operation.
+
+    Args:
+        name (str): operation name
+        seconds (float): time of all runs in seconds
+        number (int): number of runs
+    """
+    logger.info(f"{name:<24} {seconds / number * 1e9:8.0f} ns/op")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    number = args.number
+    doc = create_doc()
+    key = f"{DF.MODULES.value}.test_module.{DF.CASES.value}.test_7.{DF.STATUS.value}"
+    new_key = f"{DF.MODULES.value}.test_module.{DF.CASES.value}.test_7.new.x"
+
+    report(
+        "key_path get",
+        timeit.timeit(lambda: get_value(doc, key), number=number),
+        number,
+    )
+    report(
+        "key_path set",
+        timeit.timeit(lambda: set_value(doc, key, "run"), number=number),
+        number,
+    )
+    report(
+        "key_path set missing",
+        timeit.timeit(lambda: set_value(doc, new_key, 1), number=number),
+        number,
+    )
+
+    try:
+        from glom import assign, glom
+    except ImportError:
+        logger.info("glom is not installed, skip the comparison")
+        return
+
+    report("glom get", timeit.timeit(lambda: glom(doc, key), number=number), number)
+    report(
+        "glom assign",
+        timeit.timeit(lambda: assign(doc, key, "run"), number=number),
+        number,
+    )
+    report(
+        "glom assign missing",
+        timeit.timeit(lambda: assign(doc, new_key, 1, missing=dict), number=number),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,12 @@ from hardpy.pytest_hardpy.db import (
 from hardpy.pytest_hardpy.pytest_call import (
     ErrorCode,
     PassFailDialog,
+    batch,
     clear_operator_message,
+    get_artifact,
     get_current_attempt,
     get_current_report,
+    get_current_report_view,
     get_hardpy_config,
     run_dialog_box,
     set_batch_serial_number,
@@ -108,9 +111,12 @@ __all__ = [
     "SubUnit",
     "TestStandNumberError",
     "TextInputWidget",
+    "batch",
     "clear_operator_message",
+    "get_artifact",
     "get_current_attempt",
     "get_current_report",
+    "get_current_report_view",
     "get_hardpy_config",
     "run_dialog_box",
     "set_batch_serial_number",
@@ -126,7 +126,8 @@ def init(  # noqa: PLR0913
         sc_connection_only (bool): Flag to check StandCloud service availability
         sc_autosync (bool): Flag to enable StandCloud auto syncronization
         sc_api_key (str | None): StandCloud API key
-        storage_type (str): Storage type, "json" or "couchdb", "couchdb" by default
+        storage_type (str): Storage type, "json", "couchdb" or "sqlite",
+            "couchdb" by default
     """
     dir_path = Path(Path.cwd() / tests_dir if tests_dir else "tests")
     config_manager = ConfigManager()
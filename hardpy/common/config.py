@@ -2,6 +2,7 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+import re
 from enum import Enum
 from logging import getLogger
 from pathlib import Path
@@ -21,10 +22,28 @@ class StorageType(str, Enum):
     Attributes:
         JSON: JSON file-based storage on local filesystem
         COUCHDB: CouchDB database storage
+        SQLITE: SQLite database storage on local filesystem
     """
 
     JSON = "json"
     COUCHDB = "couchdb"
+    SQLITE = "sqlite"
+
+
+class JsonCodecType(str, Enum):
+    """JSON codec types of the local storage files and reports.
+
+    Attributes:
+        STDLIB: standard library codec, indented documents
+        COMPACT: standard library codec, compact documents
+        ORJSON: orjson codec, compact documents
+        MSGSPEC: msgspec codec, compact documents
+    """
+
+    STDLIB = "stdlib"
+    COMPACT = "compact"
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
 
 
 class DatabaseConfig(BaseModel):
@@ -39,8 +58,40 @@ class DatabaseConfig(BaseModel):
     port: int = 5984
     doc_id: str = Field(exclude=True, default="")
     url: str = Field(exclude=True, default="")
-    # This field is relevant only when storage_type is "json"
+    # This field is relevant only when storage_type is "json" or "sqlite"
     storage_path: str = Field(exclude=True, default=".hardpy")
+    # Write-behind flush interval in milliseconds, 0 writes on every update
+    flush_interval: int = Field(exclude=True, default=0, ge=0)
+    # JSON codec of the storage files, rows and reports
+    json_codec: JsonCodecType = Field(exclude=True, default=JsonCodecType.STDLIB)
+    # These fields are relevant only when storage_type is "json"
+    journal: bool = Field(exclude=True, default=False)
+    journal_fsync: bool = Field(exclude=True, default=False)
+    # Host the statestore in the operator panel process memory
+    memory_statestore: bool = Field(exclude=True, default=False)
+    # These fields are relevant only when storage_type is "couchdb"
+    couchdb_sharding: bool = Field(exclude=True, default=False)
+    pool_size: int = Field(exclude=True, default=10, ge=1)
+    keep_alive: bool = Field(exclude=True, default=True)
+    # CouchDB request timeout in seconds, 0 waits without a timeout
+    request_timeout: float = Field(exclude=True, default=0, ge=0)
+    # Revision limit of the runstore and statestore, 0 keeps the CouchDB default
+    revs_limit: int = Field(exclude=True, default=0, ge=0)
+    # Compact when the database file exceeds the active data size by the ratio
+    compaction_ratio: float = Field(exclude=True, default=2.0, ge=1)
+    # Compaction check interval of the operator panel between the runs in seconds,
+    # 0 disables the panel checks, the pytest process checks at the end of every run
+    compaction_interval: int = Field(exclude=True, default=60, ge=0)
+    # Artifact values larger than the limit in bytes and binary values are stored
+    # outside the runstore document, 0 stores all values in the document
+    artifact_size_limit: int = Field(exclude=True, default=0, ge=0)
+    # Store the images and html of dialog boxes in the operator panel asset cache
+    asset_store: bool = Field(exclude=True, default=False)
+    # Maximum displayed size of the dialog box images in pixels,
+    # larger images are downscaled, 0 keeps the original images
+    image_max_size: int = Field(exclude=True, default=0, ge=0)
+    # Use own runstore, statestore and tempstore databases for every stand
+    stand_databases: bool = Field(exclude=True, default=False)
 
     def model_post_init(self, __context) -> None:  # noqa: ANN001,PYI063
         """Get database connection url."""
@@ -56,6 +107,23 @@ class DatabaseConfig(BaseModel):
         uri = f"{self.host}:{self.port!s}"
         return f"http://{credentials}@{uri}/"
 
+    def get_database_name(self, store: str) -> str:
+        """Get CouchDB database name of the store.
+
+        Args:
+            store (str): store name, i.e. "runstore"
+
+        Returns:
+            str: store name, or the store name with the stand document ID
+                if every stand uses own databases
+        """
+        if not self.stand_databases:
+            return store
+        # CouchDB database names contain only lowercase letters, digits
+        # and _$()+-/ characters, the slash is replaced to keep the URL path
+        stand = re.sub(r"[^a-z0-9_$()+\-]", "_", self.doc_id.lower())
+        return f"{store}_{stand}"
+
 
 class FrontendConfig(BaseModel):
     """Frontend configuration."""
@@ -4,25 +4,45 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import copy
+import hashlib
 import json
 import logging
 import os
 import re
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from http import HTTPStatus
 from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Annotated, Any, Final
 from urllib.parse import unquote
 
-from fastapi import FastAPI, Query, Request
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 
 from hardpy.common.config import ConfigManager, StorageType
+from hardpy.hardpy_panel.compression import (
+    ApiCompressionMiddleware,
+    PrecompressedStaticFiles,
+)
+from hardpy.hardpy_panel.statestore_events import StateStoreEvents
+from hardpy.pytest_hardpy.db.asset_store import AssetStore
+from hardpy.pytest_hardpy.db.couchdb_maintenance import compact_store_databases
+from hardpy.pytest_hardpy.db.journal import JsonJournal
+from hardpy.pytest_hardpy.db.json_codec import get_codec
+from hardpy.pytest_hardpy.db.memory_statestore import StateStoreServer
+from hardpy.pytest_hardpy.db.sqlite_storage import (
+    SqliteDocument,
+    connect,
+    get_database_path,
+)
 from hardpy.pytest_hardpy.pytest_wrapper import PyTestWrapper
 from hardpy.pytest_hardpy.result.report_synchronizer import StandCloudSynchronizer
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Hashable
 
 # TODO (xorialexandrov): Move logging to own module
 logging.basicConfig(
@@ -31,6 +51,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# seconds between the checks of the local storage file status, the interval
+# is doubled after every check up to the maximum while nothing changes
+_STORAGE_POLL_INTERVAL = 0.02
+_STORAGE_POLL_MAX_INTERVAL = 0.25
+
 
 @contextlib.asynccontextmanager
 async def lifespan_sync_scheduler(app: FastAPI) -> AsyncGenerator[Any, Any]:
@@ -42,6 +67,14 @@ async def lifespan_sync_scheduler(app: FastAPI) -> AsyncGenerator[Any, Any]:
         autosync_timeout = config_manager.config.stand_cloud.autosync_timeout
         app.state.sync_task = asyncio.create_task(sync_stand_cloud(autosync_timeout))
 
+    # Start CouchDB compaction if the panel compacts the databases
+    database_config = config_manager.config.database
+    compaction_interval = database_config.compaction_interval
+    if database_config.storage_type == StorageType.COUCHDB and compaction_interval:
+        app.state.compaction_task = asyncio.create_task(
+            compact_couchdb(compaction_interval),
+        )
+
     yield
 
     # Cleanup on shutdown
@@ -50,18 +83,41 @@ async def lifespan_sync_scheduler(app: FastAPI) -> AsyncGenerator[Any, Any]:
         await asyncio.gather(app.state.sync_task, return_exceptions=True)
         logger.info("Cancelled StandCloud synchronization task.")
 
+    if hasattr(app.state, "compaction_task"):
+        app.state.compaction_task.cancel()
+        await asyncio.gather(app.state.compaction_task, return_exceptions=True)
+        logger.info("Cancelled CouchDB compaction task.")
+
     if hasattr(app.state, "executor"):
         app.state.executor.shutdown(wait=False)
         logger.info("Shut down ThreadPoolExecutor.")
 
+    app.state.pytest_wrp.close()
+
+    if app.state.statestore_server is not None:
+        app.state.statestore_server.stop()
+
 
 # Initialize application state
 app = FastAPI(lifespan=lifespan_sync_scheduler)
+app.add_middleware(ApiCompressionMiddleware)
+app.state.statestore_server = None
+if ConfigManager().config.database.memory_statestore:
+    # must be running before the statestore is created
+    app.state.statestore_server = StateStoreServer()
+    app.state.statestore_server.start()
 app.state.pytest_wrp = PyTestWrapper()
 app.state.sc_synchronizer = StandCloudSynchronizer()
 app.state.executor = ThreadPoolExecutor(max_workers=1)
 app.state.manual_collect_mode = False
 app.state.selected_tests = []
+app.state.storage_lock = Lock()
+app.state.storage_doc = None
+app.state.journal = None
+app.state.sqlite_document = None
+app.state.statestore_events = None
+app.state.json_data_lock = Lock()
+app.state.json_data_cache = None
 
 
 class Status(str, Enum):
@@ -101,6 +157,28 @@ async def sync_stand_cloud(sc_sync_interval_minutes: int) -> None:
         await asyncio.sleep(sc_sync_interval)
 
 
+async def compact_couchdb(compaction_interval: int) -> None:
+    """Periodically compacts the grown store databases between test runs."""
+    loop = asyncio.get_event_loop()
+
+    while True:
+        try:
+            await asyncio.sleep(compaction_interval)
+            if app.state.pytest_wrp.is_running():
+                continue
+            compacted = await loop.run_in_executor(
+                app.state.executor,
+                compact_store_databases,
+            )
+            if compacted:
+                logger.info(f"Started compaction of databases: {compacted}")
+        except asyncio.CancelledError:
+            logger.info("CouchDB compaction task cancelled.")
+            break
+        except Exception as exc:  # noqa: BLE001
+            logger.info(f"Error during CouchDB compaction. {exc}")
+
+
 @app.get("/api/hardpy_config")
 def hardpy_config() -> dict:
     """Get config of HardPy.
@@ -202,15 +280,16 @@ def status() -> dict:
 
 @app.get("/api/couch")
 def couch_connection() -> dict:
-    """Get couchdb connection string.
+    """Get couchdb connection string and statestore database name.
 
     Returns:
-        dict[str, str]: couchdb connection string
+        dict[str, str]: couchdb connection string and statestore database name
     """
     config_manager = ConfigManager()
 
     return {
         "connection_str": config_manager.config.database.url,
+        "statestore": config_manager.config.database.get_database_name("statestore"),
     }
 
 
@@ -366,45 +445,94 @@ def get_storage_type() -> dict:
     """Get the configured storage type.
 
     Returns:
-        dict[str, str]: storage type ("json" or "couchdb")
+        dict[str, str | bool]: storage type ("json", "couchdb" or "sqlite")
+            and the in-memory statestore flag
     """
     config_manager = ConfigManager()
-    return {"storage_type": config_manager.config.database.storage_type}
+    return {
+        "storage_type": config_manager.config.database.storage_type,
+        "memory_statestore": app.state.statestore_server is not None,
+    }
 
 
 @app.get("/api/json_data")
-def get_json_data() -> dict:
-    """Get test run data from JSON storage.
+def get_json_data(request: Request) -> Response:
+    """Get test run data from JSON, SQLite or in-memory statestore.
+
+    The request with the ETag of the current data in If-None-Match
+    is answered with 304 Not Modified.
+
+    Args:
+        request (Request): request
+
+    Returns:
+        Response: Test run data from JSON files, SQLite database or panel memory
+    """
+    etag, body, _ = _get_json_data()
+    if etag is None:
+        return Response(body, media_type="application/json")
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _get_json_data() -> tuple[str | None, str, dict]:
+    """Get the test run data with its encoding and ETag.
+
+    The data is cached by the statestore version, so the statestore
+    is read and encoded only after it was changed. The cached data
+    is shared and must not be changed.
 
     Returns:
-        dict: Test run data from JSON files
+        tuple[str | None, str, dict]: ETag, None for the error data,
+            encoded data and data
+    """
+    # the version is taken before the read, so the cached data is never newer
+    version = _get_statestore_version()
+    with app.state.json_data_lock:
+        cache = app.state.json_data_cache
+        if version is not None and cache is not None and cache[0] == version:
+            return cache[1], cache[2], cache[3]
+
+    data = _read_json_data()
+    body = get_codec().dumps(data, compact=True)
+    if "error" in data:
+        return None, body, data
+    etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+    with app.state.json_data_lock:
+        app.state.json_data_cache = (version, etag, body, data)
+    return etag, body, data
+
+
+def _read_json_data() -> dict:
+    """Read test run data from JSON, SQLite or in-memory statestore.
+
+    Returns:
+        dict: statestore document in the CouchDB _all_docs format
     """
     config_manager = ConfigManager()
     storage_type = config_manager.config.database.storage_type
+    statestore_server = app.state.statestore_server
 
-    if storage_type != StorageType.JSON:
+    if statestore_server is None and storage_type not in {
+        StorageType.JSON,
+        StorageType.SQLITE,
+    }:
         return {"error": "JSON storage not configured"}
 
     try:
-        config_storage_path = Path(config_manager.config.database.storage_path)
-        if config_storage_path.is_absolute():
-            storage_dir = config_storage_path / "storage" / "statestore"
+        if statestore_server is not None:
+            data = statestore_server.snapshot()
+        elif storage_type == StorageType.SQLITE:
+            data = _read_sqlite()
         else:
-            storage_dir = Path(
-                config_manager.tests_path
-                / config_manager.config.database.storage_path
-                / "storage"
-                / "statestore",
-            )
-        _doc_id = config_manager.config.database.doc_id
-        statestore_file = storage_dir / f"{_doc_id}.json"
+            data = _read_json()
 
-        if not statestore_file.exists():
+        if data is None:
             return {"rows": [], "total_rows": 0}
 
-        with statestore_file.open("r") as f:
-            data = json.load(f)
-
         # Format data to match CouchDB's _all_docs format
         return {
             "rows": [
@@ -422,10 +550,208 @@ def get_json_data() -> dict:
         return {"error": str(exc), "rows": [], "total_rows": 0}
 
 
+def _read_json() -> dict | None:
+    """Read the statestore document from JSON storage.
+
+    Returns:
+        dict | None: statestore document, None if it does not exist
+    """
+    config_manager = ConfigManager()
+    statestore_file = _get_statestore_file()
+
+    if not statestore_file.exists():
+        return None
+
+    if config_manager.config.database.journal:
+        return _read_journal(statestore_file)
+    return get_codec().loads(statestore_file.read_bytes())
+
+
+def _get_statestore_file() -> Path:
+    """Get the statestore file path of JSON storage.
+
+    Returns:
+        Path: statestore file path
+    """
+    config_manager = ConfigManager()
+    config_storage_path = Path(config_manager.config.database.storage_path)
+    if config_storage_path.is_absolute():
+        storage_dir = config_storage_path / "storage" / "statestore"
+    else:
+        storage_dir = Path(
+            config_manager.tests_path
+            / config_manager.config.database.storage_path
+            / "storage"
+            / "statestore",
+        )
+    _doc_id = config_manager.config.database.doc_id
+    return storage_dir / f"{_doc_id}.json"
+
+
+def _read_journal(statestore_file: Path) -> dict:
+    """Read the statestore document, applying only new journal records.
+
+    Args:
+        statestore_file (Path): statestore snapshot file path
+
+    Returns:
+        dict: statestore document copy
+    """
+    with app.state.storage_lock:
+        if app.state.journal is None:
+            app.state.journal = JsonJournal(statestore_file)
+        app.state.storage_doc = app.state.journal.read(app.state.storage_doc)
+        return copy.deepcopy(app.state.storage_doc)
+
+
+def _read_sqlite() -> dict | None:
+    """Read the statestore document from SQLite storage if it was changed.
+
+    Returns:
+        dict | None: statestore document copy, None if it does not exist
+    """
+    with app.state.storage_lock:
+        document = _get_sqlite_document()
+        if app.state.storage_doc is None or document.has_changed():
+            app.state.storage_doc = document.load()
+        return copy.deepcopy(app.state.storage_doc)
+
+
+@app.get("/api/events")
+async def statestore_events() -> Response:
+    """Stream the JSON, SQLite or in-memory statestore changes.
+
+    The "snapshot" event contains the data of /api/json_data, and the "patch"
+    event contains the JSON Patch from the data of the previous event.
+
+    Returns:
+        Response: event stream, or 404 if the statestore is stored in CouchDB
+    """
+    storage_type = ConfigManager().config.database.storage_type
+    if app.state.statestore_server is None and storage_type not in {
+        StorageType.JSON,
+        StorageType.SQLITE,
+    }:
+        return Response(status_code=HTTPStatus.NOT_FOUND)
+    if app.state.statestore_events is None:
+        app.state.statestore_events = StateStoreEvents(
+            lambda: _get_json_data()[1:],
+            _wait_for_statestore_change,
+        )
+    return StreamingResponse(
+        app.state.statestore_events.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _wait_for_statestore_change(version: Hashable | None, timeout: float) -> Hashable:
+    """Wait until the statestore version differs from the given one.
+
+    The in-memory statestore version is waited for without polling.
+    The version of the local storage is the status of its files, so
+    the files are not read until they are changed. The status is checked
+    less often while the storage is idle. The function is called by
+    the single watcher of the event streams, not by every stream.
+
+    Args:
+        version (Hashable | None): known statestore version
+        timeout (float): maximum wait time in seconds
+
+    Returns:
+        Hashable: current statestore version
+    """
+    statestore_server = app.state.statestore_server
+    if statestore_server is not None:
+        return statestore_server.wait_for_change(version, timeout)
+
+    deadline = monotonic() + timeout
+    interval = _STORAGE_POLL_INTERVAL
+    while (new_version := _get_statestore_version()) == version:
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            break
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, _STORAGE_POLL_MAX_INTERVAL)
+    return new_version
+
+
+def _get_statestore_version() -> Hashable | None:
+    """Get the statestore version without reading the document.
+
+    The in-memory statestore counts the changes, the SQLite version is
+    the statestore document version, and the JSON version is the status
+    of the snapshot and journal files.
+
+    Returns:
+        Hashable | None: statestore version, None for CouchDB storage
+    """
+    statestore_server = app.state.statestore_server
+    if statestore_server is not None:
+        return statestore_server.version
+
+    storage_type = ConfigManager().config.database.storage_type
+    if storage_type == StorageType.SQLITE:
+        with app.state.storage_lock:
+            return _get_sqlite_document().get_version()
+    if storage_type == StorageType.JSON:
+        statestore_file = _get_statestore_file()
+        journal_file = statestore_file.with_suffix(".jsonl")
+        return _get_file_stat(statestore_file), _get_file_stat(journal_file)
+    return None
+
+
+def _get_file_stat(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _get_sqlite_document() -> SqliteDocument:
+    """Get the statestore document of SQLite storage.
+
+    Must be called with the storage lock held.
+
+    Returns:
+        SqliteDocument: statestore document
+    """
+    if app.state.sqlite_document is None:
+        app.state.sqlite_document = SqliteDocument(
+            connect(get_database_path()),
+            "statestore",
+            ConfigManager().config.database.doc_id,
+        )
+    return app.state.sqlite_document
+
+
+@app.get("/api/assets/{asset_id}")
+def get_asset(asset_id: str) -> Response:
+    """Get the image or html page of a dialog box from the asset cache.
+
+    The asset ID is the hash of the asset data, so the asset never changes
+    and the browser caches it without revalidation.
+
+    Args:
+        asset_id (str): asset ID
+
+    Returns:
+        Response: asset file, or 404 if the asset is not found
+    """
+    asset_path = AssetStore().get_path(asset_id)
+    if asset_path is None:
+        return Response(status_code=HTTPStatus.NOT_FOUND)
+    return FileResponse(
+        asset_path,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
 if "DEBUG_FRONTEND" not in os.environ:
     app.mount(
         "/",
-        StaticFiles(
+        PrecompressedStaticFiles(
             directory=Path(__file__).parent / "frontend/dist",
             html=True,
         ),
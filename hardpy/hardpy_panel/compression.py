@@ -0,0 +1,137 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import mimetypes
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+if TYPE_CHECKING:
+    import os
+
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+# content encodings of the precompressed files by preference
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# directory of the frontend build files with the content hash in the name
+_HASHED_DIRECTORY = "assets"
+_IMMUTABLE = "public, max-age=31536000, immutable"
+# API paths that are not compressed by the middleware
+_UNCOMPRESSED_PATHS = ("/api/events", "/api/assets/")
+# parameters of the encoding that is not accepted
+_REJECTED = re.compile(r"\s*q\s*=\s*0(\.0{0,3})?\s*")
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Static files with precompressed variants and cache headers.
+
+    The brotli (.br) or gzip (.gz) variant built next to the file is served
+    if the client accepts its encoding. The build files with the content hash
+    in the name never change and are cached without revalidation, other
+    files, i.e. index.html, are revalidated on every request.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Get the file response.
+
+        Args:
+            full_path (str | os.PathLike[str]): file path
+            stat_result (os.stat_result): file status
+            scope (Scope): request scope
+            status_code (int): response status code
+
+        Returns:
+            Response: file response, or 304 if the file is not modified
+        """
+        request_headers = Headers(scope=scope)
+        path = Path(full_path)
+        is_hashed = path.parent.name == _HASHED_DIRECTORY
+        headers = {"Cache-Control": _IMMUTABLE if is_hashed else "no-cache"}
+        media_type = mimetypes.guess_type(path.name)[0] or "text/plain"
+
+        response: Response | None = None
+        accepted = _get_accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding, suffix in _ENCODINGS:
+            variant_path = path.with_name(f"{path.name}{suffix}")
+            try:
+                variant_stat = variant_path.stat()
+            except OSError:
+                continue
+            headers["Vary"] = "Accept-Encoding"
+            if response is None and encoding in accepted:
+                response = FileResponse(
+                    variant_path,
+                    status_code=status_code,
+                    headers={**headers, "Content-Encoding": encoding},
+                    media_type=media_type,
+                    stat_result=variant_stat,
+                )
+        if response is None:
+            response = FileResponse(
+                path,
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type,
+                stat_result=stat_result,
+            )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class ApiCompressionMiddleware:
+    """Gzip compression of the API responses larger than the minimum size.
+
+    The event stream is not compressed to send every event at once,
+    and the static files and assets are not compressed again.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        """Create the middleware.
+
+        Args:
+            app (ASGIApp): application
+            minimum_size (int): smallest response size in bytes to compress
+        """
+        self._app = app
+        self._gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request.
+
+        Args:
+            scope (Scope): request scope
+            receive (Receive): receive channel
+            send (Send): send channel
+        """
+        path = scope.get("path", "")
+        if (
+            scope["type"] == "http"
+            and path.startswith("/api/")
+            and not path.startswith(_UNCOMPRESSED_PATHS)
+        ):
+            await self._gzip(scope, receive, send)
+        else:
+            await self._app(scope, receive, send)
+
+
+def _get_accepted_encodings(accept_encoding: str) -> set[str]:
+    encodings = set()
+    for item in accept_encoding.split(","):
+        encoding, _, params = item.partition(";")
+        if not _REJECTED.fullmatch(params):
+            encodings.add(encoding.strip().lower())
+    return encodings
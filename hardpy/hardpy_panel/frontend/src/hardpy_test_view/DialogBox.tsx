@@ -24,6 +24,7 @@ import {
   HTML_IFRAME_WIDTH_FACTOR,
   IMAGE_SCALE_FACTOR,
   calculateDialogDimensions,
+  getImageSource,
 } from "./DialogUtils";
 import { useTranslation } from "react-i18next";
 
@@ -40,7 +41,7 @@ interface Props {
   width?: string;
   widget_type?: WidgetType;
   widget_info?: WidgetInfo;
-  image_base64?: string;
+  image_src?: string;
   image_width?: number;
   image_border?: number;
   is_visible?: boolean;
@@ -66,6 +67,7 @@ export enum WidgetType {
 
 interface ImageComponent {
   base64?: string;
+  asset?: string;
   width?: number;
   border?: number;
 }
@@ -478,7 +480,7 @@ const renderMultistep = (
               ))}
               {step.info.image && (
                 <img
-                  src={`data:image/image;base64,${step.info.image?.base64}`}
+                  src={getImageSource(step.info.image)}
                   alt={""}
                   style={{
                     maxWidth: `${Math.min(
@@ -982,10 +984,8 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
 
       props.widget_info?.steps?.forEach((step) => {
         if (step.info.image) {
-          const base64Src = `data:image/image;base64,${step.info.image?.base64}`;
-
           const image = new Image();
-          image.src = base64Src;
+          image.src = getImageSource(step.info.image) ?? "";
           image.onload = () =>
             handleStepImageLoad(
               image,
@@ -1082,10 +1082,10 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
             t
           )}
         <p> </p>
-        {props.image_base64 && (
+        {props.image_src && (
           <div className="image-container">
             <img
-              src={`data:image/image;base64,${props.image_base64}`}
+              src={props.image_src}
               alt={""}
               onLoad={handleImageLoad}
               style={{
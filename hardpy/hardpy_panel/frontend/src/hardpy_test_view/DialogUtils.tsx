@@ -12,6 +12,27 @@ export interface Dimensions {
   height: number;
 }
 
+export interface ImageSource {
+  base64?: string;
+  asset?: string;
+}
+
+/**
+ * Gets the image source of the image component
+ * @param {ImageSource} [image] - Image component with the asset ID or base64 data
+ * @returns {string|undefined} - Asset URL, data URL or undefined if there is no image
+ */
+export const getImageSource = (image?: ImageSource): string | undefined => {
+  if (image?.asset) {
+    // assets are immutable, the browser caches them by URL
+    return `/api/assets/${image.asset}`;
+  }
+  if (image?.base64) {
+    return `data:image/image;base64,${image.base64}`;
+  }
+  return undefined;
+};
+
 const PHONE_SCALE_FACTOR = 0.7
 const MONITOR_SCALE_FACTOR = 0.6
 
@@ -22,7 +22,7 @@ import { useTranslation } from "react-i18next";
 interface StartOperatorMsgDialogProps {
   title?: string;
   msg: string;
-  image_base64?: string;
+  image_src?: string;
   image_width?: number;
   image_border?: number;
   is_visible?: boolean;
@@ -345,10 +345,10 @@ export function StartOperatorMsgDialog(
             {line}
           </p>
         ))}
-        {props.image_base64 && (
+        {props.image_src && (
           <div className="image-container">
             <img
-              src={`data:image/image;base64,${props.image_base64}`}
+              src={props.image_src}
               alt={""} // Use a more descriptive text or an empty string if not available
               onLoad={handleImageLoad}
               style={{
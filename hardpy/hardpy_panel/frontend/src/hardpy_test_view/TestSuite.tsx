@@ -15,6 +15,7 @@ import _, { Dictionary } from "lodash";
 import DataTable, { TableColumn } from "react-data-table-component";
 import { LoadingOutlined } from "@ant-design/icons";
 import { StartConfirmationDialog, WidgetType } from "./DialogBox";
+import { getImageSource } from "./DialogUtils";
 import { withTranslation, WithTranslation } from "react-i18next";
 
 import { TestNumber } from "./TestNumber";
@@ -41,12 +42,14 @@ interface WidgetDescription {
  * Interface representing image information for dialog boxes
  * @interface ImageInfo
  * @property {string} [base64] - Base64 encoded image data
+ * @property {string} [asset] - Image asset ID of the panel asset cache
  * @property {string} [format] - Image format (png, jpg, etc.)
  * @property {number} [width] - Image display width
  * @property {number} [border] - Image border thickness
  */
 interface ImageInfo {
   base64?: string;
+  asset?: string;
   format?: string;
   width?: number;
   border?: number;
@@ -976,11 +979,9 @@ export class TestSuite extends React.Component<Props, State> {
 
     const { info: widget_info, type: widget_type } =
       test.dialog_box?.widget || {};
-    const {
-      base64: image_base64,
-      width: image_width,
-      border: image_border,
-    } = test.dialog_box?.image || {};
+    const { width: image_width, border: image_border } =
+      test.dialog_box?.image || {};
+    const image_src = getImageSource(test.dialog_box?.image);
 
     return this.commonCellRender(
       <div style={{ marginTop: "0.2em", marginBottom: "0.2em" }}>
@@ -994,7 +995,7 @@ export class TestSuite extends React.Component<Props, State> {
               dialog_text={test.dialog_box.dialog_text}
               widget_info={widget_info}
               widget_type={widget_type}
-              image_base64={image_base64}
+              image_src={image_src}
               image_width={image_width}
               image_border={image_border}
               is_visible={test.dialog_box.visible}
@@ -22,6 +22,7 @@ interface StorageData {
 
 interface StorageTypeResponse {
   storage_type: string;
+  memory_statestore?: boolean;
 }
 
 interface JsonDataResponse {
@@ -31,7 +32,88 @@ interface JsonDataResponse {
 }
 
 /**
- * Custom hook to fetch data from either JSON storage or CouchDB
+ * Storage types served by the /api/json_data endpoint
+ */
+const LOCAL_STORAGE_TYPES = ["json", "sqlite", "memory"];
+
+/**
+ * Merge the sharded CouchDB documents into the header document rows.
+ * A header document lists its module and case shards in the "shards" field,
+ * the shard documents are "<doc_id>:<module>" and "<doc_id>:<module>:<case>".
+ * Rows without shards are returned as is.
+ */
+const assembleShards = (rows: StorageRow[]): StorageRow[] => {
+  if (!rows.some((row) => row.doc?.shards)) return rows;
+
+  const docs = new Map<string, any>();
+  rows.forEach((row) => docs.set(row.id, row.doc));
+
+  return rows
+    .filter((row) => !row.doc?.shard)
+    .map((row) => {
+      const shards: Record<string, string[]> | undefined = row.doc?.shards;
+      if (!shards) return row;
+
+      const header = { ...row.doc };
+      delete header.shards;
+      const modules: Record<string, any> = {};
+      Object.entries(shards).forEach(([moduleId, caseIds]) => {
+        const cases: Record<string, any> = {};
+        caseIds.forEach((caseId) => {
+          const caseShard = docs.get(`${row.id}:${moduleId}:${caseId}`);
+          if (caseShard) cases[caseId] = caseShard.data;
+        });
+        const moduleShard = docs.get(`${row.id}:${moduleId}`);
+        modules[moduleId] = { ...(moduleShard?.data ?? {}), cases };
+      });
+      return { ...row, doc: { ...header, modules } };
+    });
+};
+
+interface PatchOperation {
+  op: "add" | "remove" | "replace";
+  path: string;
+  value?: any;
+}
+
+/**
+ * Apply the operation to the node copy, the unchanged nodes are shared.
+ */
+const applyOperation = (node: any, keys: string[], operation: PatchOperation): any => {
+  if (keys.length === 0) return operation.value;
+
+  const [key, ...rest] = keys;
+  const copy: any = Array.isArray(node) ? [...node] : { ...node };
+  if (rest.length > 0) {
+    copy[key] = applyOperation(node[key], rest, operation);
+  } else if (Array.isArray(copy)) {
+    const index = key === "-" ? copy.length : Number(key);
+    if (operation.op === "add") copy.splice(index, 0, operation.value);
+    else if (operation.op === "remove") copy.splice(index, 1);
+    else copy[index] = operation.value;
+  } else if (operation.op === "remove") {
+    delete copy[key];
+  } else {
+    copy[key] = operation.value;
+  }
+  return copy;
+};
+
+/**
+ * Apply the RFC 6902 JSON Patch add, remove and replace operations
+ * to the document without changing it.
+ */
+const applyPatch = (doc: any, operations: PatchOperation[]): any =>
+  operations.reduce((result, operation) => {
+    const keys = operation.path
+      .split("/")
+      .slice(1)
+      .map((key) => key.replace(/~1/g, "/").replace(/~0/g, "~"));
+    return applyOperation(result, keys, operation);
+  }, doc);
+
+/**
+ * Custom hook to fetch data from either JSON/SQLite storage or CouchDB
  * Automatically detects storage type and uses appropriate method
  */
 export const useStorageData = (): StorageData => {
@@ -45,7 +127,8 @@ export const useStorageData = (): StorageData => {
     fetch("/api/storage_type")
       .then((res) => res.json())
       .then((data: StorageTypeResponse) => {
-        setStorageType(data.storage_type);
+        // The in-memory statestore is served by the panel API as well
+        setStorageType(data.memory_statestore ? "memory" : data.storage_type);
       })
       .catch((err) => {
         console.error("Failed to fetch storage type:", err);
@@ -53,42 +136,79 @@ export const useStorageData = (): StorageData => {
       });
   }, []);
 
-  // For JSON storage, poll the API endpoint
+  // For JSON and SQLite storage, subscribe to the API event stream
   React.useEffect(() => {
-    if (storageType !== "json") return;
+    if (storageType === null || !LOCAL_STORAGE_TYPES.includes(storageType)) return;
+
+    const handleJsonData = (data: JsonDataResponse) => {
+      if (data.error) {
+        setJsonError(new Error(data.error));
+        setJsonLoading(false);
+      } else {
+        setJsonData(data.rows);
+        setJsonLoading(false);
+        setJsonError(null);
+      }
+    };
 
     const fetchJsonData = () => {
       fetch("/api/json_data")
         .then((res) => res.json())
-        .then((data: JsonDataResponse) => {
-          if (data.error) {
-            setJsonError(new Error(data.error));
-            setJsonLoading(false);
-          } else {
-            setJsonData(data.rows);
-            setJsonLoading(false);
-            setJsonError(null);
-          }
-        })
+        .then(handleJsonData)
         .catch((err) => {
           setJsonError(err);
           setJsonLoading(false);
         });
     };
 
-    // Initial fetch
-    fetchJsonData();
-
-    // Poll every 500ms for updates
-    const interval = setInterval(fetchJsonData, 500);
+    let interval: ReturnType<typeof setInterval> | null = null;
+    const startPolling = () => {
+      if (interval !== null) return;
+      // Initial fetch
+      fetchJsonData();
+      // Poll every 500ms for updates
+      interval = setInterval(fetchJsonData, 500);
+    };
 
-    return () => clearInterval(interval);
+    // The event stream sends the current data snapshot and then the patch
+    // or the snapshot of every change, the API is polled if the browser
+    // does not support it or it is closed
+    let events: EventSource | null = null;
+    let streamData: JsonDataResponse | null = null;
+    if (typeof EventSource === "undefined") {
+      startPolling();
+    } else {
+      events = new EventSource("/api/events");
+      events.addEventListener("snapshot", (event: MessageEvent) => {
+        streamData = JSON.parse(event.data);
+        handleJsonData(streamData as JsonDataResponse);
+      });
+      events.addEventListener("patch", (event: MessageEvent) => {
+        // The patch follows the snapshot of the same stream
+        if (streamData === null) return;
+        streamData = applyPatch(streamData, JSON.parse(event.data));
+        handleJsonData(streamData as JsonDataResponse);
+      });
+      events.onerror = () => {
+        // The browser reconnects unless the stream is closed
+        if (events?.readyState === EventSource.CLOSED) startPolling();
+      };
+    }
+
+    return () => {
+      events?.close();
+      if (interval !== null) clearInterval(interval);
+    };
   }, [storageType]);
 
   // For CouchDB, use the existing PouchDB hook
   const pouchDbData = useAllDocs({
     include_docs: true,
   });
+  const pouchDbRows = React.useMemo(
+    () => assembleShards(pouchDbData.rows as StorageRow[]),
+    [pouchDbData.rows]
+  );
 
   // Return appropriate data based on storage type
   if (storageType === null) {
@@ -101,7 +221,7 @@ export const useStorageData = (): StorageData => {
     };
   }
 
-  if (storageType === "json") {
+  if (LOCAL_STORAGE_TYPES.includes(storageType)) {
     return {
       rows: jsonData,
       state: jsonError ? "error" : jsonLoading ? "loading" : "done",
@@ -111,5 +231,5 @@ export const useStorageData = (): StorageData => {
   }
 
   // Default to CouchDB
-  return pouchDbData;
+  return { ...pouchDbData, rows: pouchDbRows };
 };
@@ -28,12 +28,15 @@ function ErrorMessage() {
 
 /**
  * Gets the storage type from the backend API.
- * @returns {Promise<string>} A promise that resolves to the storage type ("json" or "couchdb").
+ * @returns {Promise<string>} A promise that resolves to the storage type ("json", "sqlite", "memory" or "couchdb").
  */
 async function getStorageType(): Promise<string> {
   try {
     const response = await fetch("/api/storage_type");
     const data = await response.json();
+    if (data.memory_statestore) {
+      return "memory";
+    }
     return data.storage_type || "couchdb";
   } catch (error) {
     console.error(error);
@@ -52,7 +55,9 @@ async function getSyncURL(): Promise<string | undefined> {
   try {
     const response = await fetch("/api/couch");
     const data = await response.json();
-    return `${data.connection_str}/statestore`;
+    // every stand can use own statestore database
+    const statestore = data.statestore || "statestore";
+    return `${data.connection_str}/${encodeURIComponent(statestore)}`;
   } catch (error) {
     console.error(error);
     return undefined;
@@ -81,8 +86,8 @@ const root = ReactDOM.createRoot(
 const storageType = await getStorageType();
 const syncDocumentId = await getDatabaseDocumentId();
 
-if (storageType === "json") {
-  // For JSON storage, create a dummy local PouchDB instance (not used but required by Provider)
+if (storageType !== "couchdb") {
+  // For JSON, SQLite and in-memory storage, create a dummy local PouchDB instance (not used but required by Provider)
   // This creates an IndexedDB database that won't try to sync anywhere
   const dummyDb = new PouchDB("hardpy-local-dummy");
 
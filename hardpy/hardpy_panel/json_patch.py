@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from typing import Any
+
+
+def make_patch(old: Any, new: Any) -> list[dict]:  # noqa: ANN401
+    """Make the RFC 6902 JSON Patch that changes the old document to the new one.
+
+    Only the add, remove and replace operations are used. The object keys
+    keep the order of the new document after the patch, the object with
+    reordered keys is replaced as a whole.
+
+    Args:
+        old (Any): old JSON document
+        new (Any): new JSON document
+
+    Returns:
+        list[dict]: patch operations
+    """
+    patch: list[dict] = []
+    _diff(old, new, "", patch)
+    return patch
+
+
+def _diff(old: Any, new: Any, path: str, patch: list[dict]) -> None:  # noqa: ANN401
+    if isinstance(old, dict) and isinstance(new, dict):
+        if _is_order_kept(old, new):
+            _diff_dict(old, new, path, patch)
+            return
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, patch)
+        return
+    elif type(old) is type(new) and old == new:
+        return
+    patch.append({"op": "replace", "path": path, "value": new})
+
+
+def _diff_dict(old: dict, new: dict, path: str, patch: list[dict]) -> None:
+    patch.extend(
+        {"op": "remove", "path": f"{path}/{_escape(key)}"}
+        for key in old
+        if key not in new
+    )
+    for key, value in new.items():
+        key_path = f"{path}/{_escape(key)}"
+        if key in old:
+            _diff(old[key], value, key_path, patch)
+        else:
+            patch.append({"op": "add", "path": key_path, "value": value})
+
+
+def _diff_list(old: list, new: list, path: str, patch: list[dict]) -> None:
+    for index in range(min(len(old), len(new))):
+        _diff(old[index], new[index], f"{path}/{index}", patch)
+    # the items are removed from the end to keep the indexes
+    patch.extend(
+        {"op": "remove", "path": f"{path}/{index}"}
+        for index in range(len(old) - 1, len(new) - 1, -1)
+    )
+    patch.extend(
+        {"op": "add", "path": f"{path}/{index}", "value": new[index]}
+        for index in range(len(old), len(new))
+    )
+
+
+def _is_order_kept(old: dict, new: dict) -> bool:
+    # the added keys are appended after the kept keys in the old order
+    kept_keys = [key for key in old if key in new]
+    return list(new)[: len(kept_keys)] == kept_keys
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from logging import getLogger
+from threading import Lock, Thread
+from time import sleep
+from typing import TYPE_CHECKING, Callable
+
+from hardpy.hardpy_panel.json_patch import make_patch
+from hardpy.pytest_hardpy.db.json_codec import get_codec
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Hashable
+
+# seconds between the keep-alive comments of the idle event stream
+_KEEPALIVE_INTERVAL = 15.0
+# longest wait of the watcher, it stops within it after the last subscriber
+_WAIT_TIMEOUT = 5.0
+# seconds before the watcher retries after an error
+_RETRY_INTERVAL = 1.0
+# number of changes between the full snapshots sent to all subscribers
+_SNAPSHOT_INTERVAL = 100
+
+
+@dataclass
+class _Change:
+    """Statestore change events."""
+
+    event_id: int
+    snapshot: str
+    patch: str | None
+
+
+class StateStoreEvents:
+    """Server-sent events of the statestore changes.
+
+    A single watcher thread waits for the statestore changes while
+    the event streams are subscribed. The changed document is read and
+    encoded once and sent to all subscribers, so any number of operator
+    panels costs the same as one.
+
+    The "snapshot" event contains the whole data, and the "patch" event
+    contains the RFC 6902 JSON Patch from the data of the previous event.
+    The subscriber receives the patch only if it received the previous
+    event, otherwise the snapshot is sent. The subscriber that is slower
+    than the changes skips to the last snapshot. Every hundredth change
+    is sent as the snapshot to all subscribers to resync them.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], tuple[str, dict]],
+        wait_for_change: Callable[[Hashable | None, float], Hashable],
+    ) -> None:
+        """Create the statestore events.
+
+        Args:
+            read (Callable[[], tuple[str, dict]]): reader of the encoded
+                statestore data and the data, the data must not be changed
+            wait_for_change (Callable[[Hashable | None, float], Hashable]):
+                waits until the statestore version differs from the given
+                one or the timeout in seconds expires, returns the version
+        """
+        self._log = getLogger(__name__)
+        self._read = read
+        self._wait_for_change = wait_for_change
+        self._codec = get_codec()
+        self._lock = Lock()
+        self._subscribers: set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._watcher: Thread | None = None
+        self._last_change: _Change | None = None
+        self._event_id = 0
+
+    async def stream(self) -> AsyncGenerator[str]:
+        """Stream the statestore data as server-sent events.
+
+        The current data snapshot is sent first, and then the patch
+        or the snapshot of every change.
+
+        Yields:
+            str: server-sent event
+        """
+        queue: asyncio.Queue[_Change] = asyncio.Queue(maxsize=1)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._last_change is not None and self._watcher is not None:
+                queue.put_nowait(self._last_change)
+            if self._watcher is None:
+                self._last_change = None
+                self._watcher = Thread(
+                    target=self._watch,
+                    name="hardpy-statestore-events",
+                    daemon=True,
+                )
+                self._watcher.start()
+        event_id = None
+        try:
+            while True:
+                try:
+                    change = await asyncio.wait_for(queue.get(), _KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if change.patch is not None and event_id == change.event_id - 1:
+                    yield change.patch
+                else:
+                    yield change.snapshot
+                event_id = change.event_id
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    def _watch(self) -> None:
+        version = None
+        previous_data = None
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._watcher = None
+                    return
+            try:
+                new_version = self._wait_for_change(version, _WAIT_TIMEOUT)
+                if new_version == version:
+                    continue
+                version = new_version
+                # the version is taken before the read, so no change is missed
+                body, data = self._read()
+                change = self._make_change(body, previous_data, data)
+            except Exception:  # noqa: BLE001
+                self._log.exception("Error watching statestore")
+                version = None
+                previous_data = None
+                sleep(_RETRY_INTERVAL)
+                continue
+            previous_data = data
+            with self._lock:
+                self._last_change = change
+                for loop, queue in self._subscribers:
+                    # the event loop of the subscriber is closed on shutdown
+                    with contextlib.suppress(RuntimeError):
+                        loop.call_soon_threadsafe(_put_last, queue, change)
+
+    def _make_change(
+        self,
+        body: str,
+        previous_data: dict | None,
+        data: dict,
+    ) -> _Change:
+        self._event_id += 1
+        event_id = self._event_id
+        snapshot = f"id: {event_id}\nevent: snapshot\ndata: {body}\n\n"
+        if previous_data is None or event_id % _SNAPSHOT_INTERVAL == 0:
+            return _Change(event_id, snapshot, None)
+        patch_data = self._codec.dumps(make_patch(previous_data, data), compact=True)
+        if len(patch_data) >= len(body):
+            return _Change(event_id, snapshot, None)
+        patch = f"id: {event_id}\nevent: patch\ndata: {patch_data}\n\n"
+        return _Change(event_id, snapshot, patch)
+
+
+def _put_last(queue: asyncio.Queue, change: _Change) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(change)
@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Everypin
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+from hardpy.pytest_hardpy.db.artifact_store import ArtifactStore
 from hardpy.pytest_hardpy.db.const import DatabaseField
 from hardpy.pytest_hardpy.db.runstore import RunStore
 from hardpy.pytest_hardpy.db.schema import ResultRunStore, ResultStateStore
@@ -15,6 +16,7 @@ from hardpy.pytest_hardpy.db.statestore import StateStore
 from hardpy.pytest_hardpy.db.tempstore import TempStore
 
 __all__ = [
+    "ArtifactStore",
     "Chart",
     "DatabaseField",
     "Instrument",
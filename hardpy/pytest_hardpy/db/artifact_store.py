@@ -0,0 +1,265 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import base64
+import hashlib
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from hardpy.common.config import ConfigManager, StorageType
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.couchdb_session import CouchDBSession
+from hardpy.pytest_hardpy.db.json_codec import get_codec
+
+ARTIFACT_REF = "$artifact"
+SIZE = "size"
+CONTENT_TYPE = "content_type"
+JSON_CONTENT_TYPE = "application/json"
+BINARY_CONTENT_TYPE = "application/octet-stream"
+ATTACHMENT_NAME = "data"
+BASE64_DATA = "data"
+
+
+def is_artifact_ref(value: Any) -> bool:  # noqa: ANN401
+    """Check if the value is a reference to the stored artifact.
+
+    Args:
+        value (Any): artifact value
+
+    Returns:
+        bool: True if the value is a reference
+    """
+    return isinstance(value, dict) and ARTIFACT_REF in value
+
+
+class ArtifactStoreInterface(ABC):
+    """Interface for large artifact storage implementations.
+
+    Artifacts are content-addressed: the artifact ID is the SHA-256 hash
+    of the artifact data, so the same data is stored once. The runstore
+    document keeps only the reference with the hash, size and content type.
+    """
+
+    def __init__(self) -> None:
+        self._log = getLogger(__name__)
+        self._size_limit = ConfigManager().config.database.artifact_size_limit
+
+    def store(self, value: Any) -> Any:  # noqa: ANN401
+        """Store the value if it is binary or larger than the size limit.
+
+        Args:
+            value (Any): artifact value
+
+        Returns:
+            Any: reference to the stored artifact, or the value
+                if it is stored inline in the document
+        """
+        if not self._size_limit or is_artifact_ref(value):
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self.put(bytes(value), BINARY_CONTENT_TYPE)
+        if isinstance(value, str) and len(value) <= self._size_limit // 6:
+            # the encoded string can not exceed the limit
+            return value
+        if isinstance(value, (dict, list, str)):
+            data = get_codec().dumps(value, compact=True).encode()
+            if len(data) > self._size_limit:
+                return self.put(data, JSON_CONTENT_TYPE)
+        return value
+
+    def put(self, data: bytes, content_type: str) -> dict:
+        """Store the artifact data.
+
+        Args:
+            data (bytes): artifact data
+            content_type (str): artifact data content type
+
+        Returns:
+            dict: reference to the stored artifact
+        """
+        artifact_id = hashlib.sha256(data).hexdigest()
+        self._write(artifact_id, data, content_type)
+        self._log.debug(f"Stored artifact {artifact_id} of {len(data)} bytes")
+        return {ARTIFACT_REF: artifact_id, SIZE: len(data), CONTENT_TYPE: content_type}
+
+    def load(self, ref: dict) -> Any:  # noqa: ANN401
+        """Read the stored artifact.
+
+        Args:
+            ref (dict): reference to the stored artifact
+
+        Returns:
+            Any: bytes of the binary artifact, or the decoded JSON value
+
+        Raises:
+            FileNotFoundError: if the artifact is not found
+            ValueError: if the artifact data does not match its hash
+        """
+        artifact_id = ref[ARTIFACT_REF]
+        data = self._read(artifact_id)
+        if data is None:
+            msg = f"Artifact {artifact_id} not found"
+            raise FileNotFoundError(msg)
+        if hashlib.sha256(data).hexdigest() != artifact_id:
+            msg = f"Artifact {artifact_id} is corrupted"
+            raise ValueError(msg)
+        if ref.get(CONTENT_TYPE) == JSON_CONTENT_TYPE:
+            return get_codec().loads(data)
+        return data
+
+    @abstractmethod
+    def _write(self, artifact_id: str, data: bytes, content_type: str) -> None:
+        """Write the artifact data if it is not stored yet."""
+
+    @abstractmethod
+    def _read(self, artifact_id: str) -> bytes | None:
+        """Read the artifact data, None if the artifact is not found."""
+
+
+class FileArtifactStore(ArtifactStoreInterface):
+    """File-based artifact storage implementation.
+
+    Stores every artifact in a side file next to the JSON or SQLite storage.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        config_manager = ConfigManager()
+        config_storage_path = Path(config_manager.config.database.storage_path)
+        if not config_storage_path.is_absolute():
+            config_storage_path = config_manager.tests_path / config_storage_path
+        self._storage_dir = config_storage_path / "storage" / "artifacts"
+
+    def _write(self, artifact_id: str, data: bytes, content_type: str) -> None:  # noqa: ARG002
+        file_path = self._storage_dir / artifact_id
+        if file_path.exists():
+            return
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = file_path.with_suffix(".tmp")
+        temp_file.write_bytes(data)
+        temp_file.replace(file_path)
+
+    def _read(self, artifact_id: str) -> bytes | None:
+        try:
+            return (self._storage_dir / artifact_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+
+class CouchDBArtifactStore(ArtifactStoreInterface):
+    """CouchDB-based artifact storage implementation.
+
+    Stores every artifact as the attachment of own document in the
+    artifacts database, the document ID is the artifact ID.
+    """
+
+    def __init__(self) -> None:
+        from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
+
+        super().__init__()
+        config = ConfigManager().config
+        self._db_srv = CouchDBSession().server(config.database.url)
+        self._db_name = config.database.get_database_name("artifacts")
+        try:
+            self._db = self._db_srv.create(self._db_name)
+        except Conflict:
+            # database already exists
+            self._db = self._db_srv.database(self._db_name)
+
+    def _write(self, artifact_id: str, data: bytes, content_type: str) -> None:
+        from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
+
+        # the document and the attachment are written with a single request
+        doc = {
+            "_id": artifact_id,
+            SIZE: len(data),
+            "_attachments": {
+                ATTACHMENT_NAME: {
+                    CONTENT_TYPE: content_type,
+                    "data": base64.b64encode(data).decode(),
+                },
+            },
+        }
+        try:
+            self._db.save(doc)
+        except Conflict:
+            # the artifact is already stored
+            return
+
+    def _read(self, artifact_id: str) -> bytes | None:
+        resource = self._db.resource(artifact_id, ATTACHMENT_NAME)
+        response = resource.session.get(resource.base_url, timeout=resource.timeout)
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+        response.raise_for_status()
+        return response.content
+
+
+class ArtifactStore(metaclass=SingletonMeta):
+    """HardPy large artifact storage factory.
+
+    Creates appropriate storage backend based on configuration:
+    - CouchDB attachments when storage_type is "couchdb"
+    - side files when storage_type is "json" or "sqlite"
+
+    Note: This class acts as a factory. When instantiated, it returns
+    the appropriate concrete implementation (FileArtifactStore or
+    CouchDBArtifactStore).
+    """
+
+    def __new__(cls) -> ArtifactStoreInterface:  # type: ignore[misc]
+        """Create and return the appropriate storage implementation.
+
+        Returns:
+            ArtifactStoreInterface: Concrete storage implementation based on config
+        """
+        storage_type = ConfigManager().config.database.storage_type
+        if storage_type == StorageType.COUCHDB:
+            return CouchDBArtifactStore()
+        return FileArtifactStore()
+
+
+def resolve_artifacts(report: dict) -> dict:
+    """Replace the artifact references of the report with the artifact values.
+
+    The stored JSON artifacts are replaced with their values. The stored
+    binary artifacts keep the reference with the base64-encoded data added,
+    so the report can be encoded to JSON.
+
+    Args:
+        report (dict): report dumped from the runstore model, changed in place
+
+    Returns:
+        dict: report without the references to the stored artifacts
+
+    Raises:
+        FileNotFoundError: if the artifact is not found
+        ValueError: if the artifact data does not match its hash
+    """
+    artifacts = [report.get(DF.ARTIFACT)]
+    for module in (report.get(DF.MODULES) or {}).values():
+        artifacts.append(module.get(DF.ARTIFACT))
+        artifacts.extend(
+            case.get(DF.ARTIFACT) for case in (module.get(DF.CASES) or {}).values()
+        )
+
+    # the artifact storage is not created if the report has no references
+    store: ArtifactStoreInterface | None = None
+    for artifact in artifacts:
+        if not isinstance(artifact, dict):
+            continue
+        for key, value in artifact.items():
+            if not is_artifact_ref(value):
+                continue
+            if store is None:
+                store = ArtifactStore()
+            data = store.load(value)
+            if isinstance(data, bytes):
+                data = {**value, BASE64_DATA: base64.b64encode(data).decode()}
+            artifact[key] = data
+    return report
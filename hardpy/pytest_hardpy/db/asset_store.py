@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import hashlib
+import re
+from logging import getLogger
+from pathlib import Path
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+
+ASSET_URL = "/api/assets/"
+
+# SHA-256 hash of the asset data with the optional file suffix
+_ASSET_ID = re.compile(r"[0-9a-f]{64}(\.[0-9a-z]{1,16})?")
+
+
+class AssetStore(metaclass=SingletonMeta):
+    """Content-addressed storage of the operator panel assets.
+
+    Images and HTML pages of dialog boxes and operator messages are stored
+    once in the assets directory of the storage path, and the statestore
+    document keeps only the asset ID. The asset ID is the SHA-256 hash
+    of the asset data with the file suffix, so the operator panel serves
+    the assets with immutable cache headers.
+    """
+
+    def __init__(self) -> None:
+        self._log = getLogger(__name__)
+        config_manager = ConfigManager()
+        config_storage_path = Path(config_manager.config.database.storage_path)
+        if not config_storage_path.is_absolute():
+            config_storage_path = config_manager.tests_path / config_storage_path
+        self._storage_dir = config_storage_path / "storage" / "assets"
+        # file path, modification time and size to the asset ID
+        self._files: dict[tuple[str, int, int], str] = {}
+
+    def put_file(self, path: str | Path) -> str:
+        """Store the file as the asset.
+
+        The file is read and hashed only once while it is not changed.
+
+        Args:
+            path (str | Path): file path
+
+        Returns:
+            str: asset ID
+
+        Raises:
+            FileNotFoundError: if the file is not found
+        """
+        file_path = Path(path).resolve()
+        stat = file_path.stat()
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        asset_id = self._files.get(key)
+        if asset_id is None or not (self._storage_dir / asset_id).exists():
+            asset_id = self.put(file_path.read_bytes(), file_path.suffix)
+            self._files[key] = asset_id
+        return asset_id
+
+    def put(self, data: bytes, suffix: str = "") -> str:
+        """Store the data as the asset.
+
+        Args:
+            data (bytes): asset data
+            suffix (str): file suffix that defines the asset content type, i.e. ".png"
+
+        Returns:
+            str: asset ID
+        """
+        suffix = suffix.lower()
+        if not _ASSET_ID.fullmatch("0" * 64 + suffix):
+            suffix = ""
+        asset_id = hashlib.sha256(data).hexdigest() + suffix
+        file_path = self._storage_dir / asset_id
+        if not file_path.exists():
+            self._storage_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = file_path.with_name(f"{asset_id}.tmp")
+            temp_file.write_bytes(data)
+            temp_file.replace(file_path)
+            self._log.debug(f"Stored asset {asset_id} of {len(data)} bytes")
+        return asset_id
+
+    def get_path(self, asset_id: str) -> Path | None:
+        """Get the asset file path.
+
+        Args:
+            asset_id (str): asset ID
+
+        Returns:
+            Path | None: asset file path, None if the asset is not found
+        """
+        if not _ASSET_ID.fullmatch(asset_id):
+            return None
+        file_path = self._storage_dir / asset_id
+        return file_path if file_path.exists() else None
@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.couchdb_session import CouchDBSession
+
+if TYPE_CHECKING:
+    from pycouchdb.client import Database  # type: ignore[import-untyped]
+
+STORE_DATABASES = ("runstore", "statestore")
+
+
+def set_revs_limit(db: Database, limit: int) -> None:
+    """Set the number of the document revisions kept by the database.
+
+    Args:
+        db (Database): CouchDB database
+        limit (int): revision limit
+    """
+    db.resource.put("_revs_limit", data=str(limit))
+
+
+def needs_compaction(db: Database, ratio: float) -> bool:
+    """Check if the database file has grown by the ratio of the active data.
+
+    Args:
+        db (Database): CouchDB database
+        ratio (float): ratio of the file size to the active data size
+
+    Returns:
+        bool: True if the database must be compacted
+    """
+    info = db.config()
+    if info.get("compact_running"):
+        return False
+    sizes = info.get("sizes") or {}
+    file_size = sizes.get("file") or 0
+    active_size = sizes.get("active") or 0
+    return file_size > 0 and file_size >= active_size * ratio
+
+
+def compact_if_needed(db: Database, ratio: float) -> bool:
+    """Start the database compaction if the database has grown by the ratio.
+
+    CouchDB compacts the database in the background, the request does not
+    wait for the compaction end.
+
+    Args:
+        db (Database): CouchDB database
+        ratio (float): ratio of the file size to the active data size
+
+    Returns:
+        bool: True if the compaction was started
+    """
+    if not needs_compaction(db, ratio):
+        return False
+    db.compact()
+    return True
+
+
+def compact_store_databases() -> list[str]:
+    """Compact the runstore and statestore databases of the stand that have grown.
+
+    Returns:
+        list[str]: names of the databases which compaction was started
+    """
+    from pycouchdb.exceptions import NotFound  # type: ignore[import-untyped]
+
+    config = ConfigManager().config.database
+    server = CouchDBSession().server(config.url)
+    compacted = []
+    for store in STORE_DATABASES:
+        name = config.get_database_name(store)
+        try:
+            db = server.database(name)
+        except NotFound:
+            continue
+        if compact_if_needed(db, config.compaction_ratio):
+            compacted.append(name)
+    return compacted
@@ -0,0 +1,249 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+
+if TYPE_CHECKING:
+    from pycouchdb import Server  # type: ignore[import-untyped]
+    from pycouchdb.client import Database  # type: ignore[import-untyped]
+    from requests import Response
+
+# seconds to wait for the changes feed response after its timeout
+_CHANGES_TIMEOUT_MARGIN = 10
+
+
+class _ConnectionCounter:
+    """Thread-safe counter of the opened TCP connections."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+_connections = _ConnectionCounter()
+
+
+class _HTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        _connections.increment()
+        super().connect()
+
+
+class _HTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        _connections.increment()
+        super().connect()
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+class _PoolAdapter(HTTPAdapter):
+    """HTTP adapter that counts the opened connections."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTPConnectionPool,
+            "https": _HTTPSConnectionPool,
+        }
+
+    @property
+    def pool_count(self) -> int:
+        return len(self.poolmanager.pools)
+
+
+class CouchDBSession(metaclass=SingletonMeta):
+    """Process-wide pooled HTTP session for CouchDB access.
+
+    All CouchDB servers created by the session share one keep-alive
+    connection pool per server address, so the stores, the temporary
+    store and the report loaders do not open a new TCP connection
+    for every request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._sessions: dict[tuple, tuple[Session, _PoolAdapter]] = {}
+        self._requests = 0
+
+    @property
+    def requests(self) -> int:
+        """Get the number of the sent requests.
+
+        Returns:
+            int: number of requests
+        """
+        return self._requests
+
+    @property
+    def connections(self) -> int:
+        """Get the number of the opened connections.
+
+        Returns:
+            int: number of connections
+        """
+        return _connections.value
+
+    @property
+    def reconnects(self) -> int:
+        """Get the number of the connections opened after the first one.
+
+        The first connection to each server is not a reconnect, the next
+        ones replace the connections closed by the server or the network,
+        or are opened for the concurrent requests.
+
+        Returns:
+            int: number of reconnects
+        """
+        with self._lock:
+            pools = sum(adapter.pool_count for _, adapter in self._sessions.values())
+        return max(_connections.value - pools, 0)
+
+    def server(self, url: str) -> Server:
+        """Get CouchDB server that uses the pooled session.
+
+        Args:
+            url (str): server url, can contain credentials
+
+        Returns:
+            Server: CouchDB server
+        """
+        from pycouchdb import Server  # type: ignore[import-untyped]
+        from pycouchdb.resource import Resource  # type: ignore[import-untyped]
+
+        config = ConfigManager().config.database
+        timeout = config.request_timeout or None
+        server = Server(url, timeout=timeout)
+        session = self._get_session(server.base_url, server.resource.session.auth)
+        server.resource = Resource(server.base_url, session=session, timeout=timeout)
+        return server
+
+    def _get_session(self, base_url: str, auth: tuple | None) -> Session:
+        key = (base_url, auth)
+        with self._lock:
+            if key in self._sessions:
+                return self._sessions[key][0]
+            config = ConfigManager().config.database
+            adapter = _PoolAdapter(pool_maxsize=config.pool_size)
+            session = Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.auth = auth
+            session.headers.update(
+                {"accept": "application/json", "content-type": "application/json"},
+            )
+            if not config.keep_alive:
+                session.headers["connection"] = "close"
+            session.hooks["response"].append(self._count_request)
+            self._sessions[key] = (session, adapter)
+            return session
+
+    def _count_request(self, response: Response, **kwargs) -> None:  # noqa: ANN003, ARG002
+        with self._lock:
+            self._requests += 1
+
+
+def get_revision(db: Database, doc_id: str) -> str | None:
+    """Get the current document revision without reading the document.
+
+    Args:
+        db (Database): CouchDB database
+        doc_id (str): document ID
+
+    Returns:
+        str | None: document revision, None if the document does not exist
+    """
+    resource = db.resource(doc_id)
+    response = resource.session.head(resource.base_url, timeout=resource.timeout)
+    if response.status_code != HTTPStatus.OK:
+        return None
+    return response.headers["ETag"].strip('"')
+
+
+def get_changed_document(db: Database, doc_id: str, rev: str | None) -> dict | None:
+    """Get the document if its revision differs from the known one.
+
+    The request is conditional, so CouchDB answers with an empty
+    `304 Not Modified` response if the document was not changed.
+
+    Args:
+        db (Database): CouchDB database
+        doc_id (str): document ID
+        rev (str | None): known document revision, None reads the document
+
+    Returns:
+        dict | None: document, None if the document was not changed
+    """
+    if rev is None:
+        return db.get(doc_id)
+    resource = db.resource(doc_id)
+    response = resource.session.get(
+        resource.base_url,
+        headers={"If-None-Match": f'"{rev}"'},
+        timeout=resource.timeout,
+    )
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return None
+    if response.status_code == HTTPStatus.OK:
+        return response.json()
+    # raise the database exception for the error response
+    return db.get(doc_id)
+
+
+def wait_for_changes(
+    db: Database,
+    doc_ids: list[str],
+    since: str | None,
+    timeout: float,
+) -> str:
+    """Wait for changes of the documents with the longpoll changes feed.
+
+    CouchDB answers as soon as any of the documents is changed after the
+    sequence, so the waiting makes no requests while the documents are idle.
+
+    Args:
+        db (Database): CouchDB database
+        doc_ids (list[str]): document IDs
+        since (str | None): database sequence, None gets the current sequence
+            without waiting
+        timeout (float): maximum wait time in seconds
+
+    Returns:
+        str: database sequence of the last change
+    """
+    resource = db.resource("_changes")
+    params = {"filter": "_doc_ids", "doc_ids": json.dumps(doc_ids)}
+    if since is None:
+        params["since"] = "now"
+    else:
+        params.update(since=since, feed="longpoll", timeout=str(int(timeout * 1000)))
+    response = resource.session.get(
+        resource.base_url,
+        params=params,
+        # CouchDB closes the feed after the timeout
+        timeout=timeout + _CHANGES_TIMEOUT_MARGIN,
+    )
+    response.raise_for_status()
+    return response.json()["last_seq"]
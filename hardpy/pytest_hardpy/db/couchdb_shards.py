@@ -0,0 +1,288 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.sections import MODULE_LEVEL, get_section_path
+
+if TYPE_CHECKING:
+    from pycouchdb.client import Database  # type: ignore[import-untyped]
+
+SHARDS = "shards"
+SHARD = "shard"
+DATA = "data"
+
+
+class ShardedDocument:
+    """Store document split into CouchDB documents.
+
+    The header document has the store document ID and contains all
+    top-level fields except modules, and the `shards` field with
+    the module and test case IDs in the document order. Every module
+    header and every test case is stored in own shard document, so an
+    update rewrites only the changed shards and the replication traffic
+    does not grow with the run size.
+
+    Args:
+        db (Database): CouchDB database
+        doc_id (str): store document ID
+    """
+
+    def __init__(self, db: Database, doc_id: str) -> None:
+        self._db = db
+        self._doc_id = doc_id
+        self._log = getLogger(__name__)
+        self._revs: dict[str, str] = {}
+        self._shards: dict[str, list[str]] = {}
+        self._dirty: set[tuple[str, ...]] = set()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the document has changes that are not saved.
+
+        Returns:
+            bool: True if at least one shard was changed
+        """
+        return bool(self._dirty)
+
+    @property
+    def revision(self) -> frozenset[tuple[str, str]] | None:
+        """Get the revisions of the shards loaded or saved last.
+
+        Returns:
+            frozenset[tuple[str, str]] | None: shard IDs and revisions,
+                None if the document is not stored
+        """
+        return frozenset(self._revs.items()) if self._revs else None
+
+    def mark_dirty(self, key: str) -> None:
+        """Mark the shards that contain the key as changed.
+
+        Args:
+            key (str): Field key, supports nested access with dots
+        """
+        self._dirty.add(get_section_path(key))
+
+    def mark_all_dirty(self) -> None:
+        """Mark the whole document as changed."""
+        self._dirty.add(())
+
+    def load(self) -> dict | None:
+        """Read the header and all shards with a single request.
+
+        Returns:
+            dict | None: document, None if the document does not exist
+        """
+        rows = self._get_rows()
+        docs = {row["id"]: row["doc"] for row in rows if row.get("doc")}
+        self._revs = {doc_id: doc["_rev"] for doc_id, doc in docs.items()}
+        self._dirty.clear()
+        header = docs.get(self._doc_id)
+        if header is None:
+            self._shards = {}
+            return None
+        if SHARDS not in header:
+            # the document is stored in the single document layout
+            self._shards = {}
+            self.mark_all_dirty()
+            return header
+
+        doc = {key: value for key, value in header.items() if key != SHARDS}
+        self._shards = header[SHARDS]
+        modules = {}
+        for module_id, case_ids in self._shards.items():
+            module_shard = docs.get(self._get_shard_id(module_id))
+            module = module_shard[DATA] if module_shard else {}
+            cases = {}
+            for case_id in case_ids:
+                case_shard = docs.get(self._get_shard_id(module_id, case_id))
+                if case_shard:
+                    cases[case_id] = case_shard[DATA]
+            module[DF.CASES] = cases
+            modules[module_id] = module
+        doc[DF.MODULES] = modules
+        return doc
+
+    def has_changed(self) -> bool:
+        """Check if any shard was changed since the last load or save.
+
+        Only the shard revisions are requested, the shards are not read.
+
+        Returns:
+            bool: True if a shard was added, changed or deleted
+        """
+        rows = self._get_rows(include_docs="false")
+        revs = {row["id"]: row["value"]["rev"] for row in rows}
+        return revs != self._revs
+
+    def save(self, doc: dict) -> None:
+        """Write the changed shards with a single bulk request.
+
+        Args:
+            doc (dict): document, the header revision is updated in place
+        """
+        if not self._dirty:
+            return
+        modules = doc.get(DF.MODULES)
+        if not isinstance(modules, dict):
+            modules = {}
+        shards = {
+            module_id: list(module.get(DF.CASES, {}))
+            for module_id, module in modules.items()
+            if isinstance(module, dict)
+        }
+
+        docs: dict[str, dict] = {}
+        is_full = () in self._dirty or (DF.MODULES,) in self._dirty
+        if is_full:
+            for module_id, module in modules.items():
+                if isinstance(module, dict):
+                    self._add_module(docs, module_id, module, with_cases=True)
+        else:
+            self._add_changed(docs, modules)
+
+        is_header_changed = (
+            is_full
+            or shards != self._shards
+            or any(len(path) == 1 for path in self._dirty)
+        )
+        if is_header_changed:
+            header = {
+                key: value
+                for key, value in doc.items()
+                if key not in {DF.MODULES, "_rev"}
+            }
+            header["_id"] = self._doc_id
+            header[SHARDS] = shards
+            docs[self._doc_id] = header
+        if shards != self._shards:
+            self._add_deleted(docs, shards)
+
+        self._save_bulk(list(docs.values()))
+        self._shards = shards
+        self._dirty.clear()
+        if self._doc_id in self._revs:
+            doc["_rev"] = self._revs[self._doc_id]
+
+    def delete(self) -> None:
+        """Delete the header and all shards."""
+        self.load()
+        deleted = [
+            {"_id": doc_id, "_rev": rev, "_deleted": True}
+            for doc_id, rev in self._revs.items()
+        ]
+        if deleted:
+            self._db.delete_bulk(deleted, transaction=False)
+        self._revs.clear()
+        self._shards = {}
+        self._dirty.clear()
+
+    def _add_changed(self, docs: dict[str, dict], modules: dict) -> None:
+        for path in self._dirty:
+            if len(path) == 1:
+                continue
+            module = modules.get(path[1])
+            if not isinstance(module, dict):
+                continue
+            if len(path) == MODULE_LEVEL:
+                self._add_module(docs, path[1], module, with_cases=False)
+            elif path[-1] == DF.CASES:
+                self._add_module(docs, path[1], module, with_cases=True)
+            elif path[3] in module.get(DF.CASES, {}):
+                self._add_case(docs, path[1], path[3], module[DF.CASES][path[3]])
+
+    def _add_module(
+        self,
+        docs: dict[str, dict],
+        module_id: str,
+        module: dict,
+        with_cases: bool,
+    ) -> None:
+        # keep the cases field position, the cases are stored in own shards
+        data = {key: {} if key == DF.CASES else value for key, value in module.items()}
+        shard_id = self._get_shard_id(module_id)
+        docs[shard_id] = {
+            "_id": shard_id,
+            SHARD: {"doc_id": self._doc_id, "module_id": module_id},
+            DATA: data,
+        }
+        if with_cases:
+            for case_id, case in module.get(DF.CASES, {}).items():
+                self._add_case(docs, module_id, case_id, case)
+
+    def _add_case(
+        self,
+        docs: dict[str, dict],
+        module_id: str,
+        case_id: str,
+        case: Any,  # noqa: ANN401
+    ) -> None:
+        shard_id = self._get_shard_id(module_id, case_id)
+        docs[shard_id] = {
+            "_id": shard_id,
+            SHARD: {"doc_id": self._doc_id, "module_id": module_id, "case_id": case_id},
+            DATA: case,
+        }
+
+    def _add_deleted(self, docs: dict[str, dict], shards: dict[str, list[str]]) -> None:
+        shard_ids = {self._doc_id}
+        for module_id, case_ids in shards.items():
+            shard_ids.add(self._get_shard_id(module_id))
+            shard_ids.update(
+                self._get_shard_id(module_id, case_id) for case_id in case_ids
+            )
+        for doc_id in self._revs.keys() - shard_ids:
+            docs[doc_id] = {"_id": doc_id, "_deleted": True}
+
+    def _save_bulk(self, docs: list[dict]) -> None:
+        from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
+
+        for doc in docs:
+            if doc["_id"] in self._revs:
+                doc["_rev"] = self._revs[doc["_id"]]
+        try:
+            saved = self._db.save_bulk(docs, transaction=False)
+        except Conflict:
+            # the shards were changed by another process, the last writer wins
+            self._log.debug("Conflict saving document shards, retrying")
+            self._update_revs([doc["_id"] for doc in docs])
+            for doc in docs:
+                doc.pop("_rev", None)
+                if doc["_id"] in self._revs:
+                    doc["_rev"] = self._revs[doc["_id"]]
+            saved = self._db.save_bulk(docs, transaction=False)
+        for doc in saved:
+            if doc.get("_deleted"):
+                self._revs.pop(doc["_id"], None)
+            elif "_rev" in doc:
+                self._revs[doc["_id"]] = doc["_rev"]
+
+    def _update_revs(self, doc_ids: list[str]) -> None:
+        rows = self._db.all(keys=doc_ids, include_docs="false", as_list=True)
+        for row in rows:
+            value = row.get("value")
+            if value and not value.get("deleted"):
+                self._revs[row["id"]] = value["rev"]
+            else:
+                self._revs.pop(row["key"], None)
+
+    def _get_rows(self, **kwargs: str) -> list[dict]:
+        # the header and shard IDs are a continuous range of the document IDs
+        rows = self._db.all(
+            startkey=self._doc_id,
+            endkey=f"{self._doc_id}:\ufff0",
+            as_list=True,
+            **kwargs,
+        )
+        return [row for row in rows if self._is_own_id(row["id"])]
+
+    def _get_shard_id(self, module_id: str, case_id: str | None = None) -> str:
+        if case_id is None:
+            return f"{self._doc_id}:{module_id}"
+        return f"{self._doc_id}:{module_id}:{case_id}"
+
+    def _is_own_id(self, doc_id: str) -> bool:
+        return doc_id == self._doc_id or doc_id.startswith(f"{self._doc_id}:")
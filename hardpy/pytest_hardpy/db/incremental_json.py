@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from typing import Any
+
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.json_codec import JsonCodec, get_codec
+from hardpy.pytest_hardpy.db.sections import (
+    CASES_LEVEL,
+    CASE_LEVEL,
+    MODULE_LEVEL,
+    get_section_path,
+)
+
+
+class IncrementalJsonEncoder:
+    """Store document encoder with dirty-path tracking.
+
+    The document is split into sections: every top-level field, every
+    module header and every test case. Encoded sections are cached and
+    only the sections touched by a changed key path are encoded again.
+    The result is identical to the codec encoding of the whole document.
+
+    Args:
+        codec (JsonCodec | None): JSON codec, the configured one by default
+    """
+
+    def __init__(self, codec: JsonCodec | None = None) -> None:
+        self._codec = codec if codec is not None else get_codec()
+        self._indent = self._codec.indent
+        self._fields: dict[str, str] = {}
+        self._modules: dict[str, str] = {}
+        self._cases: dict[tuple[str, str], str] = {}
+        self._dirty: set[tuple[str, ...]] = set()
+        self.mark_all_dirty()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the document has changes that are not flushed.
+
+        Returns:
+            bool: True if at least one key path was changed
+        """
+        return bool(self._dirty)
+
+    @property
+    def dirty_paths(self) -> set[tuple[str, ...]]:
+        """Get changed section paths.
+
+        Returns:
+            set[tuple[str, ...]]: changed section paths
+        """
+        return set(self._dirty)
+
+    def mark_dirty(self, key: str) -> None:
+        """Mark the document section that contains the key as changed.
+
+        Args:
+            key (str): Field key, supports nested access with dots
+        """
+        path = get_section_path(key)
+        self._dirty.add(path)
+        self._fields.pop(path[0], None)
+        if len(path) == 1:
+            if path[0] == DF.MODULES:
+                self._modules.clear()
+                self._cases.clear()
+            return
+
+        module_id = path[1]
+        self._modules.pop(module_id, None)
+        if len(path) == CASE_LEVEL:
+            self._cases.pop((module_id, path[3]), None)
+        elif len(path) == CASES_LEVEL:
+            self._drop_module_cases(module_id)
+
+    def mark_all_dirty(self) -> None:
+        """Mark the whole document as changed and drop all cached sections."""
+        self.reset()
+        self._dirty.add(())
+
+    def mark_clean(self) -> None:
+        """Mark the document as flushed, keeping cached sections."""
+        self._dirty.clear()
+
+    def reset(self) -> None:
+        """Drop all cached sections, i.e. after the document was reloaded."""
+        self._fields.clear()
+        self._modules.clear()
+        self._cases.clear()
+        self._dirty.clear()
+
+    def dumps(self, doc: dict) -> str:
+        """Encode the document, reusing cached sections.
+
+        Args:
+            doc (dict): store document
+
+        Returns:
+            str: encoded document
+        """
+        items = []
+        for key, value in doc.items():
+            fragment = self._fields.get(key)
+            if fragment is None:
+                if key == DF.MODULES and isinstance(value, dict):
+                    fragment = self._encode_modules(value)
+                else:
+                    fragment = self._encode(value, 1)
+                self._fields[key] = fragment
+            items.append((key, fragment))
+        return self._join(items, 0)
+
+    def _encode_modules(self, modules: dict) -> str:
+        items = []
+        for module_id, module in modules.items():
+            fragment = self._modules.get(module_id)
+            if fragment is None:
+                if isinstance(module, dict):
+                    fragment = self._encode_module(module_id, module)
+                else:
+                    fragment = self._encode(module, MODULE_LEVEL)
+                self._modules[module_id] = fragment
+            items.append((module_id, fragment))
+        return self._join(items, 1)
+
+    def _encode_module(self, module_id: str, module: dict) -> str:
+        items = []
+        for key, value in module.items():
+            if key == DF.CASES and isinstance(value, dict):
+                cases = []
+                for case_id, case in value.items():
+                    fragment = self._cases.get((module_id, case_id))
+                    if fragment is None:
+                        fragment = self._encode(case, CASE_LEVEL)
+                        self._cases[(module_id, case_id)] = fragment
+                    cases.append((case_id, fragment))
+                items.append((key, self._join(cases, CASES_LEVEL)))
+            else:
+                items.append((key, self._encode(value, CASES_LEVEL)))
+        return self._join(items, MODULE_LEVEL)
+
+    def _drop_module_cases(self, module_id: str) -> None:
+        for case_key in [key for key in self._cases if key[0] == module_id]:
+            del self._cases[case_key]
+
+    def _encode(self, value: Any, level: int) -> str:  # noqa: ANN401
+        fragment = self._codec.dumps(value)
+        if self._indent is None:
+            return fragment
+        return fragment.replace("\n", "\n" + " " * self._indent * level)
+
+    def _join(self, items: list[tuple[str, str]], level: int) -> str:
+        if not items:
+            return "{}"
+        dumps = self._codec.dumps
+        if self._indent is None:
+            body = ",".join(f"{dumps(key)}:{fragment}" for key, fragment in items)
+            return "{" + body + "}"
+        inner_indent = "\n" + " " * self._indent * (level + 1)
+        body = ",".join(
+            f"{inner_indent}{dumps(key)}: {fragment}" for key, fragment in items
+        )
+        return "{" + body + "\n" + " " * self._indent * level + "}"
@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+import os
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from hardpy.pytest_hardpy.db.json_codec import JsonCodec, get_codec
+from hardpy.pytest_hardpy.db.key_path import set_value
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+PATH_KEY = "path"
+VALUE_KEY = "value"
+
+
+class JsonJournal:
+    """Append-only journal of document changes.
+
+    The document is stored as a JSON snapshot and a JSON Lines journal
+    next to it. Each journal line is a change record with the key path
+    and the new value. The document is the snapshot with all journal
+    records applied in order.
+
+    Args:
+        snapshot_path (Path): document snapshot file path
+        fsync (bool): if True, flush the journal to the disk after every append
+        codec (JsonCodec | None): JSON codec, the configured one by default
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        fsync: bool = False,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        self._snapshot_path = snapshot_path
+        self._codec = codec if codec is not None else get_codec()
+        self._journal_path = snapshot_path.with_suffix(".jsonl")
+        self._fsync = fsync
+        self._snapshot_stat: tuple[int, int, int] | None = None
+        self._offset = 0
+        self._log = getLogger(__name__)
+
+    @property
+    def journal_path(self) -> Path:
+        """Get journal file path.
+
+        Returns:
+            Path: journal file path
+        """
+        return self._journal_path
+
+    @property
+    def position(self) -> tuple[tuple[int, int, int] | None, int]:
+        """Get the position of the document read last.
+
+        Returns:
+            tuple[tuple[int, int, int] | None, int]: snapshot file stat
+                and the journal offset
+        """
+        return self._snapshot_stat, self._offset
+
+    def has_changed(self) -> bool:
+        """Check if the snapshot or the journal changed since the last read.
+
+        Only the file status is checked, the files are not read.
+
+        Returns:
+            bool: True if the document must be read again
+        """
+        return (
+            self._snapshot_stat != self._get_snapshot_stat()
+            or self._get_journal_size() != self._offset
+        )
+
+    def load(self) -> dict:
+        """Read the snapshot and apply the whole journal.
+
+        Returns:
+            dict: document
+
+        Raises:
+            FileNotFoundError: if the snapshot does not exist
+            json.JSONDecodeError: if the snapshot is corrupted
+        """
+        stat = self._get_snapshot_stat()
+        doc = self._codec.loads(self._snapshot_path.read_bytes())
+        self._snapshot_stat = stat
+        self._offset = 0
+        self._apply_journal(doc)
+        return doc
+
+    def read(self, doc: dict | None) -> dict:
+        """Bring the document up to date with the storage.
+
+        Only the journal records appended since the previous call are
+        applied. The document is read from scratch if it is not loaded yet
+        or the snapshot was replaced, i.e. after compaction.
+
+        Args:
+            doc (dict | None): document returned by the previous call
+
+        Returns:
+            dict: actual document
+        """
+        journal_size = self._get_journal_size()
+        if (
+            doc is None
+            or self._snapshot_stat != self._get_snapshot_stat()
+            or journal_size < self._offset
+        ):
+            return self.load()
+        if journal_size > self._offset:
+            self._apply_journal(doc)
+        return doc
+
+    def append(self, changes: Iterable[tuple[str, Any]]) -> int:
+        """Append change records to the journal.
+
+        Args:
+            changes (Iterable[tuple[str, Any]]): key paths and new values
+
+        Returns:
+            int: number of written bytes
+        """
+        data = "".join(
+            self._codec.dumps({PATH_KEY: key, VALUE_KEY: value}, compact=True) + "\n"
+            for key, value in changes
+        )
+        if not data:
+            return 0
+        encoded = data.encode("utf-8")
+        # a single unbuffered write in the append mode keeps records of
+        # several processes from interleaving
+        with self._journal_path.open("ab", buffering=0) as f:
+            size = f.write(encoded)
+            end = os.lseek(f.fileno(), 0, os.SEEK_CUR)
+            if self._fsync:
+                os.fsync(f.fileno())
+        # the own records are not read again if no other process appended
+        # records since the last read
+        if end - size == self._offset:
+            self._offset = end
+        return size
+
+    def write_snapshot(self, data: str) -> int:
+        """Replace the snapshot and truncate the journal.
+
+        Args:
+            data (str): encoded document
+
+        Returns:
+            int: number of written bytes
+        """
+        temp_file = self._snapshot_path.with_suffix(".tmp")
+        try:
+            with temp_file.open("w", encoding="utf-8") as f:
+                size = f.write(data)
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            temp_file.replace(self._snapshot_path)
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+        with self._journal_path.open("w"):
+            pass
+        self._snapshot_stat = self._get_snapshot_stat()
+        self._offset = 0
+        return size
+
+    def _apply_journal(self, doc: dict) -> None:
+        try:
+            with self._journal_path.open("r", encoding="utf-8") as f:
+                f.seek(self._offset)
+                for line in iter(f.readline, ""):
+                    if not line.endswith("\n"):
+                        # the record is being written right now
+                        break
+                    self._offset = f.tell()
+                    try:
+                        record = self._codec.loads(line)
+                    except json.JSONDecodeError:
+                        self._log.warning(
+                            f"Skip corrupted record in {self._journal_path}",
+                        )
+                        continue
+                    set_value(doc, record[PATH_KEY], record[VALUE_KEY])
+        except FileNotFoundError:
+            self._offset = 0
+
+    def _get_snapshot_stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self._snapshot_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _get_journal_size(self) -> int:
+        try:
+            return self._journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from logging import getLogger
+from typing import Any
+
+from hardpy.common.config import ConfigManager, JsonCodecType
+
+STDLIB_INDENT = 2
+
+
+class JsonCodec(ABC):
+    """JSON encoder and decoder of the store documents and reports.
+
+    The documents are encoded with the codec indent, the records that must
+    fit a single line, i.e. journal records and database rows, are encoded
+    without the indent. Values that are not JSON-serializable are encoded
+    as strings. Decoding errors are raised as `json.JSONDecodeError`.
+    """
+
+    indent: int | None = None
+
+    @abstractmethod
+    def dumps(self, obj: Any, compact: bool = False) -> str:  # noqa: ANN401
+        """Encode the object.
+
+        Args:
+            obj (Any): object to encode
+            compact (bool): if True, encode without the indent and line breaks
+
+        Returns:
+            str: encoded object
+        """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode the object.
+
+        Args:
+            data (str | bytes): encoded object
+
+        Returns:
+            Any: decoded object
+        """
+
+
+class StdlibCodec(JsonCodec):
+    """Standard library JSON codec.
+
+    Args:
+        indent (int | None): document indent, None for compact documents
+    """
+
+    def __init__(self, indent: int | None = STDLIB_INDENT) -> None:
+        self.indent = indent
+
+    def dumps(self, obj: Any, compact: bool = False) -> str:  # noqa: ANN401, D102
+        if compact or self.indent is None:
+            return json.dumps(obj, separators=(",", ":"), default=str)
+        return json.dumps(obj, indent=self.indent, default=str)
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401, D102
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec, the documents are compact."""
+
+    def __init__(self) -> None:
+        import orjson  # type: ignore[import-not-found]
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, compact: bool = False) -> str:  # noqa: ANN401, ARG002, D102
+        return self._orjson.dumps(obj, default=str, option=self._option).decode()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401, D102
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec codec, the documents are compact."""
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any, compact: bool = False) -> str:  # noqa: ANN401, ARG002, D102
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401, D102
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise json.JSONDecodeError(str(exc), "", 0) from exc
+
+
+_codecs: dict[JsonCodecType, JsonCodec] = {}
+
+
+def get_codec() -> JsonCodec:
+    """Get the JSON codec selected in the database configuration.
+
+    If the accelerator library of the selected codec is not installed,
+    the compact standard library codec is used.
+
+    Returns:
+        JsonCodec: JSON codec
+    """
+    codec_type = ConfigManager().config.database.json_codec
+    codec = _codecs.get(codec_type)
+    if codec is None:
+        codec = _codecs[codec_type] = _create_codec(codec_type)
+    return codec
+
+
+def _create_codec(codec_type: JsonCodecType) -> JsonCodec:
+    if codec_type == JsonCodecType.STDLIB:
+        return StdlibCodec()
+    if codec_type == JsonCodecType.COMPACT:
+        return StdlibCodec(indent=None)
+    try:
+        if codec_type == JsonCodecType.ORJSON:
+            return OrjsonCodec()
+        return MsgspecCodec()
+    except ImportError:
+        getLogger(__name__).warning(
+            f"JSON codec {codec_type.value} is not installed "
+            "(pip install hardpy[fast-json]), "
+            "the compact standard library codec is used",
+        )
+        return StdlibCodec(indent=None)
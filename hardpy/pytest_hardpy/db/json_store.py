@@ -0,0 +1,372 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from logging import Logger, getLogger
+from pathlib import Path
+from time import time_ns
+from typing import TYPE_CHECKING, Any
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.incremental_json import IncrementalJsonEncoder
+from hardpy.pytest_hardpy.db.journal import JsonJournal
+from hardpy.pytest_hardpy.db.json_codec import JsonCodec, get_codec
+from hardpy.pytest_hardpy.db.json_value import to_json_value
+from hardpy.pytest_hardpy.db.key_path import get_value, set_value
+from hardpy.pytest_hardpy.db.model_cache import ModelCache
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Hashable
+
+    from pydantic import BaseModel
+
+    from hardpy.pytest_hardpy.db.model_cache import DocumentView
+
+# the file modified within this time may be modified again without
+# changing its modification time on the file systems with coarse timestamps
+_RACY_INTERVAL_NS = 2_000_000_000
+
+
+class JsonStoreMixin(ABC):
+    """JSON file storage of the runstore and statestore.
+
+    The store class calls `_init_store` in its constructor and provides
+    the default document with `_create_default_doc`.
+    """
+
+    _store_name: str
+    _storage_dir: Path
+    _doc_id: str
+    _file_path: Path
+    _log: Logger
+    _schema: type[BaseModel]
+    _model_cache: ModelCache
+    _codec: JsonCodec
+    _encoder: IncrementalJsonEncoder
+    _file_stat: tuple[int, int, int] | None
+    _content_hash: bytes | None
+    _is_racy: bool
+    _last_flush_size: int
+    _doc: dict
+
+    def _init_store(self, store_name: str, schema: type[BaseModel]) -> None:
+        config_manager = ConfigManager()
+        self._store_name = store_name
+        config_storage_path = Path(config_manager.config.database.storage_path)
+        if config_storage_path.is_absolute():
+            self._storage_dir = config_storage_path / "storage" / self._store_name
+        else:
+            self._storage_dir = Path(
+                config_manager.tests_path
+                / config_manager.config.database.storage_path
+                / "storage"
+                / self._store_name,
+            )
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        self._doc_id = config_manager.config.database.doc_id
+        self._file_path = self._storage_dir / f"{self._doc_id}.json"
+        self._log = getLogger(self.__module__)
+        self._schema = schema
+        self._model_cache = ModelCache(self._schema)
+        self._codec = get_codec()
+        self._encoder = IncrementalJsonEncoder(self._codec)
+        self._file_stat = None
+        self._content_hash = None
+        self._is_racy = False
+        self._last_flush_size = 0
+        self._doc = self._init_doc()
+
+    @property
+    def last_flush_size(self) -> int:
+        """Get the number of bytes written by the last flush.
+
+        Returns:
+            int: written bytes, 0 if the last flush was skipped
+        """
+        return self._last_flush_size
+
+    def get_field(self, key: str) -> Any:  # noqa: ANN401
+        """Get field value from document using dot notation.
+
+        Args:
+            key (str): Field key, supports nested access with dots
+
+        Returns:
+            Any: Field value, or None if path does not exist
+        """
+        try:
+            return get_value(self._doc, key)
+        except KeyError:
+            return None
+
+    def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Update document value in memory (does not persist).
+
+        Args:
+            key (str): Field key, supports nested access with dots
+            value (Any): Value to set
+        """
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        self._encoder.mark_dirty(key)
+
+    def update_db(self) -> None:
+        """Persist in-memory document to JSON file with atomic write.
+
+        The write is skipped if the document was not changed since the last
+        flush, and only the changed module and case sections are encoded again.
+        """
+        if not self._encoder.is_dirty and self._file_path.exists():
+            self._last_flush_size = 0
+            return
+
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self._file_path.with_suffix(".tmp")
+
+        try:
+            data = self._encoder.dumps(self._doc).encode("utf-8")
+            self._last_flush_size = temp_file.write_bytes(data)
+            temp_file.replace(self._file_path)
+            stat = self._file_path.stat()
+        except Exception as exc:
+            self._log.error(f"Error writing to storage file: {exc}")
+            if temp_file.exists():
+                temp_file.unlink()
+            self._encoder.mark_all_dirty()
+            raise
+        self._encoder.mark_clean()
+        # the written file is not read again by the next reload
+        self._file_stat = _get_file_stat(stat)
+        self._is_racy = _is_racy(stat)
+        self._content_hash = _get_hash(data) if self._is_racy else None
+        self._log.debug(f"Flushed {self._last_flush_size} bytes to {self._file_path}")
+
+    def update_doc(self) -> None:
+        """Reload document from JSON file to memory if it was changed.
+
+        The file is not read if its status is not changed since the last
+        reload. The content hash is compared only if the file was modified
+        too recently to rely on its modification time.
+        Changes that are not flushed are discarded.
+        """
+        try:
+            stat = self._file_path.stat()
+        except FileNotFoundError:
+            self._file_stat = None
+            return
+        file_stat = _get_file_stat(stat)
+        is_unchanged = file_stat == self._file_stat and not self._encoder.is_dirty
+        if is_unchanged and not self._is_racy:
+            return
+        try:
+            data = self._file_path.read_bytes()
+            is_racy = _is_racy(stat)
+            content_hash = _get_hash(data) if is_racy or is_unchanged else None
+            if is_unchanged and content_hash == self._content_hash:
+                self._is_racy = is_racy
+                return
+            self._file_stat = None
+            self._doc = self._codec.loads(data)
+            self._file_stat = file_stat
+            self._content_hash = content_hash
+            self._is_racy = is_racy
+            self._encoder.reset()
+        except json.JSONDecodeError as exc:
+            # the corrupted file is not read again until it is changed
+            self._file_stat = file_stat
+            self._log.error(f"Error reading storage file: {exc}")
+        except Exception as exc:
+            self._log.error(f"Error reading storage file: {exc}")
+            raise
+
+    def get_document(self) -> BaseModel:
+        """Get full document with schema validation.
+
+        The validated model is cached until the stored document is changed.
+
+        Returns:
+            BaseModel: Validated document model
+        """
+        self.update_doc()
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
+
+    def clear(self) -> None:
+        """Clear storage by resetting to initial state (in-memory only)."""
+        self._doc = self._create_default_doc(self._doc_id)
+        self._encoder.mark_all_dirty()
+
+    def compact(self) -> None:  # noqa: B027
+        """Optimize storage (no-op for JSON file storage)."""
+
+    @abstractmethod
+    def _create_default_doc(self, doc_id: str) -> dict:
+        """Create the default document with the given document id."""
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the file status and the content hash of the loaded document."""
+        if self._encoder.is_dirty or self._file_stat is None:
+            return None
+        return self._file_stat, self._content_hash
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        if self._file_path.exists():
+            try:
+                doc = self._read_file()
+            except json.JSONDecodeError:
+                self._log.warning(
+                    f"Corrupted storage file {self._file_path}, creating new",
+                )
+            except Exception as exc:  # noqa: BLE001
+                self._log.warning(f"Error loading storage file: {exc}, creating new")
+            else:
+                if DF.MODULES not in doc:
+                    doc[DF.MODULES] = {}
+
+                return doc
+
+        return self._create_default_doc(self._doc_id)
+
+    def _read_file(self) -> dict:
+        """Read document from JSON file."""
+        return self._codec.loads(self._file_path.read_bytes())
+
+
+class JournalStoreMixin(JsonStoreMixin):
+    """JSON journal storage of the runstore and statestore.
+
+    Appends document changes to a JSON Lines journal next to the JSON
+    snapshot instead of rewriting the whole file on every update.
+    The snapshot is rewritten only on compaction.
+
+    The mixin is placed before the JSON store class in the bases.
+    """
+
+    _journal: JsonJournal
+
+    def __init__(self) -> None:
+        self._changes: dict[str, Any] = {}
+        self._needs_snapshot = False
+        super().__init__()
+
+    def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Update document value in memory (does not persist).
+
+        Args:
+            key (str): Field key, supports nested access with dots
+            value (Any): Value to set
+        """
+        super().update_doc_value(key, value)
+        # keep the order of the last changes
+        self._changes.pop(key, None)
+        self._changes[key] = self.get_field(key)
+
+    def update_db(self) -> None:
+        """Append changes made since the last flush to the journal.
+
+        The snapshot is written instead if it does not exist yet
+        or the document was cleared.
+        """
+        if self._needs_snapshot or not self._file_path.exists():
+            self._write_snapshot()
+            return
+
+        try:
+            self._last_flush_size = self._journal.append(self._changes.items())
+        except Exception as exc:
+            self._log.error(f"Error writing to journal file: {exc}")
+            raise
+        self._changes.clear()
+        self._log.debug(
+            f"Flushed {self._last_flush_size} bytes to {self._journal.journal_path}",
+        )
+
+    def update_doc(self) -> None:
+        """Apply journal records appended since the last reload.
+
+        Changes that are not flushed are discarded as the document
+        is read from scratch.
+        """
+        if not self._file_path.exists():
+            return
+        try:
+            if self._changes or self._needs_snapshot:
+                self._doc = self._journal.load()
+                self._changes.clear()
+                self._needs_snapshot = False
+            else:
+                self._doc = self._journal.read(self._doc)
+            self._encoder.reset()
+        except json.JSONDecodeError as exc:
+            self._log.error(f"Error reading storage file: {exc}")
+        except Exception as exc:
+            self._log.error(f"Error reading storage file: {exc}")
+            raise
+
+    def clear(self) -> None:
+        """Clear storage by resetting to initial state (in-memory only)."""
+        super().clear()
+        self._changes.clear()
+        self._needs_snapshot = True
+
+    def compact(self) -> None:
+        """Write the document snapshot and truncate the journal."""
+        self.update_db()
+        self.update_doc()
+        self._write_snapshot()
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the journal position of the loaded document."""
+        if self._changes or self._needs_snapshot:
+            return None
+        return self._journal.position
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        fsync = ConfigManager().config.database.journal_fsync
+        self._journal = JsonJournal(self._file_path, fsync=fsync, codec=self._codec)
+        return super()._init_doc()
+
+    def _read_file(self) -> dict:
+        """Read the snapshot and apply the journal."""
+        return self._journal.load()
+
+    def _write_snapshot(self) -> None:
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            data = self._encoder.dumps(self._doc)
+            self._last_flush_size = self._journal.write_snapshot(data)
+        except Exception as exc:
+            self._log.error(f"Error writing to storage file: {exc}")
+            self._encoder.mark_all_dirty()
+            raise
+        self._encoder.mark_clean()
+        self._changes.clear()
+        self._needs_snapshot = False
+        self._log.debug(f"Flushed {self._last_flush_size} bytes to {self._file_path}")
+
+
+def _get_file_stat(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _get_hash(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _is_racy(stat: os.stat_result) -> bool:
+    return time_ns() - stat.st_mtime_ns < _RACY_INTERVAL_NS
@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from functools import singledispatch
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_converters: dict[type, Callable[[Any], Any]] = {}
+
+
+def to_json_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert the value to the JSON-serializable value.
+
+    The conversion is dispatched by the value type, the converter is
+    cached for every type. Values of the JSON types are returned as is
+    without copying, containers are copied only if an item is converted.
+    Sequences are converted to lists, numpy scalars and arrays to Python
+    numbers and lists, other types to their string representation.
+
+    Args:
+        value (Any): value to convert
+
+    Returns:
+        Any: JSON-serializable value
+    """
+    cls = type(value)
+    if cls in _SCALAR_TYPES:
+        return value
+    converter = _converters.get(cls)
+    if converter is None:
+        converter = _converters[cls] = _convert.dispatch(cls)
+    return converter(value)
+
+
+@singledispatch
+def _convert(value: Any) -> Any:  # noqa: ANN401
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist):
+        # numpy scalar or array
+        return to_json_value(tolist())
+    return str(value)
+
+
+@_convert.register(str)
+@_convert.register(int)
+@_convert.register(float)
+def _convert_scalar(value: str | float) -> str | float:
+    # subclasses like enums are serialized by the base type
+    return value
+
+
+@_convert.register(date)
+@_convert.register(time)
+@_convert.register(timedelta)
+@_convert.register(PurePath)
+def _convert_to_str(value: date | time | timedelta | PurePath) -> str:
+    return str(value)
+
+
+@_convert.register(dict)
+def _convert_dict(value: dict) -> dict:
+    result = None
+    for key, item in value.items():
+        new_key = key if type(key) in _SCALAR_TYPES else _convert_key(key)
+        new_item = to_json_value(item)
+        if result is None and (new_key is not key or new_item is not item):
+            result = dict(value)
+        if result is not None:
+            if new_key is not key:
+                del result[key]
+            result[new_key] = new_item
+    return value if result is None else result
+
+
+@_convert.register(list)
+def _convert_list(value: list) -> list:
+    if all(type(item) in _SCALAR_TYPES for item in value):
+        return value
+    return [to_json_value(item) for item in value]
+
+
+@_convert.register(tuple)
+@_convert.register(set)
+@_convert.register(frozenset)
+def _convert_sequence(value: tuple | set | frozenset) -> list:
+    return _convert_list(list(value))
+
+
+def _convert_key(key: Any) -> str | float | None:  # noqa: ANN401
+    if isinstance(key, (str, int, float)):
+        return key
+    return str(key)
@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+# the keys are built from the document fields, module and case IDs,
+# so the number of distinct keys is bounded by the test plan size
+KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def parse_key(key: str) -> tuple[str, ...]:
+    """Split the dotted key into the path parts.
+
+    Args:
+        key (str): Field key, supports nested access with dots
+
+    Returns:
+        tuple[str, ...]: key path parts
+    """
+    return tuple(key.split("."))
+
+
+def get_value(doc: dict, key: str) -> Any:  # noqa: ANN401
+    """Get the value from the document by the dotted key.
+
+    Args:
+        doc (dict): document
+        key (str): Field key, supports nested access with dots,
+            list items are accessed by index
+
+    Returns:
+        Any: Field value
+
+    Raises:
+        KeyError: if the path does not exist
+    """
+    node: Any = doc
+    try:
+        for part in parse_key(key):
+            node = node[int(part)] if isinstance(node, list) else node[part]
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        raise KeyError(key) from exc
+    return node
+
+
+def set_value(doc: dict, key: str, value: Any) -> None:  # noqa: ANN401
+    """Set the value in the document by the dotted key.
+
+    The missing intermediate fields are created as dictionaries.
+
+    Args:
+        doc (dict): document
+        key (str): Field key, supports nested access with dots,
+            list items are accessed by index
+        value (Any): Value to set
+
+    Raises:
+        KeyError: if an intermediate field is not a container
+    """
+    *parents, last = parse_key(key)
+    node: Any = doc
+    try:
+        for part in parents:
+            if isinstance(node, list):
+                node = node[int(part)]
+            elif part in node:
+                node = node[part]
+            else:
+                child: dict = {}
+                node[part] = child
+                node = child
+        if isinstance(node, list):
+            node[int(last)] = value
+        else:
+            node[last] = value
+    except (AttributeError, IndexError, TypeError, ValueError) as exc:
+        raise KeyError(key) from exc
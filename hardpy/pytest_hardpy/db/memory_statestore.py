@@ -0,0 +1,188 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import copy
+import os
+import secrets
+import tempfile
+from logging import getLogger
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from platform import system
+from threading import Condition, Lock, Thread
+from typing import Any
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.key_path import set_value
+
+AUTHKEY_ENV = "HARDPY_STATESTORE_AUTHKEY"
+
+GET = "get"
+UPDATE = "update"
+REPLACE = "replace"
+WAIT = "wait"
+
+
+def get_address() -> str:
+    """Get the statestore server address.
+
+    Returns:
+        str: Unix socket path or Windows named pipe name
+    """
+    doc_id = ConfigManager().config.database.doc_id
+    name = f"hardpy-statestore-{doc_id}"
+    if system() == "Windows":
+        return rf"\\.\pipe\{name}"
+    return str(Path(tempfile.gettempdir()) / f"{name}.sock")
+
+
+def connect() -> Connection:
+    """Connect to the statestore server of the operator panel.
+
+    Returns:
+        Connection: server connection
+
+    Raises:
+        ConnectionError: if the server is not running
+    """
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if authkey is None:
+        msg = "Statestore server is not running"
+        raise ConnectionError(msg)
+    try:
+        return Client(get_address(), authkey=bytes.fromhex(authkey))
+    except (OSError, AuthenticationError) as exc:
+        msg = f"Error connecting to statestore server: {exc}"
+        raise ConnectionError(msg) from exc
+
+
+class StateStoreServer:
+    """In-memory statestore hosted by the operator panel process.
+
+    The statestore is the operator panel state only, so it is kept
+    in memory and the pytest process pushes the changed key paths over
+    a local connection instead of writing them to the database.
+    Every change increments the document version, and clients receive
+    the document only if their version is out of date or wait
+    for the version change.
+    """
+
+    def __init__(self) -> None:
+        self._address = get_address()
+        self._authkey = secrets.token_bytes(32)
+        self._log = getLogger(__name__)
+        self._lock = Lock()
+        self._changed = Condition(self._lock)
+        self._doc: dict | None = None
+        self._version = 0
+        self._snapshot: tuple[int, dict | None] = (0, None)
+        self._listener: Listener | None = None
+
+    def start(self) -> None:
+        """Start accepting connections in the background thread."""
+        if system() != "Windows":
+            Path(self._address).unlink(missing_ok=True)
+        self._listener = Listener(self._address, authkey=self._authkey)
+        # the pytest subprocess inherits the key
+        os.environ[AUTHKEY_ENV] = self._authkey.hex()
+        Thread(target=self._accept, name="hardpy-statestore", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop accepting connections."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
+        os.environ.pop(AUTHKEY_ENV, None)
+
+    @property
+    def version(self) -> int:
+        """Get the document version.
+
+        Returns:
+            int: document version, incremented on every change
+        """
+        return self._version
+
+    def snapshot(self) -> dict | None:
+        """Get the statestore document.
+
+        The copy is made once per document version and shared by callers,
+        so it must not be changed.
+
+        Returns:
+            dict | None: statestore document, None if it was not written yet
+        """
+        with self._lock:
+            if self._snapshot[0] != self._version:
+                self._snapshot = (self._version, copy.deepcopy(self._doc))
+            return self._snapshot[1]
+
+    def wait_for_change(self, version: int | None, timeout: float) -> int:
+        """Wait until the document version differs from the given one.
+
+        Args:
+            version (int | None): known document version
+            timeout (float): maximum wait time in seconds
+
+        Returns:
+            int: current document version
+        """
+        with self._lock:
+            self._changed.wait_for(lambda: self._version != version, timeout)
+            return self._version
+
+    def _accept(self) -> None:
+        while (listener := self._listener) is not None:
+            try:
+                connection = listener.accept()
+            except (OSError, AuthenticationError):
+                # the listener is closed or the client failed authentication
+                continue
+            Thread(
+                target=self._serve,
+                args=(connection,),
+                name="hardpy-statestore-client",
+                daemon=True,
+            ).start()
+
+    def _serve(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    command, payload = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    self._handle(connection, command, payload)
+                except Exception:  # noqa: BLE001
+                    self._log.exception(f"Error handling statestore command {command}")
+
+    def _handle(self, connection: Connection, command: str, payload: Any) -> None:  # noqa: ANN401
+        if command == GET:
+            with self._lock:
+                doc = self._doc if payload != self._version else None
+                connection.send((self._version, doc))
+        elif command == UPDATE:
+            with self._lock:
+                if self._doc is None:
+                    self._doc = {}
+                for key, value in payload:
+                    set_value(self._doc, key, value)
+                self._version += 1
+                self._changed.notify_all()
+                connection.send(self._version)
+        elif command == REPLACE:
+            with self._lock:
+                self._doc = payload
+                self._version += 1
+                self._changed.notify_all()
+                connection.send(self._version)
+        elif command == WAIT:
+            version, timeout = payload
+            with self._lock:
+                self._changed.wait_for(lambda: self._version != version, timeout)
+                connection.send(self._version)
+        else:
+            self._log.warning(f"Unknown statestore command {command}")
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, get_args
+
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+class ModelCache:
+    """Validated store document model cache.
+
+    The model is cached with the document revision, i.e. CouchDB `_rev`
+    or the file content hash, and is validated again only if the revision
+    was changed. The cached model is shared by the callers, so it must not
+    be modified.
+
+    Args:
+        schema (type[BaseModel]): document schema
+    """
+
+    def __init__(self, schema: type[BaseModel]) -> None:
+        self._schema = schema
+        self._revision: Hashable | None = None
+        self._model: BaseModel | None = None
+
+    def get(self, doc: dict, revision: Hashable | None) -> BaseModel:
+        """Get the validated document model.
+
+        Args:
+            doc (dict): store document
+            revision (Hashable | None): document revision, None if the document
+                has changes that are not persisted, so it is not cached
+
+        Returns:
+            BaseModel: validated document model
+        """
+        model = self._get_cached(revision)
+        if model is None:
+            self._model = None
+            model = self._schema(**doc)
+            if revision is not None:
+                self._revision = revision
+                self._model = model
+        return model
+
+    def get_view(self, doc: dict, revision: Hashable | None) -> DocumentView:
+        """Get the partially validated document view.
+
+        The cached model is reused by the view if it has the same revision.
+
+        Args:
+            doc (dict): store document
+            revision (Hashable | None): document revision
+
+        Returns:
+            DocumentView: document view
+        """
+        return DocumentView(doc, self._schema, self._get_cached(revision))
+
+    def _get_cached(self, revision: Hashable | None) -> BaseModel | None:
+        if revision is None or revision != self._revision:
+            return None
+        return self._model
+
+
+class DocumentView:
+    """Partially validated view of the store document.
+
+    The document fields are validated without modules on the first access
+    to a field, and every module is validated on the first access to it,
+    so reading a part of a large document does not validate the whole one.
+    The view reads the document at the time of the first access, so it must
+    not be kept while the document is changed.
+
+    Args:
+        doc (dict): store document
+        schema (type[BaseModel]): document schema
+        model (BaseModel | None): validated document model, if it is cached
+    """
+
+    def __init__(
+        self,
+        doc: dict,
+        schema: type[BaseModel],
+        model: BaseModel | None = None,
+    ) -> None:
+        self._doc = doc
+        self._schema = schema
+        self._model = model
+        self._header: BaseModel | None = None
+        self._modules = _ModuleViews(doc.get(DF.MODULES, {}), schema, model)
+
+    @property
+    def modules(self) -> Mapping[str, BaseModel]:
+        """Get the modules validated on access.
+
+        Returns:
+            Mapping[str, BaseModel]: module models by module ID
+        """
+        return self._modules
+
+    def model(self) -> BaseModel:
+        """Validate the whole document.
+
+        Returns:
+            BaseModel: validated document model
+        """
+        if self._model is None:
+            self._model = self._schema(**self._doc)
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if self._model is not None:
+            return getattr(self._model, name)
+        if self._header is None:
+            self._header = self._schema(**{**self._doc, DF.MODULES: {}})
+        return getattr(self._header, name)
+
+
+class _ModuleViews(Mapping):
+    def __init__(
+        self,
+        modules: dict,
+        schema: type[BaseModel],
+        model: BaseModel | None,
+    ) -> None:
+        annotation = schema.model_fields[DF.MODULES].annotation
+        self._module_schema: type[BaseModel] = get_args(annotation)[1]
+        self._modules = modules
+        self._validated: dict[str, BaseModel] = (
+            dict(getattr(model, DF.MODULES)) if model is not None else {}
+        )
+
+    def __getitem__(self, module_id: str) -> BaseModel:
+        module = self._validated.get(module_id)
+        if module is None:
+            module = self._module_schema(**self._modules[module_id])
+            self._validated[module_id] = module
+        return module
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
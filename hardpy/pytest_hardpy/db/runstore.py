@@ -3,24 +3,43 @@
 
 from __future__ import annotations
 
-import json
+import sqlite3
 from abc import ABC, abstractmethod
-from json import dumps
 from logging import getLogger
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from glom import PathAccessError, assign, glom
-
 from hardpy.common.config import ConfigManager, StorageType
 from hardpy.common.singleton import SingletonMeta
 from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.couchdb_maintenance import (
+    compact_if_needed,
+    set_revs_limit,
+)
+from hardpy.pytest_hardpy.db.couchdb_session import (
+    CouchDBSession,
+    get_changed_document,
+    get_revision,
+)
+from hardpy.pytest_hardpy.db.couchdb_shards import ShardedDocument
+from hardpy.pytest_hardpy.db.json_store import JournalStoreMixin, JsonStoreMixin
+from hardpy.pytest_hardpy.db.json_value import to_json_value
+from hardpy.pytest_hardpy.db.key_path import get_value, set_value
+from hardpy.pytest_hardpy.db.model_cache import ModelCache
 from hardpy.pytest_hardpy.db.schema import ResultRunStore
+from hardpy.pytest_hardpy.db.sqlite_storage import (
+    SqliteDocument,
+    connect,
+    get_database_path,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from pycouchdb.client import Database  # type: ignore[import-untyped]
     from pydantic import BaseModel
 
+    from hardpy.pytest_hardpy.db.model_cache import DocumentView
+
 
 def _create_default_doc_structure(doc_id: str, doc_id_for_rev: str) -> dict:
     """Create default document structure with standard fields.
@@ -99,10 +118,20 @@ class RunStoreInterface(ABC):
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
 
+    @abstractmethod
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+
     @abstractmethod
     def clear(self) -> None:
         """Clear storage and reset to initial state."""
@@ -112,30 +141,50 @@ class RunStoreInterface(ABC):
         """Optimize storage (implementation-specific, may be no-op)."""
 
 
-class JsonRunStore(RunStoreInterface):
+class JsonRunStore(JsonStoreMixin, RunStoreInterface):
     """JSON file-based run storage implementation.
 
     Stores test run data using JSON files.
     """
 
     def __init__(self) -> None:
-        config_manager = ConfigManager()
+        self._init_store("runstore", ResultRunStore)
+
+    def _create_default_doc(self, doc_id: str) -> dict:
+        """Create the default document with the given document id."""
+        return _create_default_doc_structure(doc_id, self._doc_id)
+
+
+class JournalRunStore(JournalStoreMixin, JsonRunStore):
+    """JSON journal-based run storage implementation.
+
+    Appends document changes to a JSON Lines journal next to the JSON
+    snapshot instead of rewriting the whole file on every update.
+    The snapshot is rewritten only on compaction.
+    """
+
+
+class SqliteRunStore(RunStoreInterface):
+    """SQLite-based run storage implementation.
+
+    Stores test run data in a SQLite database, one row per document field,
+    module and test case.
+    """
+
+    def __init__(self) -> None:
+        config = ConfigManager().config
         self._store_name = "runstore"
-        config_storage_path = Path(config_manager.config.database.storage_path)
-        if config_storage_path.is_absolute():
-            self._storage_dir = config_storage_path / "storage" / self._store_name
-        else:
-            self._storage_dir = Path(
-                config_manager.tests_path
-                / config_manager.config.database.storage_path
-                / "storage"
-                / self._store_name,
-            )
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        self._doc_id = config_manager.config.database.doc_id
-        self._file_path = self._storage_dir / f"{self._doc_id}.json"
+        self._doc_id = config.database.doc_id
         self._log = getLogger(__name__)
         self._schema: type[BaseModel] = ResultRunStore
+        self._model_cache = ModelCache(self._schema)
+        self._connection = connect(get_database_path())
+        self._document = SqliteDocument(
+            self._connection,
+            self._store_name,
+            self._doc_id,
+        )
+        self._revision = 0
         self._doc: dict = self._init_doc()
 
     def get_field(self, key: str) -> Any:  # noqa: ANN401
@@ -148,8 +197,8 @@ class JsonRunStore(RunStoreInterface):
             Any: Field value, or None if path does not exist
         """
         try:
-            return glom(self._doc, key)
-        except PathAccessError:
+            return get_value(self._doc, key)
+        except KeyError:
             return None
 
     def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
@@ -159,77 +208,76 @@ class JsonRunStore(RunStoreInterface):
             key (str): Field key, supports nested access with dots
             value (Any): Value to set
         """
-        try:
-            dumps(value)
-        except Exception:  # noqa: BLE001
-            value = dumps(value, default=str)
-
-        if "." in key:
-            assign(self._doc, key, value, missing=dict)
-        else:
-            self._doc[key] = value
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        self._document.mark_dirty(key)
 
     def update_db(self) -> None:
-        """Persist in-memory document to JSON file with atomic write."""
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = self._file_path.with_suffix(".tmp")
-
+        """Persist changed document rows to the database."""
+        if self._document.is_dirty:
+            self._revision += 1
         try:
-            with temp_file.open("w") as f:
-                json.dump(self._doc, f, indent=2, default=str)
-            temp_file.replace(self._file_path)
-        except Exception as exc:
-            self._log.error(f"Error writing to storage file: {exc}")
-            if temp_file.exists():
-                temp_file.unlink()
+            self._document.save(self._doc)
+        except sqlite3.Error as exc:
+            self._log.error(f"Error writing to storage database: {exc}")
             raise
 
     def update_doc(self) -> None:
-        """Reload document from JSON file to memory."""
-        if self._file_path.exists():
-            try:
-                with self._file_path.open("r") as f:
-                    self._doc = json.load(f)
-            except json.JSONDecodeError as exc:
-                self._log.error(f"Error reading storage file: {exc}")
-            except Exception as exc:
-                self._log.error(f"Error reading storage file: {exc}")
-                raise
+        """Reload document from the database if it was changed.
+
+        Changes that are not persisted are discarded.
+        """
+        if not self._document.is_dirty and not self._document.has_changed():
+            return
+        doc = self._document.load()
+        if doc is not None:
+            self._doc = doc
+        self._revision += 1
 
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
         self.update_doc()
-        return self._schema(**self._doc)
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
 
     def clear(self) -> None:
         """Clear storage by resetting to initial state (in-memory only)."""
         self._doc = _create_default_doc_structure(self._doc_id, self._doc_id)
+        self._document.mark_all_dirty()
 
     def compact(self) -> None:
-        """Optimize storage (no-op for JSON file storage)."""
+        """Move the write-ahead log content to the database file."""
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the number of the document loads and saves."""
+        return None if self._document.is_dirty else self._revision
 
     def _init_doc(self) -> dict:
         """Initialize or load document structure."""
-        if self._file_path.exists():
-            try:
-                with self._file_path.open("r") as f:
-                    doc = json.load(f)
-
-                    if DF.MODULES not in doc:
-                        doc[DF.MODULES] = {}
+        doc = self._document.load()
+        if doc is None:
+            self._document.mark_all_dirty()
+            return _create_default_doc_structure(self._doc_id, self._doc_id)
 
-                    return doc
-            except json.JSONDecodeError:
-                self._log.warning(f"Corrupted storage file {self._file_path},"
-                                  f" creating new")
-            except Exception as exc:  # noqa: BLE001
-                self._log.warning(f"Error loading storage file: {exc}, creating new")
+        if DF.MODULES not in doc:
+            doc[DF.MODULES] = {}
 
-        return _create_default_doc_structure(self._doc_id, self._doc_id)
+        return doc
 
 
 class CouchDBRunStore(RunStoreInterface):
@@ -240,7 +288,6 @@ class CouchDBRunStore(RunStoreInterface):
     """
 
     def __init__(self) -> None:
-        from pycouchdb import Server as DbServer  # type: ignore[import-untyped]
         from pycouchdb.exceptions import (  # type: ignore[import-untyped]
             Conflict,
             GenericError,
@@ -249,11 +296,13 @@ class CouchDBRunStore(RunStoreInterface):
 
         config_manager = ConfigManager()
         config = config_manager.config
-        self._db_srv = DbServer(config.database.url)
-        self._db_name = "runstore"
+        self._db_srv = CouchDBSession().server(config.database.url)
+        self._db_name = config.database.get_database_name("runstore")
         self._doc_id = config.database.doc_id
         self._log = getLogger(__name__)
         self._schema: type[BaseModel] = ResultRunStore
+        self._model_cache = ModelCache(self._schema)
+        self._is_dirty = False
 
         # Initialize database
         try:
@@ -267,6 +316,12 @@ class CouchDBRunStore(RunStoreInterface):
             msg = f"Error initializing database: {exc}"
             raise RuntimeError(msg) from exc
 
+        if config.database.revs_limit:
+            try:
+                set_revs_limit(self._db, config.database.revs_limit)
+            except GenericError as exc:
+                self._log.warning(f"Error setting database revision limit: {exc}")
+
         self._doc: dict = self._init_doc()
 
         # Clear the runstore on initialization for CouchDB
@@ -285,8 +340,8 @@ class CouchDBRunStore(RunStoreInterface):
             Any: Field value, or None if path does not exist
         """
         try:
-            return glom(self._doc, key)
-        except PathAccessError:
+            return get_value(self._doc, key)
+        except KeyError:
             return None
 
     def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
@@ -296,39 +351,71 @@ class CouchDBRunStore(RunStoreInterface):
             key (str): Field key, supports nested access with dots
             value (Any): Value to set
         """
-        try:
-            dumps(value)
-        except Exception:  # noqa: BLE001
-            value = dumps(value, default=str)
-
-        if "." in key:
-            assign(self._doc, key, value, missing=dict)
-        else:
-            self._doc[key] = value
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        self._is_dirty = True
 
     def update_db(self) -> None:
-        """Persist in-memory document to storage backend."""
+        """Persist in-memory document to storage backend.
+
+        The write is skipped if the stored document was not changed.
+        """
         from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
 
+        if not self._is_dirty and "_rev" in self._doc:
+            return
         try:
             self._doc = self._db.save(self._doc)
         except Conflict:
-            self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
+            self._doc["_rev"] = get_revision(self._db, self._doc_id)
             self._doc = self._db.save(self._doc)
+        self._is_dirty = False
 
     def update_doc(self) -> None:
-        """Reload document from storage backend to memory."""
-        self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
-        self._doc = self._db.get(self._doc_id)
+        """Reload document from storage backend to memory if it was changed.
+
+        Changes that are not persisted are discarded.
+        """
+        rev = None if self._is_dirty else self._doc.get("_rev")
+        doc = get_changed_document(self._db, self._doc_id, rev)
+        if doc is not None:
+            self._doc = doc
+        self._is_dirty = False
+
+    def has_changed(self, rev: str | None = None) -> bool:
+        """Check if the stored document was changed since the revision.
+
+        Only the document revision is requested, the document is not read.
+
+        Args:
+            rev (str | None): document revision, the loaded one by default
+
+        Returns:
+            bool: True if the stored document has another revision
+        """
+        if rev is None:
+            rev = self._doc.get("_rev")
+        return get_revision(self._db, self._doc_id) != rev
 
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
-        self._doc = self._db.get(self._doc_id)
-        return self._schema(**self._doc)
+        self.update_doc()
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
 
     def clear(self) -> None:
         """Clear storage and reset to initial state."""
@@ -344,8 +431,17 @@ class CouchDBRunStore(RunStoreInterface):
         self._doc = self._init_doc()
 
     def compact(self) -> None:
-        """Optimize storage (implementation-specific, may be no-op)."""
-        self._db.compact()
+        """Compact the database if it has grown by the compaction ratio.
+
+        The compaction runs in the CouchDB background, so the check does
+        not delay the end of the run.
+        """
+        config = ConfigManager().config.database
+        compact_if_needed(self._db, config.compaction_ratio)
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the CouchDB revision of the loaded document."""
+        return None if self._is_dirty else self._doc.get("_rev")
 
     def _init_doc(self) -> dict:
         """Initialize or load document structure."""
@@ -365,18 +461,89 @@ class CouchDBRunStore(RunStoreInterface):
         return doc
 
 
+class ShardedCouchDBRunStore(CouchDBRunStore):
+    """CouchDB-based run storage with the document split into shards.
+
+    The document is stored as the header document and one document
+    per module and test case, so an update writes only the changed shards.
+    """
+
+    def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Update document value in memory (does not persist).
+
+        Args:
+            key (str): Field key, supports nested access with dots
+            value (Any): Value to set
+        """
+        super().update_doc_value(key, value)
+        self._document.mark_dirty(key)
+
+    def update_db(self) -> None:
+        """Persist changed document shards to storage backend."""
+        self._document.save(self._doc)
+
+    def update_doc(self) -> None:
+        """Reload document shards from storage backend to memory."""
+        doc = self._document.load()
+        if doc is not None:
+            self._doc = doc
+
+    def has_changed(self, rev: str | None = None) -> bool:
+        """Check if the stored document was changed since the revision.
+
+        Args:
+            rev (str | None): header document revision, by default
+                the revisions of all loaded shards are checked
+
+        Returns:
+            bool: True if the stored document has changed
+        """
+        if rev is None:
+            return self._document.has_changed()
+        return get_revision(self._db, self._doc_id) != rev
+
+    def clear(self) -> None:
+        """Clear storage and reset to initial state."""
+        self._document.delete()
+        self._doc = self._init_doc()
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the CouchDB revisions of the loaded shards."""
+        return None if self._document.is_dirty else self._document.revision
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        self._document = ShardedDocument(self._db, self._doc_id)
+        doc = self._document.load()
+        if doc is None:
+            default = _create_default_doc_structure(self._doc_id, self._doc_id)
+            del default["_rev"]  # CouchDB manages _rev automatically
+            self._document.mark_all_dirty()
+            return default
+
+        if DF.MODULES not in doc:
+            doc[DF.MODULES] = {}
+
+        return doc
+
+
 class RunStore(metaclass=SingletonMeta):
     """HardPy run storage factory for test run data.
 
     Creates appropriate storage backend based on configuration:
     - JSON file storage when storage_type is "json"
+    - JSON journal storage when storage_type is "json" and journal is enabled
     - CouchDB storage when storage_type is "couchdb"
+    - Sharded CouchDB storage when storage_type is "couchdb" and
+      couchdb_sharding is enabled
+    - SQLite storage when storage_type is "sqlite"
 
     Save state and case artifact. Supports multiple storage backends
     through the factory pattern.
 
     Note: This class acts as a factory. When instantiated, it returns
-    the appropriate concrete implementation (JsonRunStore or CouchDBRunStore).
+    the appropriate concrete implementation (JsonRunStore, CouchDBRunStore
+    or SqliteRunStore).
     """
 
     def __new__(cls) -> RunStoreInterface:  # type: ignore[misc]
@@ -389,8 +556,14 @@ class RunStore(metaclass=SingletonMeta):
         storage_type = config.config.database.storage_type
 
         if storage_type == StorageType.JSON:
+            if config.config.database.journal:
+                return JournalRunStore()
             return JsonRunStore()
         if storage_type == StorageType.COUCHDB:
+            if config.config.database.couchdb_sharding:
+                return ShardedCouchDBRunStore()
             return CouchDBRunStore()
+        if storage_type == StorageType.SQLITE:
+            return SqliteRunStore()
         msg = f"Unknown storage type: {storage_type}"
         raise ValueError(msg)
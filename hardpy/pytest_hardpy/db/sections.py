@@ -0,0 +1,39 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.key_path import parse_key
+
+MODULE_LEVEL = 2
+CASES_LEVEL = 3
+CASE_LEVEL = 4
+
+
+def get_section_path(key: str) -> tuple[str, ...]:
+    """Get the path of the document section that contains the key.
+
+    The document is split into sections: every top-level field, every
+    module header and every test case. The result is one of:
+
+    - `(field,)`: top-level field, `("modules",)` for all modules;
+    - `("modules", module_id)`: module header without test cases;
+    - `("modules", module_id, "cases")`: module header and all its test cases;
+    - `("modules", module_id, "cases", case_id)`: test case.
+
+    Args:
+        key (str): Field key, supports nested access with dots
+
+    Returns:
+        tuple[str, ...]: section path
+    """
+    parts = parse_key(key)
+    if parts[0] != DF.MODULES or len(parts) == 1:
+        return parts[:1]
+    if len(parts) >= CASE_LEVEL and parts[2] == DF.CASES:
+        return parts[:CASE_LEVEL]
+    if len(parts) == CASES_LEVEL and parts[2] == DF.CASES:
+        return parts
+    if len(parts) == MODULE_LEVEL:
+        return (*parts, DF.CASES)
+    return parts[:MODULE_LEVEL]
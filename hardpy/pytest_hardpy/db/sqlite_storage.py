@@ -0,0 +1,304 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.json_codec import get_codec
+from hardpy.pytest_hardpy.db.sections import (
+    CASES_LEVEL,
+    MODULE_LEVEL,
+    get_section_path,
+)
+
+DATABASE_NAME = "hardpy.sqlite3"
+BUSY_TIMEOUT = 10  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    store TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    module_id TEXT NOT NULL,
+    case_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (store, doc_id, module_id, case_id, field)
+);
+CREATE TABLE IF NOT EXISTS versions (
+    store TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (store, doc_id)
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+_UPSERT = (
+    "INSERT INTO sections (store, doc_id, module_id, case_id, field, data) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (store, doc_id, module_id, case_id, field) "
+    "DO UPDATE SET data = excluded.data"
+)
+_INSERT_IF_ABSENT = (
+    "INSERT OR IGNORE INTO sections (store, doc_id, module_id, case_id, field, data) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_BUMP_VERSION = (
+    "INSERT INTO versions (store, doc_id, version) VALUES (?, ?, 1) "
+    "ON CONFLICT (store, doc_id) DO UPDATE SET version = version + 1"
+)
+
+
+def get_database_path() -> Path:
+    """Get SQLite database file path from the configuration.
+
+    Returns:
+        Path: database file path
+    """
+    config_manager = ConfigManager()
+    config_storage_path = Path(config_manager.config.database.storage_path)
+    if not config_storage_path.is_absolute():
+        config_storage_path = config_manager.tests_path / config_storage_path
+    return config_storage_path / "storage" / DATABASE_NAME
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open SQLite database in WAL mode and create the tables.
+
+    Args:
+        path (Path): database file path
+
+    Returns:
+        sqlite3.Connection: database connection in autocommit mode
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        path,
+        timeout=BUSY_TIMEOUT,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+class SqliteDocument:
+    """Store document persisted in SQLite database.
+
+    The document is split into rows: one row per top-level field, module
+    header and test case. Only the rows touched by changed key paths are
+    written, so the API process and the pytest process can share the
+    document without rewriting it as a whole. Every save increments
+    the document version, so the other documents of the database
+    are not loaded again.
+
+    Args:
+        connection (sqlite3.Connection): database connection
+        store (str): store name, i.e. "runstore"
+        doc_id (str): document ID
+    """
+
+    def __init__(self, connection: sqlite3.Connection, store: str, doc_id: str) -> None:
+        self._connection = connection
+        self._store = store
+        self._doc_id = doc_id
+        self._dirty: set[tuple[str, ...]] = set()
+        self._version: int | None = None
+        self._codec = get_codec()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the document has changes that are not saved.
+
+        Returns:
+            bool: True if at least one key path was changed
+        """
+        return bool(self._dirty)
+
+    def mark_dirty(self, key: str) -> None:
+        """Mark the rows that contain the key as changed.
+
+        Args:
+            key (str): Field key, supports nested access with dots
+        """
+        self._dirty.add(get_section_path(key))
+
+    def mark_all_dirty(self) -> None:
+        """Mark the whole document as changed."""
+        self._dirty.add(())
+
+    def has_changed(self) -> bool:
+        """Check if another connection saved the document since the last access.
+
+        Returns:
+            bool: True if the document must be loaded again
+        """
+        return self._version != self._get_version()
+
+    def get_version(self) -> int:
+        """Get the document version.
+
+        The version is incremented by every save of the document.
+
+        Returns:
+            int: document version, 0 if the document was never saved
+        """
+        return self._get_version()
+
+    def load(self) -> dict | None:
+        """Read the document from the database.
+
+        Returns:
+            dict | None: document, None if the document does not exist
+        """
+        self._connection.execute("BEGIN")
+        try:
+            self._version = self._get_version()
+            rows = self._connection.execute(
+                "SELECT module_id, case_id, field, data FROM sections "
+                "WHERE store = ? AND doc_id = ? ORDER BY rowid",
+                (self._store, self._doc_id),
+            ).fetchall()
+        finally:
+            self._connection.execute("COMMIT")
+        self._dirty.clear()
+        if not rows:
+            return None
+
+        doc: dict = {}
+        modules: dict = {}
+        cases: list[tuple[str, str, Any]] = []
+        for module_id, case_id, field, data in rows:
+            value = self._codec.loads(data)
+            if not module_id:
+                doc[field] = value
+            elif not case_id:
+                modules[module_id] = value
+            else:
+                cases.append((module_id, case_id, value))
+        for module_id, case_id, value in cases:
+            module = modules.setdefault(module_id, {})
+            module.setdefault(DF.CASES, {})[case_id] = value
+        if modules or DF.MODULES in doc:
+            doc[DF.MODULES] = modules
+        return doc
+
+    def save(self, doc: dict) -> None:
+        """Write the changed rows in a single transaction.
+
+        Args:
+            doc (dict): document
+        """
+        if not self._dirty:
+            return
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = self._get_version()
+            if () in self._dirty:
+                self._delete()
+                self._write_all(doc)
+            else:
+                self._write_dirty(doc)
+            self._connection.execute(_BUMP_VERSION, (self._store, self._doc_id))
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        # the own save is not loaded again if nobody saved since the last access
+        if version == self._version:
+            self._version = version + 1
+        self._dirty.clear()
+
+    def _write_dirty(self, doc: dict) -> None:
+        modules = doc.get(DF.MODULES)
+        if (DF.MODULES,) in self._dirty or not isinstance(modules, dict):
+            self._delete(" AND module_id != ''")
+            self._write_all(doc)
+            return
+        for path in sorted(self._dirty, key=len):
+            if len(path) == 1:
+                self._write_field(doc, path[0])
+                continue
+            module_id = path[1]
+            module = modules.get(module_id)
+            if not isinstance(module, dict):
+                self._delete(" AND module_id = ?", (module_id,))
+            elif len(path) == MODULE_LEVEL:
+                self._write_module_header(module_id, module, _UPSERT)
+            elif len(path) == CASES_LEVEL:
+                self._delete(" AND module_id = ?", (module_id,))
+                self._write_module(module_id, module)
+            else:
+                self._write_case(module_id, module, path[3])
+
+    def _write_all(self, doc: dict) -> None:
+        for field in doc:
+            self._write_field(doc, field)
+        modules = doc.get(DF.MODULES)
+        if isinstance(modules, dict):
+            for module_id, module in modules.items():
+                self._write_module(module_id, module)
+
+    def _write_field(self, doc: dict, field: str) -> None:
+        if field not in doc:
+            self._delete(" AND module_id = '' AND field = ?", (field,))
+            return
+        value = doc[field]
+        if field == DF.MODULES and isinstance(value, dict):
+            # modules are stored in own rows, keep the field position only
+            value = {}
+        self._execute(_UPSERT, ("", "", field, self._encode(value)))
+
+    def _write_module(self, module_id: str, module: Any) -> None:  # noqa: ANN401
+        if not isinstance(module, dict):
+            self._execute(_UPSERT, (module_id, "", "", self._encode(module)))
+            return
+        self._write_module_header(module_id, module, _UPSERT)
+        cases = module.get(DF.CASES)
+        if isinstance(cases, dict):
+            for case_id, case in cases.items():
+                self._execute(_UPSERT, (module_id, case_id, "", self._encode(case)))
+
+    def _write_module_header(self, module_id: str, module: dict, query: str) -> None:
+        header = {
+            key: {} if key == DF.CASES and isinstance(value, dict) else value
+            for key, value in module.items()
+        }
+        self._execute(query, (module_id, "", "", self._encode(header)))
+
+    def _write_case(self, module_id: str, module: dict, case_id: str) -> None:
+        cases = module.get(DF.CASES)
+        if not isinstance(cases, dict) or case_id not in cases:
+            self._delete(" AND module_id = ? AND case_id = ?", (module_id, case_id))
+            return
+        # the module may be created by the case key path
+        self._write_module_header(module_id, module, _INSERT_IF_ABSENT)
+        self._execute(_UPSERT, (module_id, case_id, "", self._encode(cases[case_id])))
+
+    def _encode(self, value: Any) -> str:  # noqa: ANN401
+        return self._codec.dumps(value, compact=True)
+
+    def _delete(self, condition: str = "", params: tuple = ()) -> None:
+        self._execute(
+            f"DELETE FROM sections WHERE store = ? AND doc_id = ?{condition}",  # noqa: S608
+            params,
+        )
+
+    def _execute(self, query: str, params: tuple) -> None:
+        self._connection.execute(query, (self._store, self._doc_id, *params))
+
+    def _get_version(self) -> int:
+        row = self._connection.execute(
+            "SELECT version FROM versions WHERE store = ? AND doc_id = ?",
+            (self._store, self._doc_id),
+        ).fetchone()
+        return row[0] if row is not None else 0
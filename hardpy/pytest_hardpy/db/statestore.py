@@ -3,24 +3,48 @@
 
 from __future__ import annotations
 
-import json
+import sqlite3
 from abc import ABC, abstractmethod
-from json import dumps
 from logging import getLogger
-from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any
 
-from glom import PathAccessError, assign, glom
-
 from hardpy.common.config import ConfigManager, StorageType
 from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db import memory_statestore
 from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.couchdb_maintenance import (
+    compact_if_needed,
+    set_revs_limit,
+)
+from hardpy.pytest_hardpy.db.couchdb_session import (
+    CouchDBSession,
+    get_changed_document,
+    get_revision,
+    wait_for_changes,
+)
+from hardpy.pytest_hardpy.db.couchdb_shards import ShardedDocument
+from hardpy.pytest_hardpy.db.json_store import JournalStoreMixin, JsonStoreMixin
+from hardpy.pytest_hardpy.db.json_value import to_json_value
+from hardpy.pytest_hardpy.db.key_path import get_value, set_value
+from hardpy.pytest_hardpy.db.model_cache import ModelCache
 from hardpy.pytest_hardpy.db.schema import ResultStateStore
+from hardpy.pytest_hardpy.db.sqlite_storage import (
+    SqliteDocument,
+    connect,
+    get_database_path,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from multiprocessing.connection import Connection
+
     from pycouchdb.client import Database  # type: ignore[import-untyped]
     from pydantic import BaseModel
 
+    from hardpy.pytest_hardpy.db.model_cache import DocumentView
+
 
 def _create_default_doc_structure(doc_id: str, doc_id_for_rev: str) -> dict:
     """Create default document structure with standard fields.
@@ -64,6 +88,15 @@ def _create_default_doc_structure(doc_id: str, doc_id_for_rev: str) -> dict:
     }
 
 
+# seconds between the checks of the local storage changes, the interval
+# is doubled after every check up to the maximum while nothing changes
+_POLL_INTERVAL = 0.02
+_POLL_MAX_INTERVAL = 0.25
+# longest wait in seconds on the operator panel connection,
+# the wait is repeated by the caller until its timeout
+_MEMORY_MAX_WAIT = 1.0
+
+
 class StateStoreInterface(ABC):
     """Interface for state storage implementations."""
 
@@ -99,10 +132,20 @@ class StateStoreInterface(ABC):
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
 
+    @abstractmethod
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+
     @abstractmethod
     def clear(self) -> None:
         """Clear storage and reset to initial state."""
@@ -111,31 +154,100 @@ class StateStoreInterface(ABC):
     def compact(self) -> None:
         """Optimize storage (implementation-specific, may be no-op)."""
 
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait until the stored document is changed by another process.
+
+        The wait may end before the change, so the caller must reload
+        the document and check it again. The storage is checked often
+        right after the call and less often while it is idle.
+
+        Args:
+            timeout (float): maximum wait time in seconds
+        """
+        deadline = monotonic() + timeout
+        interval = _POLL_INTERVAL
+        while not self._has_changed() and (remaining := deadline - monotonic()) > 0:
+            sleep(min(interval, remaining))
+            interval = min(interval * 2, _POLL_MAX_INTERVAL)
+
+    def _has_changed(self) -> bool:
+        """Check if the stored document was changed since the last reload."""
+        return True
 
-class JsonStateStore(StateStoreInterface):
+
+class JsonStateStore(JsonStoreMixin, StateStoreInterface):
     """JSON file-based state storage implementation.
 
     Stores test execution state using JSON files.
     """
 
     def __init__(self) -> None:
-        config_manager = ConfigManager()
+        self._init_store("statestore", ResultStateStore)
+
+    def _create_default_doc(self, doc_id: str) -> dict:
+        """Create the default document with the given document id."""
+        return _create_default_doc_structure(doc_id, self._doc_id)
+
+    def _has_changed(self) -> bool:
+        """Check the file status without reading the file."""
+        try:
+            stat = self._file_path.stat()
+        except FileNotFoundError:
+            return self._file_stat is not None
+        return self._file_stat != (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        doc = super()._init_doc()
+        # Reset volatile fields for statestore
+        default_doc = _create_default_doc_structure(doc["_id"], self._doc_id)
+        doc[DF.DUT] = default_doc[DF.DUT]
+        doc[DF.TEST_STAND] = default_doc[DF.TEST_STAND]
+        doc[DF.PROCESS] = default_doc[DF.PROCESS]
+        return doc
+
+
+class JournalStateStore(JournalStoreMixin, JsonStateStore):
+    """JSON journal-based state storage implementation.
+
+    Appends document changes to a JSON Lines journal next to the JSON
+    snapshot instead of rewriting the whole file on every update.
+    The snapshot is rewritten only on compaction.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        if self._file_path.exists():
+            # journal the reset of the volatile fields
+            for key in (DF.DUT, DF.TEST_STAND, DF.PROCESS):
+                self._changes[key] = self._doc[key]
+
+    def _has_changed(self) -> bool:
+        """Check the snapshot and journal status without reading the files."""
+        return self._journal.has_changed()
+
+
+class SqliteStateStore(StateStoreInterface):
+    """SQLite-based state storage implementation.
+
+    Stores test execution state in a SQLite database, one row per document field,
+    module and test case.
+    """
+
+    def __init__(self) -> None:
+        config = ConfigManager().config
         self._store_name = "statestore"
-        config_storage_path = Path(config_manager.config.database.storage_path)
-        if config_storage_path.is_absolute():
-            self._storage_dir = config_storage_path / "storage" / self._store_name
-        else:
-            self._storage_dir = Path(
-                config_manager.tests_path
-                / config_manager.config.database.storage_path
-                / "storage"
-                / self._store_name,
-            )
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        self._doc_id = config_manager.config.database.doc_id
-        self._file_path = self._storage_dir / f"{self._doc_id}.json"
+        self._doc_id = config.database.doc_id
         self._log = getLogger(__name__)
         self._schema: type[BaseModel] = ResultStateStore
+        self._model_cache = ModelCache(self._schema)
+        self._connection = connect(get_database_path())
+        self._document = SqliteDocument(
+            self._connection,
+            self._store_name,
+            self._doc_id,
+        )
+        self._revision = 0
         self._doc: dict = self._init_doc()
 
     def get_field(self, key: str) -> Any:  # noqa: ANN401
@@ -148,8 +260,8 @@ class JsonStateStore(StateStoreInterface):
             Any: Field value, or None if path does not exist
         """
         try:
-            return glom(self._doc, key)
-        except PathAccessError:
+            return get_value(self._doc, key)
+        except KeyError:
             return None
 
     def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
@@ -159,85 +271,245 @@ class JsonStateStore(StateStoreInterface):
             key (str): Field key, supports nested access with dots
             value (Any): Value to set
         """
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        self._document.mark_dirty(key)
+
+    def update_db(self) -> None:
+        """Persist changed document rows to the database."""
+        if self._document.is_dirty:
+            self._revision += 1
         try:
-            dumps(value)
-        except Exception:  # noqa: BLE001
-            value = dumps(value, default=str)
+            self._document.save(self._doc)
+        except sqlite3.Error as exc:
+            self._log.error(f"Error writing to storage database: {exc}")
+            raise
 
-        if "." in key:
-            assign(self._doc, key, value, missing=dict)
-        else:
-            self._doc[key] = value
+    def update_doc(self) -> None:
+        """Reload document from the database if it was changed.
 
-    def update_db(self) -> None:
-        """Persist in-memory document to JSON file with atomic write."""
-        self._storage_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = self._file_path.with_suffix(".tmp")
+        Changes that are not persisted are discarded.
+        """
+        if not self._document.is_dirty and not self._document.has_changed():
+            return
+        doc = self._document.load()
+        if doc is not None:
+            self._doc = doc
+        self._revision += 1
+
+    def get_document(self) -> BaseModel:
+        """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
+        Returns:
+            BaseModel: Validated document model
+        """
+        self.update_doc()
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
+
+    def clear(self) -> None:
+        """Clear storage by resetting to initial state (in-memory only)."""
+        self._doc = _create_default_doc_structure(self._doc_id, self._doc_id)
+        self._document.mark_all_dirty()
+
+    def compact(self) -> None:
+        """Move the write-ahead log content to the database file."""
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _has_changed(self) -> bool:
+        """Check the document version without reading the document."""
+        return self._document.has_changed()
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the number of the document loads and saves."""
+        return None if self._document.is_dirty else self._revision
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        doc = self._document.load()
+        if doc is None:
+            self._document.mark_all_dirty()
+            return _create_default_doc_structure(self._doc_id, self._doc_id)
+
+        if DF.MODULES not in doc:
+            doc[DF.MODULES] = {}
+
+        # Reset volatile fields
+        default_doc = _create_default_doc_structure(doc["_id"], self._doc_id)
+        for key in (DF.DUT, DF.TEST_STAND, DF.PROCESS):
+            doc[key] = default_doc[key]
+            self._document.mark_dirty(key)
+
+        return doc
+
+
+class MemoryStateStore(StateStoreInterface):
+    """In-memory state storage implementation.
+
+    The statestore document is hosted by the operator panel process.
+    Changed key paths are pushed to the panel over a local connection,
+    and the document is received only if it was changed by other clients.
+    The changes are waited for over a separate connection, so that
+    the waiting does not delay the pushes.
+    """
+
+    def __init__(self) -> None:
+        config = ConfigManager().config
+        self._doc_id = config.database.doc_id
+        self._log = getLogger(__name__)
+        self._schema: type[BaseModel] = ResultStateStore
+        self._model_cache = ModelCache(self._schema)
+        self._connection = memory_statestore.connect()
+        self._lock = Lock()
+        self._wait_connection: Connection | None = None
+        self._wait_lock = Lock()
+        self._changes: dict[str, Any] = {}
+        self._needs_replace = False
+        self._version = -1
+        self._doc: dict = self._init_doc()
+
+    def get_field(self, key: str) -> Any:  # noqa: ANN401
+        """Get field value from document using dot notation.
+
+        Args:
+            key (str): Field key, supports nested access with dots
+
+        Returns:
+            Any: Field value, or None if path does not exist
+        """
         try:
-            with temp_file.open("w") as f:
-                json.dump(self._doc, f, indent=2, default=str)
-            temp_file.replace(self._file_path)
-        except Exception as exc:
-            self._log.error(f"Error writing to storage file: {exc}")
-            if temp_file.exists():
-                temp_file.unlink()
-            raise
+            return get_value(self._doc, key)
+        except KeyError:
+            return None
+
+    def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Update document value in memory (does not persist).
+
+        Args:
+            key (str): Field key, supports nested access with dots
+            value (Any): Value to set
+        """
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        # keep the order of the last changes
+        self._changes.pop(key, None)
+        self._changes[key] = value
+
+    def update_db(self) -> None:
+        """Push changes made since the last update to the operator panel."""
+        with self._lock:
+            if self._needs_replace:
+                self._connection.send((memory_statestore.REPLACE, self._doc))
+            elif self._changes:
+                changes = list(self._changes.items())
+                self._connection.send((memory_statestore.UPDATE, changes))
+            else:
+                return
+            version = self._connection.recv()
+            self._changes.clear()
+            self._needs_replace = False
+            # the own changes are not received again if nobody changed
+            # the document since the last update
+            if version == self._version + 1:
+                self._version = version
 
     def update_doc(self) -> None:
-        """Reload document from JSON file to memory."""
-        if self._file_path.exists():
-            try:
-                with self._file_path.open("r") as f:
-                    self._doc = json.load(f)
-            except json.JSONDecodeError as exc:
-                self._log.error(f"Error reading storage file: {exc}")
-            except Exception as exc:
-                self._log.error(f"Error reading storage file: {exc}")
-                raise
+        """Receive the document from the operator panel if it was changed.
+
+        Changes that are not pushed are discarded.
+        """
+        with self._lock:
+            is_modified = bool(self._changes) or self._needs_replace
+            version = -1 if is_modified else self._version
+            self._connection.send((memory_statestore.GET, version))
+            self._version, doc = self._connection.recv()
+            self._changes.clear()
+            # the panel has no document yet
+            self._needs_replace = self._version == 0
+        if doc is not None:
+            self._doc = doc
 
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
         self.update_doc()
-        return self._schema(**self._doc)
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
 
     def clear(self) -> None:
         """Clear storage by resetting to initial state (in-memory only)."""
         self._doc = _create_default_doc_structure(self._doc_id, self._doc_id)
+        self._changes.clear()
+        self._needs_replace = True
 
     def compact(self) -> None:
-        """Optimize storage (no-op for JSON file storage)."""
+        """Optimize storage (no-op for in-memory storage)."""
+
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait until the document version of the operator panel is changed.
+
+        Args:
+            timeout (float): maximum wait time in seconds
+        """
+        timeout = min(timeout, _MEMORY_MAX_WAIT)
+        if self._changes or self._needs_replace:
+            return
+        with self._wait_lock:
+            if self._wait_connection is None:
+                self._wait_connection = memory_statestore.connect()
+            self._wait_connection.send(
+                (memory_statestore.WAIT, (self._version, timeout)),
+            )
+            self._wait_connection.recv()
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the operator panel version of the loaded document."""
+        if self._changes or self._needs_replace:
+            return None
+        return self._version
 
     def _init_doc(self) -> dict:
         """Initialize or load document structure."""
-        if self._file_path.exists():
-            try:
-                with self._file_path.open("r") as f:
-                    doc = json.load(f)
-
-                    if DF.MODULES not in doc:
-                        doc[DF.MODULES] = {}
-
-                    # Reset volatile fields for statestore
-                    default_doc = _create_default_doc_structure(doc["_id"],
-                                                                self._doc_id)
-                    doc[DF.DUT] = default_doc[DF.DUT]
-                    doc[DF.TEST_STAND] = default_doc[DF.TEST_STAND]
-                    doc[DF.PROCESS] = default_doc[DF.PROCESS]
-
-                    return doc
-            except json.JSONDecodeError:
-                self._log.warning(
-                    f"Corrupted storage file {self._file_path}, creating new",
-                )
-            except Exception as exc:  # noqa: BLE001
-                self._log.warning(f"Error loading storage file: {exc}, creating new")
+        with self._lock:
+            self._connection.send((memory_statestore.GET, self._version))
+            self._version, doc = self._connection.recv()
+        if doc is None:
+            self._needs_replace = True
+            return _create_default_doc_structure(self._doc_id, self._doc_id)
 
-        return _create_default_doc_structure(self._doc_id, self._doc_id)
+        if DF.MODULES not in doc:
+            doc[DF.MODULES] = {}
+
+        # Reset volatile fields
+        default_doc = _create_default_doc_structure(doc["_id"], self._doc_id)
+        for key in (DF.DUT, DF.TEST_STAND, DF.PROCESS):
+            doc[key] = default_doc[key]
+            self._changes[key] = doc[key]
+
+        return doc
 
 
 class CouchDBStateStore(StateStoreInterface):
@@ -247,7 +519,6 @@ class CouchDBStateStore(StateStoreInterface):
     """
 
     def __init__(self) -> None:
-        from pycouchdb import Server as DbServer  # type: ignore[import-untyped]
         from pycouchdb.exceptions import (  # type: ignore[import-untyped]
             Conflict,
             GenericError,
@@ -256,11 +527,14 @@ class CouchDBStateStore(StateStoreInterface):
 
         config_manager = ConfigManager()
         config = config_manager.config
-        self._db_srv = DbServer(config.database.url)
-        self._db_name = "statestore"
+        self._db_srv = CouchDBSession().server(config.database.url)
+        self._db_name = config.database.get_database_name("statestore")
         self._doc_id = config.database.doc_id
         self._log = getLogger(__name__)
         self._schema: type[BaseModel] = ResultStateStore
+        self._model_cache = ModelCache(self._schema)
+        self._is_dirty = False
+        self._last_seq: str | None = None
 
         # Initialize database
         try:
@@ -274,6 +548,12 @@ class CouchDBStateStore(StateStoreInterface):
             msg = f"Error initializing database: {exc}"
             raise RuntimeError(msg) from exc
 
+        if config.database.revs_limit:
+            try:
+                set_revs_limit(self._db, config.database.revs_limit)
+            except GenericError as exc:
+                self._log.warning(f"Error setting database revision limit: {exc}")
+
         self._doc: dict = self._init_doc()
 
     def get_field(self, key: str) -> Any:  # noqa: ANN401
@@ -286,8 +566,8 @@ class CouchDBStateStore(StateStoreInterface):
             Any: Field value, or None if path does not exist
         """
         try:
-            return glom(self._doc, key)
-        except PathAccessError:
+            return get_value(self._doc, key)
+        except KeyError:
             return None
 
     def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
@@ -297,39 +577,71 @@ class CouchDBStateStore(StateStoreInterface):
             key (str): Field key, supports nested access with dots
             value (Any): Value to set
         """
-        try:
-            dumps(value)
-        except Exception:  # noqa: BLE001
-            value = dumps(value, default=str)
-
-        if "." in key:
-            assign(self._doc, key, value, missing=dict)
-        else:
-            self._doc[key] = value
+        value = to_json_value(value)
+        set_value(self._doc, key, value)
+        self._is_dirty = True
 
     def update_db(self) -> None:
-        """Persist in-memory document to storage backend."""
+        """Persist in-memory document to storage backend.
+
+        The write is skipped if the stored document was not changed.
+        """
         from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
 
+        if not self._is_dirty and "_rev" in self._doc:
+            return
         try:
             self._doc = self._db.save(self._doc)
         except Conflict:
-            self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
+            self._doc["_rev"] = get_revision(self._db, self._doc_id)
             self._doc = self._db.save(self._doc)
+        self._is_dirty = False
 
     def update_doc(self) -> None:
-        """Reload document from storage backend to memory."""
-        self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
-        self._doc = self._db.get(self._doc_id)
+        """Reload document from storage backend to memory if it was changed.
+
+        Changes that are not persisted are discarded.
+        """
+        rev = None if self._is_dirty else self._doc.get("_rev")
+        doc = get_changed_document(self._db, self._doc_id, rev)
+        if doc is not None:
+            self._doc = doc
+        self._is_dirty = False
+
+    def has_changed(self, rev: str | None = None) -> bool:
+        """Check if the stored document was changed since the revision.
+
+        Only the document revision is requested, the document is not read.
+
+        Args:
+            rev (str | None): document revision, the loaded one by default
+
+        Returns:
+            bool: True if the stored document has another revision
+        """
+        if rev is None:
+            rev = self._doc.get("_rev")
+        return get_revision(self._db, self._doc_id) != rev
 
     def get_document(self) -> BaseModel:
         """Get full document with schema validation.
 
+        The validated model is cached until the stored document is changed.
+
         Returns:
             BaseModel: Validated document model
         """
-        self._doc = self._db.get(self._doc_id)
-        return self._schema(**self._doc)
+        self.update_doc()
+        return self._model_cache.get(self._doc, self._get_revision())
+
+    def get_document_view(self) -> DocumentView:
+        """Get document view validating modules on access.
+
+        Returns:
+            DocumentView: Partially validated document view
+        """
+        self.update_doc()
+        return self._model_cache.get_view(self._doc, self._get_revision())
 
     def clear(self) -> None:
         """Clear storage and reset to initial state."""
@@ -345,8 +657,35 @@ class CouchDBStateStore(StateStoreInterface):
         self._doc = self._init_doc()
 
     def compact(self) -> None:
-        """Optimize storage (implementation-specific, may be no-op)."""
-        self._db.compact()
+        """Compact the database if it has grown by the compaction ratio.
+
+        The compaction runs in the CouchDB background, so the check does
+        not delay the end of the run.
+        """
+        config = ConfigManager().config.database
+        compact_if_needed(self._db, config.compaction_ratio)
+
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait for the document change with the CouchDB changes feed.
+
+        The first call only gets the database sequence and returns,
+        the next calls wait for the changes made after it.
+        The sharded document is changed by the operator panel in the header
+        document, so only the header document is watched.
+
+        Args:
+            timeout (float): maximum wait time in seconds
+        """
+        self._last_seq = wait_for_changes(
+            self._db,
+            [self._doc_id],
+            self._last_seq,
+            timeout,
+        )
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the CouchDB revision of the loaded document."""
+        return None if self._is_dirty else self._doc.get("_rev")
 
     def _init_doc(self) -> dict:
         """Initialize or load document structure."""
@@ -368,6 +707,79 @@ class CouchDBStateStore(StateStoreInterface):
         doc[DF.DUT] = default_doc[DF.DUT]
         doc[DF.TEST_STAND] = default_doc[DF.TEST_STAND]
         doc[DF.PROCESS] = default_doc[DF.PROCESS]
+        self._is_dirty = True
+
+        return doc
+
+
+class ShardedCouchDBStateStore(CouchDBStateStore):
+    """CouchDB-based state storage with the document split into shards.
+
+    The document is stored as the header document and one document
+    per module and test case, so an update writes only the changed shards.
+    """
+
+    def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Update document value in memory (does not persist).
+
+        Args:
+            key (str): Field key, supports nested access with dots
+            value (Any): Value to set
+        """
+        super().update_doc_value(key, value)
+        self._document.mark_dirty(key)
+
+    def update_db(self) -> None:
+        """Persist changed document shards to storage backend."""
+        self._document.save(self._doc)
+
+    def update_doc(self) -> None:
+        """Reload document shards from storage backend to memory."""
+        doc = self._document.load()
+        if doc is not None:
+            self._doc = doc
+
+    def has_changed(self, rev: str | None = None) -> bool:
+        """Check if the stored document was changed since the revision.
+
+        Args:
+            rev (str | None): header document revision, by default
+                the revisions of all loaded shards are checked
+
+        Returns:
+            bool: True if the stored document has changed
+        """
+        if rev is None:
+            return self._document.has_changed()
+        return get_revision(self._db, self._doc_id) != rev
+
+    def clear(self) -> None:
+        """Clear storage and reset to initial state."""
+        self._document.delete()
+        self._doc = self._init_doc()
+
+    def _get_revision(self) -> Hashable | None:
+        """Get the CouchDB revisions of the loaded shards."""
+        return None if self._document.is_dirty else self._document.revision
+
+    def _init_doc(self) -> dict:
+        """Initialize or load document structure."""
+        self._document = ShardedDocument(self._db, self._doc_id)
+        doc = self._document.load()
+        if doc is None:
+            default = _create_default_doc_structure(self._doc_id, self._doc_id)
+            del default["_rev"]  # CouchDB manages _rev automatically
+            self._document.mark_all_dirty()
+            return default
+
+        if DF.MODULES not in doc:
+            doc[DF.MODULES] = {}
+
+        # Reset volatile fields
+        default_doc = _create_default_doc_structure(doc["_id"], self._doc_id)
+        for key in (DF.DUT, DF.TEST_STAND, DF.PROCESS):
+            doc[key] = default_doc[key]
+            self._document.mark_dirty(key)
 
         return doc
 
@@ -377,12 +789,18 @@ class StateStore(metaclass=SingletonMeta):
 
     Creates appropriate storage backend based on configuration:
     - JSON file storage when storage_type is "json"
+    - JSON journal storage when storage_type is "json" and journal is enabled
     - CouchDB storage when storage_type is "couchdb"
+    - Sharded CouchDB storage when storage_type is "couchdb" and
+      couchdb_sharding is enabled
+    - SQLite storage when storage_type is "sqlite"
+    - In-memory storage of the operator panel when memory_statestore is enabled
 
     This ensures state data is stored in the same backend as the main data.
 
     Note: This class acts as a factory. When instantiated, it returns
-    the appropriate concrete implementation (JsonStateStore or CouchDBStateStore).
+    the appropriate concrete implementation (JsonStateStore, CouchDBStateStore
+    or SqliteStateStore).
     """
 
     def __new__(cls) -> StateStoreInterface:  # type: ignore[misc]
@@ -394,9 +812,22 @@ class StateStore(metaclass=SingletonMeta):
         config = ConfigManager()
         storage_type = config.config.database.storage_type
 
+        if config.config.database.memory_statestore:
+            try:
+                return MemoryStateStore()
+            except ConnectionError as exc:
+                getLogger(__name__).warning(
+                    f"{exc}, the statestore is stored in {storage_type.value} storage",
+                )
         if storage_type == StorageType.JSON:
+            if config.config.database.journal:
+                return JournalStateStore()
             return JsonStateStore()
         if storage_type == StorageType.COUCHDB:
+            if config.config.database.couchdb_sharding:
+                return ShardedCouchDBStateStore()
             return CouchDBStateStore()
+        if storage_type == StorageType.SQLITE:
+            return SqliteStateStore()
         msg = f"Unknown storage type: {storage_type}"
         raise ValueError(msg)
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from abc import ABC, abstractmethod
 from logging import getLogger
 from pathlib import Path
@@ -13,7 +14,10 @@ from uuid6 import uuid7
 
 from hardpy.common.config import ConfigManager, StorageType
 from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db.couchdb_session import CouchDBSession
+from hardpy.pytest_hardpy.db.json_codec import get_codec
 from hardpy.pytest_hardpy.db.schema import ResultRunStore
+from hardpy.pytest_hardpy.db.sqlite_storage import connect, get_database_path
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -103,8 +107,7 @@ class JsonTempStore(TempStoreInterface):
         report_file = self._storage_dir / f"{report_id}.json"
 
         try:
-            with report_file.open("w") as f:
-                json.dump(report_dict, f, indent=2, default=str)
+            report_file.write_text(get_codec().dumps(report_dict), encoding="utf-8")
         except Exception as exc:  # noqa: BLE001
             self._log.error(f"Error while saving report {report_id}: {exc}")
             return False
@@ -120,9 +123,7 @@ class JsonTempStore(TempStoreInterface):
         """
         for report_file in self._storage_dir.glob("*.json"):
             try:
-                with report_file.open("r") as f:
-                    report_dict = json.load(f)
-                yield report_dict
+                yield get_codec().loads(report_file.read_bytes())
             except Exception as exc:  # noqa: BLE001, PERF203
                 self._log.error(f"Error loading report from {report_file}: {exc}")
                 continue
@@ -156,13 +157,12 @@ class CouchDBTempStore(TempStoreInterface):
     """
 
     def __init__(self) -> None:
-        from pycouchdb import Server as DbServer  # type: ignore[import-untyped]
         from pycouchdb.exceptions import Conflict  # type: ignore[import-untyped]
 
         self._log = getLogger(__name__)
         config = ConfigManager()
-        self._db_srv = DbServer(config.config.database.url)
-        self._db_name = "tempstore"
+        self._db_srv = CouchDBSession().server(config.config.database.url)
+        self._db_name = config.config.database.get_database_name("tempstore")
         self._schema = ResultRunStore
 
         try:
@@ -226,17 +226,96 @@ class CouchDBTempStore(TempStoreInterface):
             return True
 
 
+class SqliteTempStore(TempStoreInterface):
+    """SQLite-based temporary storage implementation.
+
+    Stores reports temporarily when StandCloud sync fails using SQLite database.
+    """
+
+    def __init__(self) -> None:
+        self._log = getLogger(__name__)
+        self._connection = connect(get_database_path())
+        self._schema = ResultRunStore
+
+    def push_report(self, report: ResultRunStore) -> bool:
+        """Push report to the temporary storage.
+
+        Args:
+            report (ResultRunStore): report to store
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        report_dict = report.model_dump()
+        report_dict.pop("id", None)
+        report_id = str(uuid7())
+        report_dict["_id"] = report_id
+        report_dict["_rev"] = report_id
+
+        try:
+            self._connection.execute(
+                "INSERT INTO reports (id, data) VALUES (?, ?)",
+                (report_id, get_codec().dumps(report_dict, compact=True)),
+            )
+        except sqlite3.Error as exc:
+            self._log.error(f"Error while saving report {report_id}: {exc}")
+            return False
+        else:
+            self._log.debug(f"Report saved with id: {report_id}")
+            return True
+
+    def reports(self) -> Generator[dict]:
+        """Get all reports from the temporary storage.
+
+        Yields:
+            dict: report from temporary storage
+        """
+        rows = self._connection.execute(
+            "SELECT id, data FROM reports ORDER BY rowid",
+        ).fetchall()
+        for report_id, data in rows:
+            try:
+                yield get_codec().loads(data)
+            except json.JSONDecodeError as exc:  # noqa: PERF203
+                self._log.error(f"Error loading report {report_id}: {exc}")
+                continue
+
+    def delete(self, report_id: str) -> bool:
+        """Delete report from the temporary storage.
+
+        Args:
+            report_id (str): report ID to delete
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            cursor = self._connection.execute(
+                "DELETE FROM reports WHERE id = ?",
+                (report_id,),
+            )
+        except sqlite3.Error as exc:
+            self._log.error(f"Error deleting report {report_id}: {exc}")
+            return False
+        if cursor.rowcount == 0:
+            self._log.warning(f"Report {report_id} not found in temporary storage")
+            return False
+        return True
+
+
 class TempStore(metaclass=SingletonMeta):
     """HardPy temporary storage factory for data synchronization.
 
     Creates appropriate storage backend based on configuration:
     - JSON file storage when storage_type is "json"
     - CouchDB storage when storage_type is "couchdb"
+    - SQLite storage when storage_type is "sqlite"
 
     This ensures temporary reports are stored in the same backend as the main data.
 
     Note: This class acts as a factory. When instantiated, it returns
-    the appropriate concrete implementation (JsonTempStore or CouchDBTempStore).
+    the appropriate concrete implementation (JsonTempStore, CouchDBTempStore
+    or SqliteTempStore).
     """
 
     def __new__(cls) -> TempStoreInterface:  # type: ignore[misc]
@@ -252,5 +331,7 @@ class TempStore(metaclass=SingletonMeta):
             return JsonTempStore()
         if storage_type == StorageType.COUCHDB:
             return CouchDBTempStore()
+        if storage_type == StorageType.SQLITE:
+            return SqliteTempStore()
         msg = f"Unknown storage type: {storage_type}"
         raise ValueError(msg)
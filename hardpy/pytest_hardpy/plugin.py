@@ -40,6 +40,8 @@ from hardpy.pytest_hardpy.result.report_synchronizer.synchronizer import (
 )
 from hardpy.pytest_hardpy.utils import NodeInfo, ProgressCalculator, TestStatus
 from hardpy.pytest_hardpy.utils.node_info import TestDependencyInfo
+from hardpy.pytest_hardpy.utils.operator_channel import OperatorChannel
+from hardpy.pytest_hardpy.utils.thumbnail_cache import ThumbnailCache
 
 if __debug__:
     from urllib3 import disable_warnings
@@ -115,6 +117,11 @@ def pytest_addoption(parser: Parser) -> None:
         default=[],
         help="Dynamic arguments for test execution (key=value format)",
     )
+    parser.addoption(
+        "--hardpy-channel",
+        action="store",
+        help="operator channel address of the operator panel",
+    )
 
 
 # Bootstrapping hooks
@@ -190,6 +197,10 @@ class HardpyPlugin:
         if sc_autosync:
             hardpy_config.stand_cloud.autosync = bool(sc_autosync)  # type: ignore
 
+        channel_address = config.getoption("--hardpy-channel")
+        if channel_address:
+            OperatorChannel().connect(str(channel_address))
+
         _args = config.getoption("--hardpy-start-arg") or []
         if _args:
             self._start_args = dict(arg.split("=", 1) for arg in _args if "=" in arg)
@@ -211,6 +222,7 @@ class HardpyPlugin:
     def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
         """Call at the end of test session."""
         if "--collect-only" in session.config.invocation_params.args:
+            self._reporter.flush()
             return
         status = self._get_run_status(exitstatus)
         if status == TestStatus.STOPPED:
@@ -218,7 +230,10 @@ class HardpyPlugin:
         self._validate_stop_time()
         self._reporter.finish(status)
         self._reporter.update_db_by_doc()
+        self._reporter.flush()
         self._reporter.compact_all()
+        if ConfigManager().config.database.image_max_size:
+            self._log_thumbnail_cache()
 
         # call post run methods
         if self._post_run_functions:
@@ -430,6 +445,8 @@ class HardpyPlugin:
         if None not in self._results[module_id].values():
             self._collect_module_result(module_id)
         self._reporter.update_db_by_doc()
+        # case boundary, the operator panel must show the case result
+        self._reporter.flush()
         return None
 
     # Fixture
@@ -517,6 +534,15 @@ class HardpyPlugin:
                 if case_start_time and not case_stop_time:
                     self._reporter.set_case_stop_time(module_id, case_id)
 
+    def _log_thumbnail_cache(self) -> None:
+        """Log the hit rate of the image thumbnail cache."""
+        cache = ThumbnailCache()
+        if cache.hits or cache.misses:
+            self._log.info(
+                f"Image thumbnail cache hit rate {cache.hit_rate:.0%}: "
+                f"{cache.hits} hits, {cache.misses} misses",
+            )
+
     def _stop_tests(self) -> None:
         """Update module and case statuses to stopped and skipped."""
         is_module_stopped = False
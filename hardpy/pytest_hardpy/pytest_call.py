@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from dataclasses import dataclass
 from inspect import stack
 from os import environ
-from time import sleep
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from hardpy.common.config import ConfigManager
 from hardpy.pytest_hardpy.db import (
+    ArtifactStore,
     Chart,
     DatabaseField as DF,  # noqa: N817
     Instrument,
@@ -20,6 +21,7 @@ from hardpy.pytest_hardpy.db import (
     StringMeasurement,
     SubUnit,
 )
+from hardpy.pytest_hardpy.db.artifact_store import is_artifact_ref
 from hardpy.pytest_hardpy.reporter import RunnerReporter
 from hardpy.pytest_hardpy.utils import (
     DialogBox,
@@ -28,11 +30,18 @@ from hardpy.pytest_hardpy.utils import (
     ImageComponent,
     TestStandNumberError,
 )
+from hardpy.pytest_hardpy.utils.operator_channel import OperatorChannel
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Generator, Mapping
 
     from hardpy.common.config import HardpyConfig
+    from hardpy.pytest_hardpy.db.model_cache import DocumentView
+
+# longest wait in seconds for the operator panel change before the recheck
+_OPERATOR_WAIT_TIMEOUT = 30.0
+# the operator channel is waited for in parts, so that the process can be stopped
+_OPERATOR_CHANNEL_TIMEOUT = 0.5
 
 
 @dataclass
@@ -100,11 +109,45 @@ class ErrorCode:
 def get_current_report() -> ResultRunStore | None:
     """Get current report from runstore database.
 
+    The report is a shallow copy of the cached model, so its fields
+    can be reassigned, but the nested models must not be changed.
+
     Returns:
         ResultRunStore | None: report, or None if not found or invalid
     """
     reporter = RunnerReporter()
-    return reporter.get_report()
+    report = reporter.get_report()
+    if report is None:
+        return None
+    return report.model_copy(deep=False)
+
+
+def get_current_report_view() -> DocumentView | None:
+    """Get current report view from runstore database.
+
+    Unlike `get_current_report`, the view validates the report fields
+    without modules, and every module only on the first access to it.
+
+    Returns:
+        DocumentView | None: report view, or None if not found
+    """
+    reporter = RunnerReporter()
+    return reporter.get_report_view()
+
+
+@contextmanager
+def batch() -> Generator[None]:
+    """Combine the database updates of several functions into a single write.
+
+    Inside the block, functions such as `set_dut_info`, `set_instrument` or
+    `set_case_measurement` change only the in-memory documents.
+    The statestore and runstore are written once when the block exits.
+    Dialog boxes and operator messages called inside the block
+    write the pending changes before waiting for the operator.
+    """
+    reporter = RunnerReporter()
+    with reporter.batch():
+        yield
 
 
 def set_user_name(name: str) -> None:
@@ -411,7 +454,7 @@ def set_case_artifact(data: dict) -> None:
             DF.ARTIFACT,
             stand_key,
         )
-        reporter.set_doc_value(key, stand_value, runstore_only=True)
+        reporter.set_doc_value(key, _store_artifact(stand_value), runstore_only=True)
     reporter.update_db_by_doc()
 
 
@@ -433,7 +476,11 @@ def set_module_artifact(data: dict) -> None:
             DF.ARTIFACT,
             artifact_key,
         )
-        reporter.set_doc_value(key, artifact_value, runstore_only=True)
+        reporter.set_doc_value(
+            key,
+            _store_artifact(artifact_value),
+            runstore_only=True,
+        )
     reporter.update_db_by_doc()
 
 
@@ -452,10 +499,31 @@ def set_run_artifact(data: dict) -> None:
             DF.ARTIFACT,
             artifact_key,
         )
-        reporter.set_doc_value(key, artifact_value, runstore_only=True)
+        reporter.set_doc_value(
+            key,
+            _store_artifact(artifact_value),
+            runstore_only=True,
+        )
     reporter.update_db_by_doc()
 
 
+def get_artifact(value: Any) -> Any:  # noqa: ANN401
+    """Get the artifact value stored outside the runstore document.
+
+    Binary artifact values and values larger than the artifact size limit
+    are replaced in the report with the reference to the stored value.
+
+    Args:
+        value (Any): artifact value from the report
+
+    Returns:
+        Any: stored bytes or value, or the value itself if it is not a reference
+    """
+    if not is_artifact_ref(value):
+        return value
+    return ArtifactStore().load(value)
+
+
 def set_driver_info(drivers: dict) -> None:
     """Add or update test stand drivers data.
 
@@ -650,6 +718,7 @@ def run_dialog_box(dialog_box_data: DialogBox) -> Any:  # noqa: ANN401
     _cleanup_widget(reporter, key)
 
     reporter.set_doc_value(key, dialog_box_data.to_dict(), statestore_only=True)
+    OperatorChannel().clear_data()
     reporter.update_db_by_doc()
 
     input_dbx_data = _get_operator_data()
@@ -709,6 +778,7 @@ def set_operator_message(  # noqa: PLR0913
         DF.FONT_SIZE: int(font_size),
     }
     reporter.set_doc_value(key, msg_data, statestore_only=True)
+    OperatorChannel().clear_data()
     reporter.update_db_by_doc()
 
     if block:
@@ -784,22 +854,36 @@ def _get_current_test() -> CurrentTestInfo:
 def _get_operator_data() -> str:
     """Get operator panel data.
 
+    The data is received over the operator channel while it is connected.
+    Otherwise the statestore is checked, because the operator panel writes
+    the data to it if the channel is not connected or fails.
+
     Returns:
         str: operator panel data
     """
     reporter = RunnerReporter()
+    channel = OperatorChannel()
 
-    data = ""
     key = reporter.generate_key(DF.OPERATOR_DATA, DF.DIALOG)
-    while not data:
+    while True:
+        while channel.is_connected:
+            data = channel.take_data(_OPERATOR_CHANNEL_TIMEOUT)
+            if data:
+                return data
         reporter.update_doc_by_db()
 
         data = reporter.get_field(key)
         if data:
             reporter.set_doc_value(key, "", statestore_only=True)
-            break
-        sleep(0.1)
-    return data
+            return data
+        reporter.wait_for_change(_OPERATOR_WAIT_TIMEOUT)
+
+
+def _store_artifact(value: Any) -> Any:  # noqa: ANN401
+    # the artifact storage is not created while the values are stored inline
+    if not ConfigManager().config.database.artifact_size_limit:
+        return value
+    return ArtifactStore().store(value)
 
 
 def _cleanup_widget(reporter: RunnerReporter, key: str) -> None:
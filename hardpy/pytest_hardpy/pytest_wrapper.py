@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import signal
 import subprocess
 import sys
@@ -11,6 +12,7 @@ from platform import system
 from hardpy.common.config import ConfigManager
 from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
 from hardpy.pytest_hardpy.reporter import RunnerReporter
+from hardpy.pytest_hardpy.utils.operator_channel import DATA, OperatorChannelServer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ class PyTestWrapper:
     def __init__(self) -> None:
         self._proc = None
         self._reporter = RunnerReporter()
+        self._channel = OperatorChannelServer()
         self.python_executable = sys.executable
 
         # Make sure test structure is stored in DB
@@ -78,6 +81,8 @@ class PyTestWrapper:
             self.config.stand_cloud.address,
             "--hardpy-config-file",
             str(self._config_manager.tests_path),
+            "--hardpy-channel",
+            self._channel.address,
         ]
 
         if selected_tests:
@@ -97,16 +102,19 @@ class PyTestWrapper:
                 arg_str = f"{key}={value}"
                 cmd.extend(["--hardpy-start-arg", arg_str])
 
+        env = {**os.environ, **self._channel.open()}
         if system() == "Windows":
             self._proc = subprocess.Popen(  # noqa: S603
                 cmd,
                 cwd=self._config_manager.tests_path,
+                env=env,
                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
             )
         else:
             self._proc = subprocess.Popen(  # noqa: S603
                 cmd,
                 cwd=self._config_manager.tests_path,
+                env=env,
             )
 
         return True
@@ -125,6 +133,10 @@ class PyTestWrapper:
             return True
         return False
 
+    def close(self) -> None:
+        """Close the operator channel of the pytest subprocess."""
+        self._channel.close()
+
     def collect(
         self,
         *,
@@ -178,6 +190,9 @@ class PyTestWrapper:
     def send_data(self, data: str) -> bool:
         """Send data to pytest subprocess.
 
+        The data is sent over the operator channel, and is written
+        to the statestore if the pytest process is not connected to it.
+
         Args:
             data (str): Data to be sent. Can be dialog
                         box output or operator message visibility.
@@ -185,11 +200,14 @@ class PyTestWrapper:
         Returns:
             bool: True if dialog box was confirmed/closed, else False
         """
+        if self._channel.send(DATA, data):
+            return True
         try:
             self._reporter.update_doc_by_db()
             key = self._reporter.generate_key(DF.OPERATOR_DATA, DF.DIALOG)
             self._reporter.set_doc_value(key, data, statestore_only=True)
             self._reporter.update_db_by_doc()
+            self._reporter.flush()
         except Exception:  # noqa: BLE001
             return False
         return True
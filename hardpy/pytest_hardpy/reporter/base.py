@@ -2,18 +2,26 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pycouchdb.exceptions import NotFound
 from pydantic import ValidationError
 
+from hardpy.common.config import ConfigManager, StorageType
 from hardpy.pytest_hardpy.db import (
     DatabaseField as DF,  # noqa: N817
     ResultRunStore,
     RunStore,
     StateStore,
 )
+from hardpy.pytest_hardpy.reporter.flusher import DocumentFlusher
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from hardpy.pytest_hardpy.db.model_cache import DocumentView
 
 
 class BaseReporter:
@@ -22,6 +30,15 @@ class BaseReporter:
     def __init__(self) -> None:
         self._statestore = StateStore()
         self._runstore = RunStore()
+        database_config = ConfigManager().config.database
+        self._flusher = DocumentFlusher(
+            self._statestore,
+            self._runstore,
+            database_config.flush_interval / 1000,
+            # the documents are stored in different CouchDB databases, the two
+            # writes are sent concurrently to wait for one round trip only
+            concurrent=database_config.storage_type == StorageType.COUCHDB,
+        )
         self._log = getLogger(__name__)
 
     def set_doc_value(
@@ -49,14 +66,15 @@ class BaseReporter:
         if runstore_only and statestore_only:
             msg = "Both runstore_only and statestore_only cannot be True"
             raise ValueError(msg)
-        if runstore_only:
+        with self._flusher.lock:
+            if runstore_only:
+                self._runstore.update_doc_value(key, value)
+                return
+            if statestore_only:
+                self._statestore.update_doc_value(key, value)
+                return
             self._runstore.update_doc_value(key, value)
-            return
-        if statestore_only:
             self._statestore.update_doc_value(key, value)
-            return
-        self._runstore.update_doc_value(key, value)
-        self._statestore.update_doc_value(key, value)
 
     def set_alert(self, alert: str) -> None:
         """Set alert message.
@@ -67,14 +85,47 @@ class BaseReporter:
         self.set_doc_value(DF.ALERT, alert, statestore_only=True)
 
     def update_db_by_doc(self) -> None:
-        """Update database by current document."""
-        self._statestore.update_db()
-        self._runstore.update_db()
+        """Update database by current document.
+
+        In the write-behind mode the update is only scheduled,
+        use the `flush` method to persist it immediately.
+        """
+        self._flusher.request()
+
+    def flush(self) -> None:
+        """Persist scheduled database updates immediately."""
+        self._flusher.flush()
+
+    @contextmanager
+    def batch(self) -> Generator[None]:
+        """Combine database updates into a single write.
+
+        Inside the block the `update_db_by_doc` calls change nothing
+        in the database, the documents are written once on exit.
+        """
+        self._flusher.hold()
+        try:
+            yield
+        finally:
+            self._flusher.release()
 
     def update_doc_by_db(self) -> None:
         """Update document by current database."""
-        self._statestore.update_doc()
-        self._runstore.update_doc()
+        with self._flusher.lock:
+            self._flusher.flush()
+            self._statestore.update_doc()
+            self._runstore.update_doc()
+
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait until the statestore is changed by the operator panel.
+
+        The wait may end before the change, so the document must be updated
+        by the database and checked again.
+
+        Args:
+            timeout (float): maximum wait time in seconds
+        """
+        self._statestore.wait_for_change(timeout)
 
     def generate_key(self, *args: Any) -> str:  # noqa: ANN401
         """Generate key for database.
@@ -94,7 +145,9 @@ class BaseReporter:
             ResultRunStore | None: report, or None if not found or invalid
         """
         try:
-            return self._runstore.get_document()  # type: ignore
+            with self._flusher.lock:
+                self._flusher.flush()
+                return self._runstore.get_document()  # type: ignore
         except NotFound:
             return None
         except ValidationError:
@@ -102,6 +155,21 @@ class BaseReporter:
         except TypeError:
             return None
 
+    def get_report_view(self) -> DocumentView | None:
+        """Get current report view from runstore database.
+
+        The report modules are validated on access.
+
+        Returns:
+            DocumentView | None: report view, or None if not found
+        """
+        try:
+            with self._flusher.lock:
+                self._flusher.flush()
+                return self._runstore.get_document_view()  # type: ignore
+        except NotFound:
+            return None
+
     def get_current_attempt(self, module_id: str, case_id: str) -> int:
         """Get current attempt.
 
@@ -119,5 +187,6 @@ class BaseReporter:
 
     def clear_database(self) -> None:
         """Clear both statestore and runstore databases directly."""
-        self._statestore.clear()
-        self._runstore.clear()
+        with self._flusher.lock:
+            self._statestore.clear()
+            self._runstore.clear()
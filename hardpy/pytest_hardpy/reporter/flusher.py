@@ -0,0 +1,193 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from threading import Event, RLock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from hardpy.common.singleton import SingletonMeta
+
+if TYPE_CHECKING:
+    from hardpy.pytest_hardpy.db.runstore import RunStoreInterface
+    from hardpy.pytest_hardpy.db.statestore import StateStoreInterface
+
+
+class DocumentFlusher(metaclass=SingletonMeta):
+    """Statestore and runstore document writer.
+
+    With a zero flush interval the documents are written synchronously
+    on every request. Otherwise, the write-behind mode is used:
+    requests are coalesced and a background thread persists the pending
+    changes at most once per flush interval.
+
+    Args:
+        statestore (StateStoreInterface): statestore
+        runstore (RunStoreInterface): runstore
+        interval (float): flush interval in seconds, 0 disables write-behind
+        concurrent (bool): write the statestore and runstore concurrently.
+            It is still one write per store, a flush only waits for
+            the slower of them instead of both in turn
+    """
+
+    def __init__(
+        self,
+        statestore: StateStoreInterface,
+        runstore: RunStoreInterface,
+        interval: float = 0,
+        concurrent: bool = False,
+    ) -> None:
+        self._statestore = statestore
+        self._runstore = runstore
+        self._interval = interval
+        self._concurrent = concurrent
+        self._executor: ThreadPoolExecutor | None = None
+        self._log = getLogger(__name__)
+        self._lock = RLock()
+        self._is_pending = False
+        self._hold_depth = 0
+        self._last_flush_time = 0.0
+        self._wakeup = Event()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        if self.is_write_behind:
+            atexit.register(self.stop)
+
+    @property
+    def lock(self) -> RLock:
+        """Get the document lock.
+
+        The in-memory documents must be changed only under this lock
+        because the background thread may be encoding them.
+
+        Returns:
+            RLock: document lock
+        """
+        return self._lock
+
+    @property
+    def is_write_behind(self) -> bool:
+        """Check if the write-behind mode is enabled.
+
+        Returns:
+            bool: True if the documents are written by the background thread
+        """
+        return self._interval > 0
+
+    @property
+    def is_pending(self) -> bool:
+        """Check if there are changes that are not persisted yet.
+
+        Returns:
+            bool: True if the documents have pending changes
+        """
+        return self._is_pending
+
+    def request(self) -> None:
+        """Request the documents to be persisted.
+
+        While the flusher is held, the request is only marked as pending.
+        """
+        if self._hold_depth > 0:
+            self._is_pending = True
+            return
+        if not self.is_write_behind:
+            with self._lock:
+                self._is_pending = False
+                self._write()
+            return
+        self._is_pending = True
+        self._start()
+        self._wakeup.set()
+
+    def hold(self) -> None:
+        """Defer requested writes until the matching `release` call."""
+        with self._lock:
+            self._hold_depth += 1
+
+    def release(self) -> None:
+        """Release the flusher and request deferred writes."""
+        with self._lock:
+            self._hold_depth = max(self._hold_depth - 1, 0)
+            if self._hold_depth == 0 and self._is_pending:
+                self.request()
+
+    def flush(self) -> None:
+        """Persist pending changes immediately."""
+        with self._lock:
+            if self._is_pending:
+                self._is_pending = False
+                self._write()
+
+    def stop(self) -> None:
+        """Stop the background threads and persist pending changes."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+            self._stopped.clear()
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(
+                target=self._run,
+                name="hardpy-flusher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            delay = self._last_flush_time + self._interval - monotonic()
+            if delay > 0:
+                self._stopped.wait(delay)
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                self._log.exception("Error writing documents to the database")
+                # retry after the next flush interval
+                self._is_pending = True
+                self._last_flush_time = monotonic()
+                self._wakeup.set()
+
+    def _write(self) -> None:
+        if self._concurrent:
+            self._write_concurrently()
+        else:
+            self._statestore.update_db()
+            self._runstore.update_db()
+        self._last_flush_time = monotonic()
+
+    def _write_concurrently(self) -> None:
+        # the stores are separate databases, so these are still two writes,
+        # only the latency of one of them is hidden
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="hardpy-writer",
+            )
+        runstore_write = self._executor.submit(self._runstore.update_db)
+        errors: list[Exception] = []
+        try:
+            self._statestore.update_db()
+        except Exception as exc:  # noqa: BLE001
+            self._log.exception("Error writing statestore to the database")
+            errors.append(exc)
+        try:
+            runstore_write.result()
+        except Exception as exc:  # noqa: BLE001
+            self._log.exception("Error writing runstore to the database")
+            errors.append(exc)
+        if errors:
+            # the stores may be out of sync until the next successful write
+            raise errors[0]
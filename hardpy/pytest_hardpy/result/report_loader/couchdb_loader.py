@@ -4,10 +4,11 @@
 from logging import getLogger
 from uuid import uuid4
 
-from pycouchdb import Server as DbServer
 from pycouchdb.client import Database
 from pycouchdb.exceptions import Conflict
 
+from hardpy.pytest_hardpy.db.artifact_store import resolve_artifacts
+from hardpy.pytest_hardpy.db.couchdb_session import CouchDBSession
 from hardpy.pytest_hardpy.db.schema import ResultRunStore
 from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
 
@@ -18,12 +19,15 @@ class CouchdbLoader:
     def __init__(self, config: CouchdbConfig) -> None:
         self._log = getLogger(__name__)
         self._config: CouchdbConfig = config
-        self._db_srv = DbServer(config.connection_string)
+        self._db_srv = CouchDBSession().server(config.connection_string)
         self._db: Database = self._init_db()
 
     def load(self, report: ResultRunStore) -> bool:
         """Load report to the report database.
 
+        The artifacts stored outside the runstore document are saved
+        in the report.
+
         Args:
             report (ResultRunStore): report
 
@@ -33,8 +37,9 @@ class CouchdbLoader:
         report_id = self._get_report_id(report)
         report_dict = self._schema_to_dict(report, report_id)
         try:
+            resolve_artifacts(report_dict)
             self._db.save(report_dict)
-        except Conflict as exc:
+        except (Conflict, FileNotFoundError, ValueError) as exc:
             self._log.error(f"Error while saving report {report_id}: {exc}")
             return False
         self._log.debug(f"Report saved with id: {report_id}")
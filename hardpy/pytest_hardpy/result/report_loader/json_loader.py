@@ -2,13 +2,15 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
-import json
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from uuid6 import uuid7
 
+from hardpy.pytest_hardpy.db.artifact_store import resolve_artifacts
+from hardpy.pytest_hardpy.db.json_codec import get_codec
+
 if TYPE_CHECKING:
     from hardpy.pytest_hardpy.db.schema import ResultRunStore
 
@@ -26,6 +28,9 @@ class JsonLoader:
     def load(self, report: ResultRunStore, new_report_id: str | None = None) -> bool:
         """Load report to the report database.
 
+        The artifacts stored outside the runstore document are saved
+        in the report.
+
         Args:
             report (ResultRunStore): report
             new_report_id (str | None, optional): user's report ID. Defaults to uuid7.
@@ -39,8 +44,8 @@ class JsonLoader:
         report_file = self._storage_dir / f"{report_id}.json"
 
         try:
-            with report_file.open("w") as f:
-                json.dump(report_dict, f, indent=2, default=str)
+            resolve_artifacts(report_dict)
+            report_file.write_text(get_codec().dumps(report_dict), encoding="utf-8")
         except Exception as exc:  # noqa: BLE001
             self._log.error(f"Error while saving report {report_id}: {exc}")
             return False
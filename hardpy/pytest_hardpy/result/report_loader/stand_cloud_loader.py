@@ -9,6 +9,7 @@ from requests.exceptions import ConnectionError, HTTPError  # noqa: A004
 
 from hardpy.common.config import ConfigManager
 from hardpy.common.stand_cloud.connector import StandCloudConnector, StandCloudError
+from hardpy.pytest_hardpy.db.artifact_store import resolve_artifacts
 
 if TYPE_CHECKING:
     from requests import Response
@@ -36,6 +37,9 @@ class StandCloudLoader:
     def load(self, report: ResultRunStore, timeout: int = 20) -> Response:
         """Load report to the StandCloud.
 
+        The artifacts stored outside the runstore document are sent
+        in the report.
+
         Args:
             report (ResultRunStore): report
             timeout (int, optional): post timeout in seconds. Defaults to 20.
@@ -52,11 +56,15 @@ class StandCloudLoader:
         except ConnectionError as exc:
             raise StandCloudError(str(exc)) from exc
         sc_report = self._convert_to_sc_format(report)
+        try:
+            sc_report_dict = resolve_artifacts(sc_report.model_dump())
+        except (FileNotFoundError, ValueError) as exc:
+            raise StandCloudError(str(exc)) from exc
 
         try:
             resp = api.post(
                 verify=self._verify_ssl,
-                json=sc_report.model_dump(),
+                json=sc_report_dict,
                 timeout=timeout,
             )
         except (RuntimeError, ConnectionError) as exc:
@@ -6,10 +6,10 @@ from dataclasses import dataclass
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from pycouchdb import Server as DbServer
 from pycouchdb.exceptions import NotFound
 
 from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.couchdb_session import CouchDBSession
 from hardpy.pytest_hardpy.utils.const import TestStatus
 
 if TYPE_CHECKING:
@@ -36,7 +36,7 @@ class CouchdbReader:
     def __init__(self, config: CouchdbConfig) -> None:
         self._log = getLogger(__name__)
         self._config = config
-        self._db_srv = DbServer(config.connection_string)
+        self._db_srv = CouchDBSession().server(config.connection_string)
         self._db: Database = self._init_db()
         self._doc_id = "doc"
 
@@ -5,13 +5,16 @@ from __future__ import annotations
 import base64
 from abc import ABC, abstractmethod
 from ast import literal_eval
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Final
 from uuid import uuid4
 
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.asset_store import ASSET_URL, AssetStore
 from hardpy.pytest_hardpy.utils.exception import ImageError, WidgetInfoError
+from hardpy.pytest_hardpy.utils.thumbnail_cache import ThumbnailCache
 
 
 class WidgetType(Enum):
@@ -260,7 +263,11 @@ class MultistepWidget(IWidget):
 
 
 class ImageComponent:
-    """Image component."""
+    """Image component.
+
+    If the asset store is enabled, the image is stored in the operator panel
+    asset cache, and only the asset ID is sent to the operator panel.
+    """
 
     def __init__(
         self,
@@ -286,16 +293,27 @@ class ImageComponent:
             msg = "Border must be non-negative"
             raise WidgetInfoError(msg)
 
+        database_config = ConfigManager().config.database
+        self.asset: str | None = None
         try:
-            with open(address, "rb") as file:  # noqa: PTH123
-                file_data = file.read()
+            image_path = address
+            if database_config.image_max_size:
+                image_path = ThumbnailCache().get_path(address, width)
+            if database_config.asset_store:
+                self.asset = AssetStore().put_file(image_path)
+            else:
+                with open(image_path, "rb") as file:  # noqa: PTH123
+                    file_data = file.read()
         except FileNotFoundError as exc:
             msg = "The image address is invalid"
             raise ImageError(msg) from exc
         self.address = address
         self.width = width
         self.border = border
-        self.base64 = base64.b64encode(file_data).decode("utf-8")
+        if self.asset is None:
+            self.base64 = base64.b64encode(file_data).decode("utf-8")
+        else:
+            self.base64 = ""
 
     def to_dict(self) -> dict:
         """Convert ImageComponent to dictionary.
@@ -308,11 +326,16 @@ class ImageComponent:
             "width": self.width,
             "base64": self.base64,
             "border": self.border,
+            "asset": self.asset,
         }
 
 
 class HTMLComponent:
-    """HTML component."""
+    """HTML component.
+
+    If the asset store is enabled, the raw html code is stored in the operator
+    panel asset cache, and the component refers to the asset URL.
+    """
 
     def __init__(
         self,
@@ -337,6 +360,11 @@ class HTMLComponent:
             msg = "Border must be non-negative"
             raise WidgetInfoError(msg)
 
+        if is_raw_html and ConfigManager().config.database.asset_store:
+            asset_id = AssetStore().put(html.encode("utf-8"), ".html")
+            html = ASSET_URL + asset_id
+            is_raw_html = False
+
         self.code_or_url = html
         self.width = width
         self.border = border
@@ -402,10 +430,12 @@ class DialogBox:
         Returns:
             dict: DialogBox dictionary.
         """
-        dbx_dict = deepcopy(self.__dict__)
+        # the components are converted without copying the image data
+        dbx_dict = copy(self.__dict__)
         dbx_dict["widget"] = deepcopy(self.widget.__dict__)
+        dbx_dict["button_text"] = copy(self.button_text)
         if self.image:
-            dbx_dict["image"] = deepcopy(self.image.__dict__)
+            dbx_dict["image"] = self.image.to_dict()
         if self.html:
-            dbx_dict["html"] = deepcopy(self.html.__dict__)
+            dbx_dict["html"] = self.html.to_dict()
         return dbx_dict
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import os
+import secrets
+import tempfile
+from logging import getLogger
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from platform import system
+from threading import Condition, Lock, Thread
+from typing import Any
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+
+AUTHKEY_ENV = "HARDPY_CHANNEL_AUTHKEY"
+
+DATA = "data"
+
+
+def get_address() -> str:
+    """Get the operator channel address.
+
+    Returns:
+        str: Unix socket path or Windows named pipe name
+    """
+    doc_id = ConfigManager().config.database.doc_id
+    name = f"hardpy-channel-{doc_id}"
+    if system() == "Windows":
+        return rf"\\.\pipe\{name}"
+    return str(Path(tempfile.gettempdir()) / f"{name}.sock")
+
+
+class OperatorChannelServer:
+    """Operator channel of the operator panel process.
+
+    The channel delivers the operator responses to the running pytest
+    process over a local connection instead of the statestore.
+    Only the last started pytest process is connected, and the commands
+    are not delivered while it is not connected.
+    """
+
+    def __init__(self) -> None:
+        self._address = get_address()
+        self._authkey = secrets.token_bytes(32)
+        self._log = getLogger(__name__)
+        self._lock = Lock()
+        self._connection: Connection | None = None
+        self._listener: Listener | None = None
+
+    @property
+    def address(self) -> str:
+        """Get the channel address.
+
+        Returns:
+            str: Unix socket path or Windows named pipe name
+        """
+        return self._address
+
+    def open(self) -> dict[str, str]:
+        """Open the channel for the new pytest process.
+
+        The connection of the previous pytest process is closed.
+
+        Returns:
+            dict[str, str]: environment variables of the pytest process
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+        if self._listener is None:
+            if system() != "Windows":
+                Path(self._address).unlink(missing_ok=True)
+            self._listener = Listener(self._address, authkey=self._authkey)
+            Thread(target=self._accept, name="hardpy-channel", daemon=True).start()
+        return {AUTHKEY_ENV: self._authkey.hex()}
+
+    def close(self) -> None:
+        """Close the channel."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def send(self, command: str, payload: Any) -> bool:  # noqa: ANN401
+        """Send the command to the pytest process.
+
+        Args:
+            command (str): command name, i.e. DATA
+            payload (Any): picklable command data
+
+        Returns:
+            bool: True if the command was sent, False if the pytest process
+                is not connected
+        """
+        with self._lock:
+            if self._connection is None:
+                return False
+            try:
+                self._connection.send((command, payload))
+            except OSError as exc:
+                self._log.debug(f"Operator channel is closed: {exc}")
+                self._connection.close()
+                self._connection = None
+                return False
+            return True
+
+    def _accept(self) -> None:
+        while (listener := self._listener) is not None:
+            try:
+                connection = listener.accept()
+            except (OSError, AuthenticationError):
+                # the listener is closed or the client failed authentication
+                continue
+            with self._lock:
+                if self._connection is not None:
+                    self._connection.close()
+                self._connection = connection
+
+
+class OperatorChannel(metaclass=SingletonMeta):
+    """Operator channel of the pytest process.
+
+    The commands are received in the background thread. The last operator
+    response is kept until it is taken, like the operator data field
+    of the statestore.
+    """
+
+    def __init__(self) -> None:
+        self._log = getLogger(__name__)
+        self._lock = Lock()
+        self._received = Condition(self._lock)
+        self._connection: Connection | None = None
+        self._data: str | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the channel is connected to the operator panel.
+
+        Returns:
+            bool: True if the channel is connected
+        """
+        return self._connection is not None
+
+    def connect(self, address: str) -> None:
+        """Connect to the operator panel.
+
+        The statestore is used for the operator responses if the channel
+        is not available.
+
+        Args:
+            address (str): channel address of the operator panel
+        """
+        authkey = os.environ.get(AUTHKEY_ENV)
+        if authkey is None:
+            self._log.debug("Operator channel key is not set")
+            return
+        try:
+            connection = Client(address, authkey=bytes.fromhex(authkey))
+        except (OSError, AuthenticationError) as exc:
+            self._log.warning(f"Error connecting to operator channel: {exc}")
+            return
+        self._connection = connection
+        Thread(
+            target=self._receive,
+            args=(connection,),
+            name="hardpy-channel",
+            daemon=True,
+        ).start()
+
+    def clear_data(self) -> None:
+        """Drop the operator response that was not taken.
+
+        Called before the new dialog box or operator message is shown,
+        so that it does not get the response to the previous one.
+        """
+        with self._lock:
+            self._data = None
+
+    def take_data(self, timeout: float) -> str | None:
+        """Take the operator response.
+
+        Args:
+            timeout (float): maximum wait time in seconds
+
+        Returns:
+            str | None: operator response, None if the response was not
+                received in time or the channel is closed
+        """
+        with self._lock:
+            self._received.wait_for(
+                lambda: self._data is not None or self._connection is None,
+                timeout,
+            )
+            data, self._data = self._data, None
+            return data
+
+    def _receive(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    command, payload = connection.recv()
+                except (EOFError, OSError):
+                    break
+                if command == DATA:
+                    with self._lock:
+                        self._data = payload
+                        self._received.notify_all()
+                else:
+                    self._log.warning(f"Unknown operator channel command {command}")
+        with self._lock:
+            self._connection = None
+            self._received.notify_all()
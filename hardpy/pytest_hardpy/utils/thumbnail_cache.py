@@ -0,0 +1,144 @@
+# Copyright (c) 2026 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import hashlib
+from logging import getLogger
+from pathlib import Path
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+
+# downscaled image format by the original image format
+_FORMATS = {"JPEG": "JPEG", "MPO": "JPEG", "PNG": "PNG"}
+_JPEG_QUALITY = 85
+_FULL_WIDTH = 100
+# suffix of the cache entry of the image that is used as is
+_ORIGINAL_SUFFIX = ".original"
+
+
+class ThumbnailCache(metaclass=SingletonMeta):
+    """Cache of the dialog box images downscaled to the display size.
+
+    The image is displayed at most at the configured maximum size, so
+    larger JPEG and PNG images are downscaled and recompressed once.
+    The downscaled images are stored in the thumbnails directory of the
+    storage path, keyed by the image path, modification time, file size
+    and target size. Other image formats and the images that are already
+    small enough are used as is, this is recorded in the cache as well.
+
+    The Pillow package is required to downscale the images,
+    it is installed with the `hardpy[images]` extra.
+    """
+
+    def __init__(self) -> None:
+        self._log = getLogger(__name__)
+        config_manager = ConfigManager()
+        self._max_size = config_manager.config.database.image_max_size
+        config_storage_path = Path(config_manager.config.database.storage_path)
+        if not config_storage_path.is_absolute():
+            config_storage_path = config_manager.tests_path / config_storage_path
+        self._cache_dir = config_storage_path / "storage" / "thumbnails"
+        # cache key to the image path to display
+        self._paths: dict[str, Path] = {}
+        self._hits = 0
+        self._misses = 0
+        try:
+            from PIL import Image, ImageOps  # type: ignore[import-not-found]
+        except ImportError:
+            self._image = None
+            if self._max_size:
+                self._log.warning("Pillow is not installed, images are not downscaled")
+        else:
+            self._image = Image
+            self._image_ops = ImageOps
+
+    @property
+    def hits(self) -> int:
+        """Get the number of images found in the cache.
+
+        Returns:
+            int: number of cache hits
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of images downscaled or checked on the request.
+
+        Returns:
+            int: number of cache misses
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the cache hit rate.
+
+        Returns:
+            float: ratio of the cache hits to all requests, 0 without requests
+        """
+        requests = self._hits + self._misses
+        return self._hits / requests if requests else 0.0
+
+    def get_path(self, address: str | Path, width: int = _FULL_WIDTH) -> Path:
+        """Get the path of the image downscaled to the display width.
+
+        Args:
+            address (str | Path): image path
+            width (int): image display width in percent
+
+        Returns:
+            Path: downscaled image path, or the image path if the image
+                is not downscaled
+
+        Raises:
+            FileNotFoundError: if the image is not found
+        """
+        image_path = Path(address).resolve()
+        stat = image_path.stat()
+        if not self._max_size or self._image is None:
+            return image_path
+        # the image scaled by the width must not exceed the maximum size
+        target_size = self._max_size * _FULL_WIDTH // min(width, _FULL_WIDTH)
+        key_data = f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}:{target_size}"
+        key = hashlib.sha256(key_data.encode()).hexdigest()
+
+        thumbnail_path = self._cache_dir / f"{key}{image_path.suffix.lower()}"
+        path = self._paths.get(key)
+        if path is None and thumbnail_path.exists():
+            path = thumbnail_path
+        elif path is None and thumbnail_path.with_suffix(_ORIGINAL_SUFFIX).exists():
+            path = image_path
+        if path is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+            path = self._downscale(image_path, thumbnail_path, target_size)
+        self._paths[key] = path
+        return path
+
+    def _downscale(self, image_path: Path, thumbnail_path: Path, size: int) -> Path:
+        try:
+            with self._image.open(image_path) as image:
+                image_format = _FORMATS.get(image.format or "")
+                if image_format is None or max(image.size) <= size:
+                    self._cache_dir.mkdir(parents=True, exist_ok=True)
+                    thumbnail_path.with_suffix(_ORIGINAL_SUFFIX).touch()
+                    return image_path
+                # the camera images are rotated by the EXIF orientation tag
+                # that is not saved to the downscaled image
+                image = self._image_ops.exif_transpose(image)  # noqa: PLW2901
+                image.thumbnail((size, size))
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                temp_path = thumbnail_path.with_name(f"{thumbnail_path.name}.tmp")
+                if image_format == "JPEG":
+                    image.save(temp_path, image_format, quality=_JPEG_QUALITY)
+                else:
+                    image.save(temp_path, image_format, optimize=True)
+        except OSError as exc:
+            self._log.warning(f"Image {image_path} is not downscaled: {exc}")
+            return image_path
+        temp_path.replace(thumbnail_path)
+        self._log.debug(f"Image {image_path} is downscaled to {size} pixels")
+        return thumbnail_path
@@ -1,10 +1,15 @@
 """Custom build script for hatch backend."""  # noqa: INP001
 
+import gzip
 import os
 from pathlib import Path
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface  # type: ignore
 
+# Frontend build files that are served precompressed
+COMPRESSIBLE_SUFFIXES = {".css", ".html", ".js", ".json", ".map", ".svg", ".txt"}
+COMPRESSIBLE_MIN_SIZE = 1024
+
 
 class CustomHook(BuildHookInterface):
     """A custom build hook for nbconvert."""
@@ -25,4 +30,37 @@ class CustomHook(BuildHookInterface):
         if exit_code:
             msg = "Yarn build failed"
             raise OSError(msg)
+        precompress(Path("dist"))
         os.chdir(build_dir)
+
+
+def precompress(directory: Path) -> None:
+    """Write the gzip and brotli variants of the frontend build files.
+
+    The operator panel serves the variant accepted by the browser,
+    the brotli variants are written if the brotli package is installed.
+
+    Args:
+        directory (Path): frontend build directory
+    """
+    try:
+        import brotli  # type: ignore
+    except ImportError:
+        brotli = None
+
+    paths = [
+        path
+        for path in directory.rglob("*")
+        if path.suffix in COMPRESSIBLE_SUFFIXES
+        and path.is_file()
+        and path.stat().st_size >= COMPRESSIBLE_MIN_SIZE
+    ]
+    for path in paths:
+        data = path.read_bytes()
+        variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(data, quality=11)
+        for suffix, compressed in variants.items():
+            # the variant that is not smaller is not served
+            if len(compressed) < len(data):
+                path.with_name(f"{path.name}{suffix}").write_bytes(compressed)
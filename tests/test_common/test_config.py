@@ -95,6 +95,16 @@ def test_database_config():
     assert config.url == db_default_url
 
 
+def test_database_name():
+    config = HardpyConfig(frontend=FrontendConfig(host="192.168.0.12"))
+    assert config.database.get_database_name("runstore") == "runstore"
+
+    config.database.stand_databases = True
+    assert (
+        config.database.get_database_name("runstore") == "runstore_192_168_0_12_8000"
+    )
+
+
 def test_frontend_config():
     config = FrontendConfig()
     assert config.host == frontend_default_host
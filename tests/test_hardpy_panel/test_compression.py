@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+from pathlib import Path
+
+from starlette.responses import FileResponse, Response
+
+from hardpy.hardpy_panel.compression import (
+    ApiCompressionMiddleware,
+    PrecompressedStaticFiles,
+)
+
+
+def _scope(path: str, headers: dict[str, str] | None = None) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+    }
+
+
+def _file_response(
+    static_files: PrecompressedStaticFiles,
+    path: Path,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    return static_files.file_response(path, path.stat(), _scope("/", headers))
+
+
+def test_precompressed_static_files(tmp_path: Path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    script = assets / "index-1a2b3c.js"
+    script.write_text("console.log('hardpy');" * 100)
+    compressed = gzip.compress(script.read_bytes())
+    script.with_name(f"{script.name}.gz").write_bytes(compressed)
+    index = tmp_path / "index.html"
+    index.write_text("<html></html>")
+    static_files = PrecompressedStaticFiles(directory=tmp_path)
+
+    response = _file_response(static_files, script, {"Accept-Encoding": "gzip, br"})
+    assert isinstance(response, FileResponse)
+    assert Path(response.path).name == "index-1a2b3c.js.gz"
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "immutable" in response.headers["cache-control"]
+
+    response = _file_response(static_files, script, {"Accept-Encoding": "gzip;q=0"})
+    assert Path(response.path) == script
+    assert "content-encoding" not in response.headers
+
+    response = _file_response(static_files, index)
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+    response = _file_response(static_files, index, {"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_api_compression_middleware():
+    body = b"[" + b"1," * 1000 + b"1]"
+
+    async def app(scope: dict, receive, send) -> None:  # noqa: ANN001
+        response = Response(body, media_type="application/json")
+        await response(scope, receive, send)
+
+    async def request(path: str) -> dict:
+        messages = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        scope = _scope(path, {"Accept-Encoding": "gzip"})
+        await ApiCompressionMiddleware(app)(scope, receive, send)
+        return dict(messages[0]["headers"])
+
+    assert asyncio.run(request("/api/json_data"))[b"content-encoding"] == b"gzip"
+    assert b"content-encoding" not in asyncio.run(request("/api/events"))
+    assert b"content-encoding" not in asyncio.run(request("/index.html"))
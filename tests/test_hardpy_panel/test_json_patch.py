@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from hardpy.hardpy_panel.json_patch import make_patch
+
+
+def _apply(doc: Any, patch: list[dict]) -> Any:  # noqa: ANN401
+    doc = copy.deepcopy(doc)
+    for operation in patch:
+        if not operation["path"]:
+            doc = operation["value"]
+            continue
+        *parents, key = [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in operation["path"].split("/")[1:]
+        ]
+        node = doc
+        for parent in parents:
+            node = node[int(parent) if isinstance(node, list) else parent]
+        if isinstance(node, list):
+            index = int(key)
+            if operation["op"] == "add":
+                node.insert(index, operation["value"])
+            elif operation["op"] == "remove":
+                del node[index]
+            else:
+                node[index] = operation["value"]
+        elif operation["op"] == "remove":
+            del node[key]
+        else:
+            node[key] = operation["value"]
+    return doc
+
+
+def test_patch_changes_only_changed_values():
+    old = {
+        "status": "run",
+        "modules": {
+            "test_1": {"status": "run", "cases": {"test_a": {"status": "run"}}},
+            "test_2": {"status": "ready", "cases": {}},
+        },
+        "measurements": [1, 2, 3],
+    }
+    new = copy.deepcopy(old)
+    new["modules"]["test_1"]["cases"]["test_a"]["status"] = "passed"
+    new["modules"]["test_1"]["cases"]["test_b"] = {"status": "run"}
+    new["measurements"].append(4)
+
+    patch = make_patch(old, new)
+    assert patch == [
+        {
+            "op": "replace",
+            "path": "/modules/test_1/cases/test_a/status",
+            "value": "passed",
+        },
+        {
+            "op": "add",
+            "path": "/modules/test_1/cases/test_b",
+            "value": {"status": "run"},
+        },
+        {"op": "add", "path": "/measurements/3", "value": 4},
+    ]
+    assert _apply(old, patch) == new
+    assert make_patch(new, new) == []
+
+
+def test_patch_round_trip():
+    old = {"a/b": 1, "c~d": [1, 2, 3], "e": {"f": 1, "g": 2}, "h": 1, "i": None}
+    new = {"a/b": 2, "c~d": [1], "e": {"g": 2, "f": 1}, "h": True, "i": {"j": []}}
+
+    patch = make_patch(old, new)
+    assert {"op": "replace", "path": "/a~1b", "value": 2} in patch
+    assert {"op": "remove", "path": "/c~0d/2"} in patch
+    # the object with the reordered keys is replaced
+    assert {"op": "replace", "path": "/e", "value": {"g": 2, "f": 1}} in patch
+    result = _apply(old, patch)
+    assert result == new
+    assert list(result) == list(new)
+    assert list(result["e"]) == ["g", "f"]
+    assert result["h"] is True
+
+    assert make_patch(old, [1]) == [{"op": "replace", "path": "", "value": [1]}]
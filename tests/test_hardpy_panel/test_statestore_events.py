@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from threading import Condition, get_ident
+from typing import Any
+
+from hardpy.hardpy_panel.statestore_events import StateStoreEvents
+
+
+class StateStore:
+    """Statestore stub with the version incremented on every change."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.reads = 0
+        self.waiters: set[int] = set()
+        self._changed = Condition()
+
+    def change(self) -> None:
+        """Change the statestore."""
+        with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+    def read(self) -> tuple[str, dict]:
+        """Read the encoded statestore data and the data."""
+        self.reads += 1
+        data = {"version": self.version, "status": "run" * 100}
+        return json.dumps(data), data
+
+    def wait_for_change(self, version: int | None, timeout: float) -> int:
+        """Wait until the version differs from the given one."""
+        self.waiters.add(get_ident())
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+def _parse(event: str) -> tuple[int, str, Any]:
+    assert event.endswith("\n\n")
+    fields = dict(line.split(": ", 1) for line in event.strip().split("\n"))
+    return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+
+def test_statestore_events_fan_out():
+    statestore = StateStore()
+    events = StateStoreEvents(statestore.read, statestore.wait_for_change)
+    snapshot = {"version": 0, "status": "run" * 100}
+
+    async def receive() -> None:
+        first = events.stream()
+        second = events.stream()
+        assert _parse(await first.__anext__()) == (1, "snapshot", snapshot)
+        assert _parse(await second.__anext__()) == (1, "snapshot", snapshot)
+
+        statestore.change()
+        patch = [{"op": "replace", "path": "/version", "value": 1}]
+        assert _parse(await first.__anext__()) == (2, "patch", patch)
+        assert _parse(await second.__anext__()) == (2, "patch", patch)
+
+        # the subscriber that skipped the change receives the snapshot
+        for version in (2, 3):
+            statestore.change()
+            patch = [{"op": "replace", "path": "/version", "value": version}]
+            assert _parse(await first.__anext__()) == (version + 1, "patch", patch)
+        snapshot["version"] = 3
+        assert _parse(await second.__anext__()) == (4, "snapshot", snapshot)
+        await first.aclose()
+        await second.aclose()
+
+    asyncio.run(asyncio.wait_for(receive(), 5))
+    # the data of every change is read once for all subscribers
+    assert statestore.reads == 4
+    # the changes are waited for by one watcher, not by every subscriber
+    assert len(statestore.waiters) == 1
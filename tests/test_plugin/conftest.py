@@ -7,7 +7,7 @@ from hardpy.common.config import ConfigManager
 pytest_plugins = "pytester"
 
 
-@pytest.fixture(params=["couchdb", "json"], autouse=True)
+@pytest.fixture(params=["couchdb", "json", "sqlite"], autouse=True)
 def hardpy_opts(request):  # noqa: ANN001
     config_manager = ConfigManager()
     if request.param == "couchdb":
@@ -29,4 +29,9 @@ def hardpy_opts(request):  # noqa: ANN001
             Path(__file__).parent / "json_toml",
         )
         return [ "--hardpy-clear-database", "--hardpy-pt"]
+    if request.param == "sqlite":
+        config_data = config_manager.read_config(
+            Path(__file__).parent / "sqlite_toml",
+        )
+        return ["--hardpy-clear-database", "--hardpy-pt"]
     return None
@@ -1046,6 +1046,28 @@ def test_instruments(pytester: Pytester, hardpy_opts: list[str]):
     result.assert_outcomes(passed=1)
 
 
+def test_batch(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        def test_batch():
+            with hardpy.batch():
+                for number in range(3):
+                    hardpy.set_instrument(hardpy.Instrument(name=f"PSU {{number}}"))
+                with hardpy.batch():
+                    hardpy.set_dut_info({{"sw_version": "1.0.0"}})
+                hardpy.set_stand_name("Stand")
+
+            report = hardpy.get_current_report()
+            assert len(report.test_stand.instruments) == 3
+            assert report.dut.info == {{"sw_version": "1.0.0"}}
+            assert report.test_stand.name == "Stand"
+        """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
 def test_process_name(pytester: Pytester, hardpy_opts: list[str]):
     pytester.makepyfile(
         f"""
@@ -1309,3 +1331,19 @@ def test_get_hardpy_config(pytester: Pytester, hardpy_opts: list):
     )
     result = pytester.runpytest(*hardpy_opts)
     result.assert_outcomes(passed=1)
+
+
+def test_current_report_is_copy(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+
+        def test_current_report_is_copy():
+            report = hardpy.get_current_report()
+            report.user = "changed"
+            assert hardpy.get_current_report().user is None
+    """,
+    )
+
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db.artifact_store import (
+    ARTIFACT_REF,
+    BINARY_CONTENT_TYPE,
+    JSON_CONTENT_TYPE,
+    ArtifactStore,
+    FileArtifactStore,
+    is_artifact_ref,
+    resolve_artifacts,
+)
+
+
+@pytest.fixture
+def artifact_store(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> FileArtifactStore:
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    monkeypatch.setattr(config_manager.config.database, "artifact_size_limit", 64)
+    return FileArtifactStore()
+
+
+def test_small_values_are_stored_inline(artifact_store: FileArtifactStore):
+    for value in ("data", {"value": 1}, [1, 2, 3], 42, None):
+        assert artifact_store.store(value) == value
+
+
+def test_binary_value_is_stored(tmp_path: Path, artifact_store: FileArtifactStore):
+    ref = artifact_store.store(b"\x00\x01")
+    assert is_artifact_ref(ref)
+    assert ref["size"] == 2
+    assert ref["content_type"] == BINARY_CONTENT_TYPE
+    assert (tmp_path / "storage" / "artifacts" / ref[ARTIFACT_REF]).exists()
+    assert artifact_store.load(ref) == b"\x00\x01"
+    assert artifact_store.store(ref) == ref
+
+
+def test_large_value_is_stored(artifact_store: FileArtifactStore):
+    value = {"samples": list(range(100))}
+    ref = artifact_store.store(value)
+    assert is_artifact_ref(ref)
+    assert ref["content_type"] == JSON_CONTENT_TYPE
+    assert artifact_store.load(ref) == value
+    # the same data is stored once
+    assert artifact_store.store({"samples": list(range(100))}) == ref
+
+
+def test_load_errors(tmp_path: Path, artifact_store: FileArtifactStore):
+    ref = artifact_store.store(b"data")
+    (tmp_path / "storage" / "artifacts" / ref[ARTIFACT_REF]).write_bytes(b"other")
+    with pytest.raises(ValueError, match="corrupted"):
+        artifact_store.load(ref)
+    with pytest.raises(FileNotFoundError):
+        artifact_store.load({ARTIFACT_REF: "0" * 64})
+
+
+def test_disabled_limit_stores_values_inline(monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "artifact_size_limit", 0)
+    assert FileArtifactStore().store(b"data") == b"data"
+
+
+def test_report_artifacts_are_resolved(
+    monkeypatch: pytest.MonkeyPatch,
+    artifact_store: FileArtifactStore,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_type", "json")
+    SingletonMeta._instances.pop(ArtifactStore, None)  # noqa: SLF001
+    value = {"samples": list(range(100))}
+    report = {
+        "artifact": {"samples": artifact_store.store(value), "note": "inline"},
+        "modules": {
+            "test_1": {
+                "artifact": {"image": artifact_store.store(b"\x00\x01")},
+                "cases": {
+                    "test_a": {"artifact": {"samples": artifact_store.store(value)}},
+                },
+            },
+        },
+    }
+    resolve_artifacts(report)
+    SingletonMeta._instances.pop(ArtifactStore, None)  # noqa: SLF001
+
+    assert report["artifact"] == {"samples": value, "note": "inline"}
+    image = report["modules"]["test_1"]["artifact"]["image"]
+    assert image["content_type"] == BINARY_CONTENT_TYPE
+    assert image["data"] == "AAE="
+    assert report["modules"]["test_1"]["cases"]["test_a"]["artifact"] == {
+        "samples": value,
+    }
@@ -0,0 +1,70 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import hardpy
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db.asset_store import ASSET_URL, AssetStore
+
+
+@pytest.fixture
+def asset_store(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[AssetStore]:
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    monkeypatch.setattr(config_manager.config.database, "asset_store", True)
+    SingletonMeta._instances.pop(AssetStore, None)  # noqa: SLF001
+    yield AssetStore()
+    SingletonMeta._instances.pop(AssetStore, None)  # noqa: SLF001
+
+
+def test_put_file(tmp_path: Path, asset_store: AssetStore):
+    image = tmp_path / "image.PNG"
+    image.write_bytes(b"image")
+
+    asset_id = asset_store.put_file(image)
+    assert asset_id.endswith(".png")
+    assert asset_store.put_file(image) == asset_id
+    assert asset_store.put(b"image", ".png") == asset_id
+    asset_path = asset_store.get_path(asset_id)
+    assert asset_path is not None
+    assert asset_path.read_bytes() == b"image"
+
+    image.write_bytes(b"other image")
+    assert asset_store.put_file(image) != asset_id
+    with pytest.raises(FileNotFoundError):
+        asset_store.put_file(tmp_path / "missing.png")
+
+
+def test_get_path_rejects_invalid_id(asset_store: AssetStore):
+    asset_id = asset_store.put(b"data", "/../x")
+    assert "/" not in asset_id
+    assert asset_store.get_path(asset_id) is not None
+    assert asset_store.get_path("../" + asset_id) is None
+    assert asset_store.get_path("0" * 64) is None
+
+
+def test_components_refer_to_assets(tmp_path: Path, asset_store: AssetStore):
+    image_path = tmp_path / "image.png"
+    image_path.write_bytes(b"image")
+
+    image = hardpy.ImageComponent(address=str(image_path))
+    assert image.base64 == ""
+    assert image.asset == asset_store.put_file(image_path)
+
+    html = hardpy.HTMLComponent(html="<p>Step</p>")
+    assert not html.is_raw_html
+    assert html.code_or_url.startswith(ASSET_URL)
+    asset_id = html.code_or_url.removeprefix(ASSET_URL)
+    asset_path = asset_store.get_path(asset_id)
+    assert asset_path is not None
+    assert asset_path.read_text() == "<p>Step</p>"
+
+    dbx = hardpy.DialogBox(dialog_text="text", image=image, html=html)
+    dbx_dict = dbx.to_dict()
+    assert dbx_dict["image"]["asset"] == image.asset
+    assert dbx_dict["html"]["code_or_url"] == html.code_or_url
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from hardpy.pytest_hardpy.db.couchdb_maintenance import (
+    compact_if_needed,
+    needs_compaction,
+    set_revs_limit,
+)
+
+
+class Resource:
+    """Fake CouchDB database resource."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+
+    def put(self, path: str, data: str) -> tuple:
+        """Record PUT request."""
+        self.requests.append((path, data))
+        return None, {"ok": True}
+
+
+class Database:
+    """Fake CouchDB database with the database info."""
+
+    def __init__(
+        self,
+        file_size: int,
+        active_size: int,
+        running: bool = False,
+    ) -> None:
+        self.resource = Resource()
+        self.compactions = 0
+        self._info = {
+            "compact_running": running,
+            "sizes": {"file": file_size, "active": active_size, "external": 0},
+        }
+
+    def config(self) -> dict:
+        """Get database info."""
+        return self._info
+
+    def compact(self) -> dict:
+        """Start compaction."""
+        self.compactions += 1
+        return {"ok": True}
+
+
+def test_needs_compaction_by_ratio():
+    assert needs_compaction(Database(2000, 1000), 2.0)
+    assert not needs_compaction(Database(1900, 1000), 2.0)
+    assert needs_compaction(Database(1900, 1000), 1.5)
+    assert not needs_compaction(Database(5000, 1000, running=True), 2.0)
+    assert not needs_compaction(Database(0, 0), 2.0)
+
+
+def test_compact_if_needed():
+    grown = Database(4000, 1000)
+    assert compact_if_needed(grown, 2.0)
+    assert grown.compactions == 1
+
+    compacted = Database(1100, 1000)
+    assert not compact_if_needed(compacted, 2.0)
+    assert compacted.compactions == 0
+
+
+def test_set_revs_limit():
+    db = Database(0, 0)
+    set_revs_limit(db, 10)
+    assert db.resource.requests == [("_revs_limit", "10")]
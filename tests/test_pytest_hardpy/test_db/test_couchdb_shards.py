@@ -0,0 +1,105 @@
+import copy
+from typing import Any
+
+from hardpy.pytest_hardpy.db.couchdb_shards import ShardedDocument
+
+
+class Database:
+    """In-memory database with the pycouchdb bulk API used by the shards."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict] = {}
+        self.saved: list[list[str]] = []
+
+    def all(self, as_list: bool, **kwargs: Any) -> list[dict]:  # noqa: ANN401, ARG002
+        """Get the documents in the key range."""
+        ids = sorted(
+            doc_id
+            for doc_id in self.docs
+            if kwargs["startkey"] <= doc_id <= kwargs["endkey"]
+        )
+        return [
+            {"id": doc_id, "doc": copy.deepcopy(self.docs[doc_id])} for doc_id in ids
+        ]
+
+    def save_bulk(self, docs: list[dict], transaction: bool) -> list[dict]:  # noqa: ARG002
+        """Save the documents."""
+        self.saved.append([doc["_id"] for doc in docs])
+        docs = copy.deepcopy(docs)
+        for doc in docs:
+            if doc.get("_deleted"):
+                self.docs.pop(doc["_id"])
+                continue
+            rev = int(self.docs.get(doc["_id"], {}).get("_rev", "0").split("-")[0])
+            doc["_rev"] = f"{rev + 1}-rev"
+            self.docs[doc["_id"]] = copy.deepcopy(doc)
+        return docs
+
+    def delete_bulk(self, docs: list[dict], transaction: bool) -> list[dict]:  # noqa: ARG002
+        """Delete the documents."""
+        for doc in docs:
+            self.docs.pop(doc["_id"])
+        return docs
+
+
+def _doc() -> dict:
+    return {
+        "_id": "doc",
+        "status": "ready",
+        "modules": {
+            "test_1": {
+                "status": "ready",
+                "cases": {
+                    "test_a": {"status": "ready", "measurements": []},
+                    "test_b": {"status": "ready", "measurements": []},
+                },
+            },
+            "test_2": {"status": "ready", "cases": {}},
+        },
+    }
+
+
+def test_sharded_document_round_trip():
+    db = Database()
+    writer = ShardedDocument(db, "doc")  # type: ignore[arg-type]
+    assert writer.load() is None
+
+    doc = _doc()
+    writer.mark_all_dirty()
+    writer.save(doc)
+    assert sorted(db.docs) == [
+        "doc",
+        "doc:test_1",
+        "doc:test_1:test_a",
+        "doc:test_1:test_b",
+        "doc:test_2",
+    ]
+
+    loaded = ShardedDocument(db, "doc").load()  # type: ignore[arg-type]
+    assert loaded is not None
+    assert loaded.pop("_rev") == doc.pop("_rev")
+    assert loaded == doc
+
+
+def test_sharded_document_writes_changed_shards():
+    db = Database()
+    writer = ShardedDocument(db, "doc")  # type: ignore[arg-type]
+    doc = _doc()
+    writer.mark_all_dirty()
+    writer.save(doc)
+
+    doc["modules"]["test_1"]["cases"]["test_b"]["status"] = "passed"
+    writer.mark_dirty("modules.test_1.cases.test_b.status")
+    writer.save(doc)
+    assert db.saved[-1] == ["doc:test_1:test_b"]
+
+    del doc["modules"]["test_2"]
+    writer.mark_dirty("modules.test_2")
+    writer.save(doc)
+    assert "doc:test_2" not in db.docs
+
+    loaded = ShardedDocument(db, "doc").load()  # type: ignore[arg-type]
+    assert loaded is not None
+    loaded.pop("_rev")
+    doc.pop("_rev")
+    assert loaded == doc
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.incremental_json import IncrementalJsonEncoder
+from hardpy.pytest_hardpy.db.runstore import JsonRunStore
+
+
+def _doc() -> dict:
+    return {
+        "_id": "doc",
+        "status": "ready",
+        "modules": {
+            "test_1": {
+                "status": "ready",
+                "cases": {
+                    "test_a": {"status": "ready", "measurements": []},
+                    "test_b": {"status": "ready", "measurements": []},
+                },
+            },
+            "test_2": {"status": "ready", "cases": {}},
+        },
+        "dut": {"info": {}},
+    }
+
+
+def test_encoder_output_equals_json_dump():
+    doc = _doc()
+    encoder = IncrementalJsonEncoder()
+    assert encoder.dumps(doc) == json.dumps(doc, indent=2, default=str)
+
+    doc["modules"]["test_1"]["cases"]["test_a"]["measurements"].append({"value": 1})
+    encoder.mark_dirty("modules.test_1.cases.test_a.measurements")
+    doc["modules"]["test_2"]["status"] = "run"
+    encoder.mark_dirty("modules.test_2.status")
+    doc["dut"]["info"]["path"] = Path("dut")
+    encoder.mark_dirty("dut.info.path")
+    assert encoder.dumps(doc) == json.dumps(doc, indent=2, default=str)
+
+
+def test_encoder_dirty_paths():
+    encoder = IncrementalJsonEncoder()
+    encoder.dumps(_doc())
+    encoder.mark_clean()
+    assert not encoder.is_dirty
+
+    encoder.mark_dirty("modules.test_1.cases.test_a.status")
+    encoder.mark_dirty("dut.info.key")
+    encoder.mark_dirty("modules.test_2")
+    encoder.mark_dirty("modules.test_3.status")
+    assert encoder.dirty_paths == {
+        ("modules", "test_1", "cases", "test_a"),
+        ("dut",),
+        ("modules", "test_2", "cases"),
+        ("modules", "test_3"),
+    }
+
+
+def test_json_store_skips_clean_flush(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    runstore = JsonRunStore()
+
+    runstore.update_doc_value("modules.test_1.cases.test_a.status", "run")
+    runstore.update_db()
+    doc_id = config_manager.config.database.doc_id
+    file_path = tmp_path / "storage" / "runstore" / f"{doc_id}.json"
+    assert runstore.last_flush_size == file_path.stat().st_size
+
+    runstore.update_db()
+    assert runstore.last_flush_size == 0
+
+    with file_path.open() as f:
+        assert json.load(f)["modules"]["test_1"]["cases"]["test_a"]["status"] == "run"
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.journal import JsonJournal
+from hardpy.pytest_hardpy.db.runstore import JournalRunStore
+
+
+def test_journal_reads_new_records(tmp_path: Path):
+    snapshot = tmp_path / "doc.json"
+    writer = JsonJournal(snapshot)
+    writer.write_snapshot(json.dumps({"_id": "doc", "modules": {}}))
+
+    reader = JsonJournal(snapshot)
+    doc = reader.read(None)
+    assert doc == {"_id": "doc", "modules": {}}
+
+    writer.append([("modules.test_1.status", "run"), ("status", "run")])
+    doc = reader.read(doc)
+    assert doc == {
+        "_id": "doc",
+        "modules": {"test_1": {"status": "run"}},
+        "status": "run",
+    }
+
+    writer.append([("modules.test_1.status", "passed")])
+    assert reader.read(doc)["modules"]["test_1"]["status"] == "passed"
+
+
+def test_journal_reloads_after_compaction(tmp_path: Path):
+    snapshot = tmp_path / "doc.json"
+    writer = JsonJournal(snapshot)
+    writer.write_snapshot(json.dumps({"status": "ready"}))
+    writer.append([("status", "run")])
+
+    reader = JsonJournal(snapshot)
+    doc = reader.read(None)
+    assert doc == {"status": "run"}
+
+    writer.write_snapshot(json.dumps({"status": "passed"}))
+    assert writer.journal_path.stat().st_size == 0
+    assert reader.read(doc) == {"status": "passed"}
+
+
+def test_journal_runstore(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    doc_id = config_manager.config.database.doc_id
+    file_path = tmp_path / "storage" / "runstore" / f"{doc_id}.json"
+    journal_path = file_path.with_suffix(".jsonl")
+
+    runstore = JournalRunStore()
+    runstore.update_db()
+    snapshot_size = file_path.stat().st_size
+
+    runstore.update_doc_value("modules.test_1.cases.test_a.status", "run")
+    runstore.update_doc_value("modules.test_1.cases.test_a.status", "passed")
+    runstore.update_db()
+    assert file_path.stat().st_size == snapshot_size
+    with journal_path.open() as f:
+        records = [json.loads(line) for line in f]
+    assert records == [
+        {"path": "modules.test_1.cases.test_a.status", "value": "passed"},
+    ]
+
+    runstore.compact()
+    assert journal_path.stat().st_size == 0
+    with file_path.open() as f:
+        case = json.load(f)["modules"]["test_1"]["cases"]["test_a"]
+    assert case["status"] == "passed"
+
+
+def test_journal_has_changed(tmp_path: Path):
+    snapshot = tmp_path / "doc.json"
+    writer = JsonJournal(snapshot)
+    writer.write_snapshot(json.dumps({"status": "ready"}))
+
+    reader = JsonJournal(snapshot)
+    doc = reader.read(None)
+    assert not reader.has_changed()
+
+    writer.append([("status", "run")])
+    assert reader.has_changed()
+    doc = reader.read(doc)
+    assert not reader.has_changed()
+
+    writer.write_snapshot(json.dumps({"status": "passed"}))
+    assert reader.has_changed()
+
+
+def test_journal_skips_own_records(tmp_path: Path):
+    snapshot = tmp_path / "doc.json"
+    journal = JsonJournal(snapshot)
+    journal.write_snapshot(json.dumps({"status": "ready"}))
+
+    journal.append([("status", "run")])
+    assert not journal.has_changed()
+
+    other = JsonJournal(snapshot)
+    other.read(None)
+    other.append([("status", "passed")])
+    journal.append([("status", "failed")])
+    assert journal.has_changed()
+    assert journal.read({"status": "run"}) == {"status": "failed"}
@@ -0,0 +1,95 @@
+import contextlib
+import json
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager, JsonCodecType
+from hardpy.pytest_hardpy.db import json_codec
+from hardpy.pytest_hardpy.db.incremental_json import IncrementalJsonEncoder
+from hardpy.pytest_hardpy.db.json_codec import OrjsonCodec, StdlibCodec, get_codec
+from hardpy.pytest_hardpy.db.runstore import JsonRunStore
+
+
+def _doc() -> dict:
+    return {
+        "_id": "doc",
+        "name": "Тест",
+        "modules": {
+            "test_1": {
+                "status": "ready",
+                "cases": {"test_a": {"measurements": [{"value": 1.5}]}},
+            },
+        },
+        "artifact": {"path": Path("log.txt")},
+    }
+
+
+def _codecs() -> list:
+    codecs = [StdlibCodec(), StdlibCodec(indent=None)]
+    with contextlib.suppress(ImportError):
+        codecs.append(OrjsonCodec())
+    return codecs
+
+
+def test_codecs_round_trip():
+    doc = _doc()
+    expected = json.loads(json.dumps(doc, default=str))
+    for codec in _codecs():
+        assert codec.loads(codec.dumps(doc)) == expected
+        assert "\n" not in codec.dumps(doc, compact=True)
+        assert codec.loads(codec.dumps(doc).encode()) == expected
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{")
+
+
+def test_incremental_encoder_with_codec():
+    for codec in _codecs():
+        doc = _doc()
+        encoder = IncrementalJsonEncoder(codec)
+        assert encoder.dumps(doc) == codec.dumps(doc)
+
+        doc["modules"]["test_1"]["cases"]["test_a"]["measurements"].append({})
+        encoder.mark_dirty("modules.test_1.cases.test_a.measurements")
+        assert encoder.dumps(doc) == codec.dumps(doc)
+
+
+def test_missing_codec_falls_back_to_compact(monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(
+        config_manager.config.database,
+        "json_codec",
+        JsonCodecType.MSGSPEC,
+    )
+    monkeypatch.setattr(json_codec, "_codecs", {})
+    monkeypatch.setattr(json_codec, "MsgspecCodec", _raise_import_error)
+
+    codec = get_codec()
+    assert isinstance(codec, StdlibCodec)
+    assert codec.indent is None
+    assert get_codec() is codec
+
+
+def test_json_store_with_compact_codec(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    monkeypatch.setattr(
+        config_manager.config.database,
+        "json_codec",
+        JsonCodecType.COMPACT,
+    )
+    runstore = JsonRunStore()
+    runstore.update_doc_value("modules.test_1.cases.test_a.status", "run")
+    runstore.update_db()
+
+    doc_id = config_manager.config.database.doc_id
+    data = (tmp_path / "storage" / "runstore" / f"{doc_id}.json").read_text()
+    assert "\n" not in data
+    assert json.loads(data)["modules"]["test_1"]["cases"]["test_a"]["status"] == "run"
+
+
+def _raise_import_error() -> None:
+    raise ImportError
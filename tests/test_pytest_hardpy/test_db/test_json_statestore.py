@@ -0,0 +1,66 @@
+from pathlib import Path
+from threading import Timer
+from time import monotonic
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.statestore import JsonStateStore
+
+
+def test_json_statestore_wait_for_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    statestore = JsonStateStore()
+    statestore.update_db()
+    statestore.update_doc()
+
+    start = monotonic()
+    statestore.wait_for_change(0.1)
+    assert monotonic() - start >= 0.1
+
+    panel_statestore = JsonStateStore()
+    panel_statestore.update_doc()
+    panel_statestore.update_doc_value("operator_data.dialog", "ok")
+    timer = Timer(0.1, panel_statestore.update_db)
+    timer.start()
+    start = monotonic()
+    statestore.wait_for_change(10)
+    timer.join()
+    assert monotonic() - start < 1
+    statestore.update_doc()
+    assert statestore.get_field("operator_data.dialog") == "ok"
+
+
+def test_json_statestore_wait_backs_off(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    statestore = JsonStateStore()
+    statestore.update_db()
+    statestore.update_doc()
+
+    checks = []
+    monkeypatch.setattr(statestore, "_has_changed", lambda: checks.append(1) and False)
+    statestore.wait_for_change(1)
+    # 20, 40, 80, 160 ms and then 250 ms intervals instead of 50 checks per second
+    assert len(checks) <= 10
+
+
+def test_json_statestore_skips_own_writes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    statestore = JsonStateStore()
+    statestore.update_doc_value("operator_data.dialog", "ok")
+    statestore.update_db()
+    start = monotonic()
+    statestore.wait_for_change(0.1)
+    assert monotonic() - start >= 0.1
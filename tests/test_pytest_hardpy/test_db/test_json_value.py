@@ -0,0 +1,67 @@
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+from hardpy.pytest_hardpy.db.json_value import to_json_value
+
+
+class Color(str, Enum):
+    """String enum."""
+
+    RED = "red"
+
+
+class Array:
+    """Array with the numpy conversion interface."""
+
+    def tolist(self) -> list:
+        """Convert to list."""
+        return [1, (2, 3)]
+
+
+def test_json_values_are_not_copied():
+    value = {"x": list(range(10)), "y": [1.5, None, True], "name": "chart"}
+
+    result = to_json_value(value)
+    assert result is value
+    assert result["x"] is value["x"]
+
+
+def test_non_json_values_are_converted():
+    time = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    values = [1, 2]
+    value = {
+        "time": time,
+        "path": Path("report") / "log.txt",
+        "color": Color.RED,
+        "pair": (1, time),
+        "values": values,
+        1: {"tags": {"a"}},
+    }
+
+    result = to_json_value(value)
+    assert result is not value
+    assert result == {
+        "time": str(time),
+        "path": str(Path("report") / "log.txt"),
+        "color": Color.RED,
+        "pair": [1, str(time)],
+        "values": [1, 2],
+        1: {"tags": ["a"]},
+    }
+    assert result["values"] is values
+    assert isinstance(value["time"], datetime)
+    assert json.loads(json.dumps(result))["color"] == "red"
+
+
+def test_unknown_values_are_converted_to_str():
+    class Point:
+        def __str__(self) -> str:
+            return "point"
+
+    assert to_json_value([Point(), b"data"]) == ["point", "b'data'"]
+
+
+def test_numpy_like_values_are_converted():
+    assert to_json_value({"array": Array()}) == {"array": [1, [2, 3]]}
@@ -0,0 +1,32 @@
+import pytest
+
+from hardpy.pytest_hardpy.db.key_path import get_value, parse_key, set_value
+
+
+def test_parse_key_is_cached():
+    assert parse_key("modules.test_1.status") == ("modules", "test_1", "status")
+    assert parse_key("modules.test_1.status") is parse_key("modules.test_1.status")
+
+
+def test_get_value():
+    doc = {"modules": {"test_1": {"status": "run", "measurements": [{"value": 1}]}}}
+
+    assert get_value(doc, "modules.test_1.status") == "run"
+    assert get_value(doc, "modules.test_1.measurements.0.value") == 1
+    for key in ("modules.test_2", "modules.test_1.status.name", "modules.test_1.x.y"):
+        with pytest.raises(KeyError):
+            get_value(doc, key)
+
+
+def test_set_value():
+    doc: dict = {"modules": {"test_1": {"measurements": [{"value": 1}]}, "alert": ""}}
+
+    set_value(doc, "modules.test_1.cases.test_a.status", "run")
+    set_value(doc, "modules.test_1.measurements.0.value", 2)
+    set_value(doc, "status", "ready")
+    assert doc["modules"]["test_1"]["cases"] == {"test_a": {"status": "run"}}
+    assert doc["modules"]["test_1"]["measurements"] == [{"value": 2}]
+    assert doc["status"] == "ready"
+
+    with pytest.raises(KeyError):
+        set_value(doc, "modules.alert.text", "error")
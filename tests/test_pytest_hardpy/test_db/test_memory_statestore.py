@@ -0,0 +1,88 @@
+from collections.abc import Generator
+from threading import Thread, Timer
+from time import monotonic, sleep
+
+import pytest
+
+from hardpy.pytest_hardpy.db.memory_statestore import StateStoreServer, connect
+from hardpy.pytest_hardpy.db.statestore import MemoryStateStore
+
+
+@pytest.fixture
+def server() -> Generator[StateStoreServer]:
+    server = StateStoreServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_memory_statestore(server: StateStoreServer):
+    statestore = MemoryStateStore()
+    statestore.update_db()
+    statestore.update_doc_value("modules.test_1.status", "run")
+    statestore.update_doc_value("modules.test_1.cases.test_a.status", "run")
+    statestore.update_db()
+    # the request is handled after the pushed changes
+    statestore.update_doc()
+
+    doc = server.snapshot()
+    assert doc is not None
+    assert doc["modules"]["test_1"]["status"] == "run"
+    assert doc["modules"]["test_1"]["cases"]["test_a"]["status"] == "run"
+
+    panel_statestore = MemoryStateStore()
+    panel_statestore.update_doc()
+    panel_statestore.update_doc_value("operator_data.dialog", "ok")
+    panel_statestore.update_db()
+    panel_statestore.update_doc()
+
+    statestore.update_doc()
+    assert statestore.get_field("operator_data.dialog") == "ok"
+    assert statestore.get_field("modules.test_1.status") == "run"
+
+
+def test_memory_statestore_wait_for_change(server: StateStoreServer):  # noqa: ARG001
+    statestore = MemoryStateStore()
+    statestore.update_db()
+    statestore.update_doc()
+
+    start = monotonic()
+    statestore.wait_for_change(0.1)
+    assert monotonic() - start >= 0.1
+
+    panel_statestore = MemoryStateStore()
+    panel_statestore.update_doc()
+    panel_statestore.update_doc_value("operator_data.dialog", "ok")
+    timer = Timer(0.1, panel_statestore.update_db)
+    timer.start()
+    start = monotonic()
+    statestore.wait_for_change(10)
+    timer.join()
+    assert monotonic() - start < 1
+    statestore.update_doc()
+    assert statestore.get_field("operator_data.dialog") == "ok"
+
+
+def test_memory_statestore_without_server():
+    with pytest.raises(ConnectionError):
+        connect()
+
+
+def test_memory_statestore_update_during_wait(server: StateStoreServer):
+    statestore = MemoryStateStore()
+    statestore.update_db()
+    statestore.update_doc()
+    version = server.version
+
+    waiter = Thread(target=statestore.wait_for_change, args=(10,))
+    waiter.start()
+    sleep(0.1)
+    statestore.update_doc_value("modules.test_1.status", "run")
+    start = monotonic()
+    statestore.update_db()
+    assert monotonic() - start < 0.5
+    waiter.join()
+
+    # the own changes are not received again
+    assert server.version == version + 1
+    assert statestore._get_revision() == server.version  # noqa: SLF001
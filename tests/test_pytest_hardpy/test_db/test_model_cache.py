@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db import json_store
+from hardpy.pytest_hardpy.db.model_cache import ModelCache
+from hardpy.pytest_hardpy.db.runstore import JsonRunStore, _create_default_doc_structure
+from hardpy.pytest_hardpy.db.schema import ResultRunStore
+
+HEADER = {"status": "ready", "name": "run", "start_time": None, "stop_time": None}
+
+
+def _module(name: str) -> dict:
+    return {**HEADER, "name": name, "group": "main", "cases": {}}
+
+
+def _doc() -> dict:
+    doc = _create_default_doc_structure("doc", "doc")
+    doc.update(HEADER)
+    doc["modules"] = {"test_1": _module("first"), "test_2": _module("second")}
+    return doc
+
+
+def test_model_cache_is_keyed_by_revision():
+    cache = ModelCache(ResultRunStore)
+    doc = _doc()
+
+    model = cache.get(doc, "1-a")
+    assert cache.get(doc, "1-a") is model
+    assert cache.get(doc, "2-b") is not model
+    assert cache.get(doc, None) is not cache.get(doc, None)
+
+
+def test_document_view_validates_modules_on_access():
+    doc = _doc()
+    doc["modules"]["test_2"]["group"] = "unknown"
+    view = ModelCache(ResultRunStore).get_view(doc, "1-a")
+
+    assert view.name == "run"
+    assert list(view.modules) == ["test_1", "test_2"]
+    assert view.modules["test_1"].name == "first"
+    assert view.modules["test_1"] is view.modules["test_1"]
+    with pytest.raises(ValidationError):
+        view.modules["test_2"]
+    with pytest.raises(ValidationError):
+        view.model()
+
+
+def test_document_view_reuses_cached_model():
+    doc = _doc()
+    cache = ModelCache(ResultRunStore)
+    model = cache.get(doc, "1-a")
+
+    view = cache.get_view(doc, "1-a")
+    assert view.model() is model
+    assert view.modules["test_2"] is model.modules["test_2"]
+
+
+def test_json_store_caches_document(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    runstore = JsonRunStore()
+    for key, value in HEADER.items():
+        runstore.update_doc_value(key, value)
+    runstore.update_db()
+
+    report = runstore.get_document()
+    assert runstore.get_document() is report
+
+    # changes that are not flushed are discarded
+    runstore.update_doc_value("name", "changed")
+    assert runstore.get_document() is report
+
+    runstore.update_doc_value("modules.test_1", _module("first"))
+    runstore.update_db()
+    new_report = runstore.get_document()
+    assert new_report is not report
+    assert new_report.modules["test_1"].name == "first"
+    assert (
+        runstore.get_document_view().modules["test_1"] is new_report.modules["test_1"]
+    )
+
+
+def test_json_store_revision_by_file_status(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    runstore = JsonRunStore()
+    for key, value in {**HEADER, "name": "first"}.items():
+        runstore.update_doc_value(key, value)
+    runstore.update_db()
+    report = runstore.get_document()
+
+    # the file modified in place keeps the status on coarse timestamps
+    file_path = runstore._file_path  # noqa: SLF001
+    stat = file_path.stat()
+    file_path.write_text(file_path.read_text().replace("first", "other"))
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    new_report = runstore.get_document()
+    assert new_report is not report
+    assert new_report.name == "other"
+
+    # the file that is not modified recently is not read again
+    monkeypatch.setattr(json_store, "_RACY_INTERVAL_NS", 0)
+    assert runstore.get_document() is new_report
+    reads = []
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(
+        Path,
+        "read_bytes",
+        lambda path: reads.append(path) or read_bytes(path),
+    )
+    assert runstore.get_document() is new_report
+    assert reads == []
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.sqlite_storage import SqliteDocument, connect
+from hardpy.pytest_hardpy.db.tempstore import SqliteTempStore
+
+
+def _doc() -> dict:
+    return {
+        "_id": "doc",
+        "status": "ready",
+        "modules": {
+            "test_1": {
+                "status": "ready",
+                "cases": {
+                    "test_a": {"status": "ready", "measurements": []},
+                    "test_b": {"status": "ready", "measurements": []},
+                },
+            },
+            "test_2": {"status": "ready", "cases": {}},
+        },
+        "dut": {"info": {}},
+    }
+
+
+class Report:
+    """Report stub with the document as the dump."""
+
+    def model_dump(self) -> dict:
+        """Dump the report."""
+        return _doc()
+
+
+def test_document_round_trip(tmp_path: Path):
+    path = tmp_path / "hardpy.sqlite3"
+    writer = SqliteDocument(connect(path), "runstore", "doc")
+    assert writer.load() is None
+
+    doc = _doc()
+    writer.mark_all_dirty()
+    writer.save(doc)
+    assert not writer.is_dirty
+
+    reader = SqliteDocument(connect(path), "runstore", "doc")
+    loaded = reader.load()
+    assert loaded == doc
+    assert list(loaded["modules"]["test_1"]["cases"]) == ["test_a", "test_b"]
+
+
+def test_document_writes_changed_rows(tmp_path: Path):
+    path = tmp_path / "hardpy.sqlite3"
+    writer = SqliteDocument(connect(path), "runstore", "doc")
+    doc = _doc()
+    writer.mark_all_dirty()
+    writer.save(doc)
+
+    reader = SqliteDocument(connect(path), "runstore", "doc")
+    reader.load()
+    assert not reader.has_changed()
+    version = reader.get_version()
+
+    doc["modules"]["test_1"]["cases"]["test_b"]["status"] = "passed"
+    writer.mark_dirty("modules.test_1.cases.test_b.status")
+    doc["modules"]["test_3"] = {"cases": {"test_c": {"status": "run"}}}
+    writer.mark_dirty("modules.test_3.cases.test_c")
+    del doc["modules"]["test_2"]
+    writer.mark_dirty("modules.test_2")
+    writer.save(doc)
+
+    assert reader.has_changed()
+    assert reader.get_version() != version
+    assert reader.load() == doc
+
+
+def test_document_version_is_per_document(tmp_path: Path):
+    path = tmp_path / "hardpy.sqlite3"
+    statestore = SqliteDocument(connect(path), "statestore", "doc")
+    statestore.load()
+    statestore.mark_all_dirty()
+    statestore.save(_doc())
+    assert not statestore.has_changed()
+
+    runstore = SqliteDocument(connect(path), "runstore", "doc")
+    runstore.mark_all_dirty()
+    runstore.save(_doc())
+    assert not statestore.has_changed()
+    assert statestore.get_version() == 1
+
+
+def test_sqlite_tempstore(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    tempstore = SqliteTempStore()
+
+    assert tempstore.push_report(Report())  # type: ignore[arg-type]
+    reports = list(tempstore.reports())
+    assert len(reports) == 1
+    assert reports[0]["status"] == "ready"
+
+    assert tempstore.delete(reports[0]["_id"])
+    assert not tempstore.delete(reports[0]["_id"])
+    assert list(tempstore.reports()) == []
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+from threading import Barrier
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.reporter.flusher import DocumentFlusher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+
+class FakeStore:
+    """Store that counts database writes."""
+
+    def __init__(self) -> None:
+        self.writes = 0
+
+    def update_db(self) -> None:
+        """Count database write."""
+        self.writes += 1
+
+
+@pytest.fixture
+def store() -> FakeStore:
+    return FakeStore()
+
+
+@pytest.fixture
+def make_flusher(store: FakeStore) -> Generator[Callable[..., DocumentFlusher]]:
+    def _make(
+        interval: float,
+        *stores: FakeStore,
+        concurrent: bool = False,
+    ) -> DocumentFlusher:
+        SingletonMeta._instances.pop(DocumentFlusher, None)  # noqa: SLF001
+        statestore, runstore = stores or (store, store)
+        return DocumentFlusher(statestore, runstore, interval, concurrent)  # type: ignore
+
+    yield _make
+    flusher = SingletonMeta._instances.pop(DocumentFlusher, None)  # noqa: SLF001
+    if flusher:
+        flusher.stop()
+
+
+def test_sync_flusher(make_flusher: Callable, store: FakeStore):
+    flusher = make_flusher(0)
+    flusher.request()
+    flusher.request()
+    assert store.writes == 4
+    flusher.flush()
+    assert store.writes == 4
+
+
+def test_write_behind_flusher(make_flusher: Callable, store: FakeStore):
+    flusher = make_flusher(60)
+    for _ in range(100):
+        flusher.request()
+    flusher.flush()
+    # the first request may already be flushed by the background thread
+    assert store.writes in {2, 4}
+    assert not flusher.is_pending
+
+    flusher.request()
+    assert flusher.is_pending
+    flusher.stop()
+    assert not flusher.is_pending
+    assert store.writes in {4, 6}
+
+
+def test_held_flusher(make_flusher: Callable, store: FakeStore):
+    flusher = make_flusher(0)
+    flusher.hold()
+    flusher.hold()
+    for _ in range(10):
+        flusher.request()
+    flusher.release()
+    assert store.writes == 0
+    flusher.release()
+    assert store.writes == 2
+    assert not flusher.is_pending
+
+
+class SlowStore(FakeStore):
+    """Store that is written only together with the other store."""
+
+    def __init__(self, barrier: Barrier, error: Exception | None = None) -> None:
+        super().__init__()
+        self.barrier = barrier
+        self.error = error
+
+    def update_db(self) -> None:
+        """Wait for the other store and count database write."""
+        # both stores must be written at the same time to pass the barrier
+        self.barrier.wait(timeout=5)
+        if self.error:
+            raise self.error
+        super().update_db()
+
+
+def test_concurrent_flusher(make_flusher: Callable):
+    barrier = Barrier(2)
+    statestore, runstore = SlowStore(barrier), SlowStore(barrier)
+    flusher = make_flusher(0, statestore, runstore, concurrent=True)
+    flusher.request()
+    flusher.request()
+    assert (statestore.writes, runstore.writes) == (2, 2)
+
+
+def test_concurrent_flusher_errors(
+    make_flusher: Callable,
+    caplog: pytest.LogCaptureFixture,
+):
+    barrier = Barrier(2)
+    statestore_error, runstore_error = OSError("statestore"), OSError("runstore")
+    statestore = SlowStore(barrier, statestore_error)
+    runstore = SlowStore(barrier, runstore_error)
+    flusher = make_flusher(0, statestore, runstore, concurrent=True)
+    with caplog.at_level(logging.ERROR), pytest.raises(OSError, match="statestore"):
+        flusher.request()
+    errors = [record.exc_info[1] for record in caplog.records if record.exc_info]
+    assert errors == [statestore_error, runstore_error]
@@ -0,0 +1,148 @@
+from collections.abc import Generator
+from threading import Timer
+from time import monotonic, sleep
+from typing import Any
+
+import pytest
+
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy import pytest_call
+from hardpy.pytest_hardpy.utils.operator_channel import (
+    AUTHKEY_ENV,
+    DATA,
+    OperatorChannel,
+    OperatorChannelServer,
+)
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Generator[OperatorChannelServer]:
+    server = OperatorChannelServer()
+    for name, value in server.open().items():
+        monkeypatch.setenv(name, value)
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def channel() -> Generator[OperatorChannel]:
+    SingletonMeta._instances.pop(OperatorChannel, None)  # noqa: SLF001
+    yield OperatorChannel()
+    SingletonMeta._instances.pop(OperatorChannel, None)  # noqa: SLF001
+
+
+def _send(server: OperatorChannelServer, data: str) -> None:
+    # the connection is accepted in the background thread
+    deadline = monotonic() + 5
+    while not server.send(DATA, data):
+        assert monotonic() < deadline
+        sleep(0.01)
+
+
+def test_operator_channel(server: OperatorChannelServer, channel: OperatorChannel):
+    channel.connect(server.address)
+    assert channel.is_connected
+
+    _send(server, "ok")
+    assert channel.take_data(5) == "ok"
+    assert channel.take_data(0.01) is None
+
+    server.send(DATA, "first")
+    server.send(DATA, "last")
+    sleep(0.1)
+    assert channel.take_data(5) == "last"
+
+    server.close()
+    assert channel.take_data(5) is None
+    assert not channel.is_connected
+    assert not server.send(DATA, "closed")
+
+
+def test_operator_channel_without_server(
+    monkeypatch: pytest.MonkeyPatch,
+    channel: OperatorChannel,
+):
+    monkeypatch.delenv(AUTHKEY_ENV, raising=False)
+    channel.connect("missing")
+    assert not channel.is_connected
+    assert channel.take_data(5) is None
+
+
+class FakeReporter:
+    """Reporter with the statestore fields in memory."""
+
+    fields: dict[str, Any] = {}  # noqa: RUF012
+    reloads = 0
+
+    def generate_key(self, *args: str) -> str:
+        """Join the key parts."""
+        return ".".join(args)
+
+    def update_doc_by_db(self) -> None:
+        """Count the reloads, the fields are shared."""
+        FakeReporter.reloads += 1
+
+    def get_field(self, key: str) -> Any:  # noqa: ANN401
+        """Get the field."""
+        return self.fields.get(key)
+
+    def set_doc_value(self, key: str, value: Any, **_: bool) -> None:  # noqa: ANN401
+        """Set the field."""
+        self.fields[key] = value
+
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait for the timeout."""
+        sleep(min(timeout, 0.01))
+
+
+@pytest.fixture
+def reporter(monkeypatch: pytest.MonkeyPatch) -> type[FakeReporter]:
+    monkeypatch.setattr(pytest_call, "RunnerReporter", FakeReporter)
+    monkeypatch.setattr(FakeReporter, "fields", {})
+    monkeypatch.setattr(FakeReporter, "reloads", 0)
+    return FakeReporter
+
+
+def test_operator_data_from_channel(
+    reporter: type[FakeReporter],
+    server: OperatorChannelServer,
+    channel: OperatorChannel,
+):
+    channel.connect(server.address)
+    _send(server, "previous")
+    channel.take_data(5)
+    server.send(DATA, "leftover")
+    sleep(0.1)
+    channel.clear_data()
+
+    # the statestore is not reloaded while the channel is connected
+    timer = Timer(0.6, server.send, (DATA, "ok"))
+    timer.start()
+    assert pytest_call._get_operator_data() == "ok"  # noqa: SLF001
+    timer.join()
+    assert reporter.reloads == 0
+
+
+def _fall_back(server: OperatorChannelServer, reporter: type[FakeReporter]) -> None:
+    server.close()
+    reporter.fields["operator_data.dialog"] = "ok"
+
+
+def test_operator_data_from_statestore(
+    reporter: type[FakeReporter],
+    server: OperatorChannelServer,
+    channel: OperatorChannel,
+):
+    channel.connect(server.address)
+    _send(server, "previous")
+    channel.take_data(5)
+
+    # the channel fails and the panel writes the response to the statestore
+    timer = Timer(0.1, _fall_back, (server, reporter))
+    timer.start()
+    start = monotonic()
+    assert pytest_call._get_operator_data() == "ok"  # noqa: SLF001
+    timer.join()
+    assert monotonic() - start < 5
+    assert reporter.fields["operator_data.dialog"] == ""
+    assert not channel.is_connected
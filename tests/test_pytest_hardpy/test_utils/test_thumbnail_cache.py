@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.utils.thumbnail_cache import ThumbnailCache
+
+
+@pytest.fixture
+def image_max_size(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[int]:
+    config_manager = ConfigManager()
+    monkeypatch.setattr(config_manager.config.database, "storage_path", str(tmp_path))
+    monkeypatch.setattr(config_manager.config.database, "image_max_size", 100)
+    SingletonMeta._instances.pop(ThumbnailCache, None)  # noqa: SLF001
+    yield 100
+    SingletonMeta._instances.pop(ThumbnailCache, None)  # noqa: SLF001
+
+
+def test_downscale_large_image(tmp_path: Path, image_max_size: int):
+    image_module = pytest.importorskip("PIL.Image")
+    image_path = tmp_path / "photo.jpg"
+    image_module.new("RGB", (400, 300), "red").save(image_path)
+    small_path = tmp_path / "small.png"
+    image_module.new("RGB", (50, 50), "red").save(small_path)
+
+    cache = ThumbnailCache()
+    thumbnail_path = cache.get_path(image_path)
+    assert thumbnail_path != image_path
+    with image_module.open(thumbnail_path) as thumbnail:
+        assert thumbnail.format == "JPEG"
+        assert max(thumbnail.size) == image_max_size
+    # the image displayed at the half width keeps twice the size
+    with image_module.open(cache.get_path(image_path, width=50)) as thumbnail:
+        assert max(thumbnail.size) == image_max_size * 2
+    assert cache.get_path(small_path) == small_path.resolve()
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    assert cache.get_path(image_path) == thumbnail_path
+    SingletonMeta._instances.pop(ThumbnailCache, None)  # noqa: SLF001
+    cache = ThumbnailCache()
+    assert cache.get_path(image_path) == thumbnail_path
+    # the small image is not decoded again
+    assert cache.get_path(small_path) == small_path.resolve()
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert cache.hit_rate == 1
+
+
+def test_downscale_rotated_image(tmp_path: Path, image_max_size: int):
+    image_module = pytest.importorskip("PIL.Image")
+    image_path = tmp_path / "camera.jpg"
+    image = image_module.new("RGB", (400, 300), "red")
+    exif = image.getexif()
+    # the camera was rotated by 90 degrees
+    exif[0x0112] = 6
+    image.save(image_path, exif=exif)
+
+    with image_module.open(ThumbnailCache().get_path(image_path)) as thumbnail:
+        assert thumbnail.size == (image_max_size * 3 // 4, image_max_size)
+
+
+def test_original_image_without_downscaling(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    image_max_size: int,  # noqa: ARG001
+):
+    image_path = tmp_path / "image.gif"
+    image_path.write_bytes(b"GIF89a")
+    with pytest.raises(FileNotFoundError):
+        ThumbnailCache().get_path(tmp_path / "missing.png")
+
+    monkeypatch.setattr(ConfigManager().config.database, "image_max_size", 0)
+    SingletonMeta._instances.pop(ThumbnailCache, None)  # noqa: SLF001
+    cache = ThumbnailCache()
+    assert cache.get_path(image_path) == image_path.resolve()
+    assert cache.hit_rate == 0